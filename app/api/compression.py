@@ -0,0 +1,181 @@
+"""응답 압축 (Brotli/gzip)
+
+- CompressionMiddleware: Accept-Encoding 협상 후 COMPRESS_MIN_SIZE 이상인 JSON/텍스트 응답을 압축
+  (한 번에 보내는 응답만 대상, 이미 Content-Encoding이 있는 응답은 그대로)
+- PrecompressedStaticFiles: 빌드 때 만든 .br/.gz 파일이 있으면 그 파일을 Content-Encoding과 함께 응답
+  (scripts/precompress_static.py)
+
+brotli 패키지가 없으면 gzip만 사용.
+"""
+import gzip
+import mimetypes
+import os
+from typing import List, Optional, Tuple
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.responses import FileResponse
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # 선택 의존성
+    brotli = None
+
+
+# 이보다 작은 응답은 압축하지 않음 (바이트)
+COMPRESS_MIN_SIZE = int(os.getenv("COMPRESS_MIN_SIZE", "1024"))
+
+# 요청마다 압축할 때의 수준 (빌드 시 미리 압축은 최대 수준)
+BROTLI_QUALITY = int(os.getenv("BROTLI_QUALITY", "4"))
+GZIP_LEVEL = int(os.getenv("GZIP_LEVEL", "6"))
+
+# 압축할 Content-Type (앞부분 일치)
+COMPRESSIBLE_TYPES = (
+    "application/json", "application/javascript", "text/", "image/svg+xml",
+)
+
+# 서버 선호 순서 (q 값이 같으면 앞쪽)
+ENCODINGS = ("br", "gzip") if brotli is not None else ("gzip",)
+
+# 인코딩 → 미리 압축된 파일 확장자
+SUFFIXES = {"br": ".br", "gzip": ".gz"}
+
+
+def negotiate(accept_encoding: Optional[str], available=ENCODINGS) -> Optional[str]:
+    """Accept-Encoding 헤더에서 사용할 인코딩 (q 값 최대, 같으면 available 순서, 없으면 None)"""
+    if not accept_encoding:
+        return None
+
+    weights = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        weights[name.strip().lower()] = q
+
+    best, best_q = None, 0.0
+    for encoding in available:
+        q = weights.get(encoding, weights.get("*", 0.0))
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
+
+
+def _add_vary(headers: MutableHeaders):
+    vary = headers.get("vary")
+    if not vary:
+        headers["Vary"] = "Accept-Encoding"
+    elif "accept-encoding" not in vary.lower():
+        headers["Vary"] = f"{vary}, Accept-Encoding"
+
+
+class CompressionMiddleware:
+    """API 응답 Brotli/gzip 압축 (ASGI 미들웨어)"""
+
+    def __init__(self, app: ASGIApp, minimum_size: int = COMPRESS_MIN_SIZE):
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate(Headers(scope=scope).get("accept-encoding"))
+        start: Optional[Message] = None
+        passthrough = False
+
+        async def send_wrapper(message: Message):
+            nonlocal start, passthrough
+            if passthrough:
+                await send(message)
+                return
+
+            if message["type"] == "http.response.start":
+                start = message
+                return
+
+            headers = MutableHeaders(raw=start["headers"])
+            content_type = headers.get("content-type", "")
+            compressible = (
+                start["status"] == 200
+                and "content-encoding" not in headers
+                and content_type.startswith(COMPRESSIBLE_TYPES)
+            )
+            if compressible:
+                _add_vary(headers)
+
+            body = message.get("body", b"")
+            if (
+                not compressible or encoding is None or message.get("more_body", False)
+                or len(body) < self.minimum_size
+            ):
+                # 스트리밍 응답이나 작은 응답은 그대로
+                passthrough = True
+                await send(start)
+                await send(message)
+                return
+
+            body = compress(body, encoding)
+            headers["Content-Encoding"] = encoding
+            headers["Content-Length"] = str(len(body))
+            etag = headers.get("etag")
+            if etag and not etag.startswith("W/"):
+                headers["ETag"] = f"W/{etag}"
+            await send(start)
+            await send({"type": "http.response.body", "body": body})
+
+        await self.app(scope, receive, send_wrapper)
+
+
+class PrecompressedStaticFiles(StaticFiles):
+    """원본 옆의 .br/.gz 파일(원본보다 새것)이 있으면 협상해서 그 파일로 응답"""
+
+    def file_response(self, full_path, stat_result, scope: Scope, status_code: int = 200):
+        request_headers = Headers(scope=scope)
+        available = self._variants(str(full_path), stat_result)
+        encoding = negotiate(request_headers.get("accept-encoding"), [enc for enc, _, _ in available])
+        if encoding is None:
+            response = super().file_response(full_path, stat_result, scope, status_code)
+            if available:
+                _add_vary(response.headers)
+            return response
+
+        _, path, compressed_stat = next(v for v in available if v[0] == encoding)
+        response = FileResponse(
+            path,
+            status_code=status_code,
+            stat_result=compressed_stat,
+            media_type=mimetypes.guess_type(str(full_path))[0] or "text/plain",
+            headers={"Content-Encoding": encoding},
+        )
+        _add_vary(response.headers)
+        if self.is_not_modified(response.headers, request_headers):
+            return NotModifiedResponse(response.headers)
+        return response
+
+    @staticmethod
+    def _variants(full_path: str, stat_result: os.stat_result) -> List[Tuple[str, str, os.stat_result]]:
+        """사용 가능한 (인코딩, 경로, stat) 목록 (서버 선호 순서)"""
+        variants = []
+        for encoding in ENCODINGS:
+            path = full_path + SUFFIXES[encoding]
+            try:
+                compressed_stat = os.stat(path)
+            except OSError:
+                continue
+            if compressed_stat.st_mtime >= stat_result.st_mtime:
+                variants.append((encoding, path, compressed_stat))
+        return variants
@@ -0,0 +1,78 @@
+from fastapi import HTTPException, Request, Response
+
+from app.services.data_version import data_version
+from app.services.snapshot import snapshot_store
+
+
+def data_etag() -> str:
+    """현재 데이터 버전 기반 ETag (압축 등으로 바이트가 달라질 수 있어 weak)
+
+    스냅샷 모드에서는 응답을 만드는 스냅샷의 버전 (DB를 읽지 않음).
+    """
+    return f'W/"{serving_version()}"'
+
+
+def serving_version() -> str:
+    """응답 데이터의 버전"""
+    if snapshot_store.enabled:
+        return snapshot_store.current().version
+    return data_version.current()
+
+
+def is_not_modified(request: Request, etag: str) -> bool:
+    """If-None-Match 헤더가 etag와 일치하는지 (weak 비교)"""
+    if_none_match = request.headers.get("if-none-match")
+    return bool(if_none_match) and _etag_matches(if_none_match, etag)
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag[2:] if etag.startswith("W/") else etag
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == opaque:
+            return True
+    return False
+
+
+def conditional_get(request: Request, response: Response):
+    """데이터 버전 ETag 기반 조건부 GET
+
+    라우트의 dependencies로 등록하면 DB 세션보다 먼저 실행된다.
+    If-None-Match가 현재 ETag와 같으면 DB 조회/직렬화 없이 304 응답.
+    """
+    _check(request, response, data_etag())
+
+
+def index_conditional_get(index, with_data: bool = False):
+    """메모리 인덱스(spatial_index, autocomplete_index)로 응답하는 라우트의 conditional_get
+
+    ETag는 인덱스가 만들어진 버전 기준: 데이터 버전이 바뀌었어도 재구축이 끝나기 전에는
+    이전 ETag를 유지하므로, 이전 인덱스 결과가 새 ETag로 캐시되지 않는다.
+    with_data: 인덱스 후보의 행을 DB에서 읽는 라우트 → 데이터 버전도 함께
+    (스냅샷 모드에서는 스냅샷이 자체 인덱스를 가지므로 스냅샷 버전만)
+    """
+    def dependency(request: Request, response: Response):
+        if with_data and snapshot_store.enabled:
+            version = serving_version()
+        elif index.version is None:
+            return
+        elif with_data:
+            version = f"{data_version.current()}.{index.version}"
+        else:
+            version = index.version
+        _check(request, response, f'W/"{version}"')
+
+    return dependency
+
+
+def _check(request: Request, response: Response, etag: str):
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+
+    if is_not_modified(request, etag):
+        raise HTTPException(status_code=304, headers=headers)
+
+    response.headers.update(headers)
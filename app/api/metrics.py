@@ -0,0 +1,147 @@
+"""라우트별 요청 지표 + Prometheus 텍스트 형식 출력 (/metrics)
+
+라우트 템플릿(/api/pools/{pool_id}) 단위로 요청 수(상태 코드별), 지연 시간 히스토그램,
+응답 크기 히스토그램을 모은다. 외부 의존성 없이 직접 집계.
+
+- 버킷 배열은 라우트가 처음 보일 때 한 번 만들고 이후에는 정수 증가만 함
+- ASGI 미들웨어는 이벤트 루프 스레드에서만 실행되므로 잠금 없이 갱신해도 안전
+- 매칭되지 않은 경로(404)는 "unmatched" 하나로 묶어 라벨 수가 늘지 않게 함
+"""
+import bisect
+import time
+from typing import Dict, List, Tuple
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+# 지연 시간 버킷 (초)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# 응답 크기 버킷 (바이트)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+UNMATCHED = "unmatched"
+
+
+class Histogram:
+    """고정 버킷 히스토그램 (버킷별 개수는 누적 전 값, 마지막 칸은 +Inf)"""
+
+    __slots__ = ("bounds", "counts", "total")
+
+    def __init__(self, bounds: Tuple[float, ...]):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.total = 0.0
+
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.total += value
+
+
+class RouteStats:
+    __slots__ = ("latency", "size", "statuses")
+
+    def __init__(self):
+        self.latency = Histogram(LATENCY_BUCKETS)
+        self.size = Histogram(SIZE_BUCKETS)
+        self.statuses: Dict[int, int] = {}
+
+
+class MetricsRegistry:
+    """(method, 라우트 템플릿) → RouteStats"""
+
+    def __init__(self):
+        self.routes: Dict[Tuple[str, str], RouteStats] = {}
+
+    def observe(self, method: str, route: str, status: int, seconds: float, size: int):
+        stats = self.routes.get((method, route))
+        if stats is None:
+            stats = self.routes[(method, route)] = RouteStats()
+        stats.latency.observe(seconds)
+        stats.size.observe(size)
+        stats.statuses[status] = stats.statuses.get(status, 0) + 1
+
+    def render(self) -> str:
+        """Prometheus 텍스트 형식 (version 0.0.4)"""
+        routes = sorted(self.routes.items())
+        lines = [
+            "# HELP http_requests_total 요청 수 (라우트, 상태 코드별)",
+            "# TYPE http_requests_total counter",
+        ]
+        for (method, route), stats in routes:
+            for status, count in sorted(stats.statuses.items()):
+                lines.append(
+                    f'http_requests_total{{method="{method}",route="{_escape(route)}",status="{status}"}} {count}'
+                )
+
+        for name, help_text, attr in (
+            ("http_request_duration_seconds", "요청 처리 시간 (초)", "latency"),
+            ("http_response_size_bytes", "응답 본문 크기 (바이트, 압축 후)", "size"),
+        ):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} histogram")
+            for (method, route), stats in routes:
+                lines.extend(_histogram_lines(name, f'method="{method}",route="{_escape(route)}"', getattr(stats, attr)))
+
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _histogram_lines(name: str, labels: str, histogram: Histogram) -> List[str]:
+    lines = []
+    cumulative = 0
+    for bound, count in zip((*histogram.bounds, "+Inf"), histogram.counts):
+        cumulative += count
+        lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {cumulative}')
+    lines.append(f"{name}_sum{{{labels}}} {histogram.total}")
+    lines.append(f"{name}_count{{{labels}}} {cumulative}")
+    return lines
+
+
+def route_label(scope: Scope) -> str:
+    """요청이 매칭된 라우트 템플릿 (정적 파일 마운트는 "/css/{path}")"""
+    route = scope.get("route")
+    if route is not None:
+        return route.path
+    if scope.get("root_path"):
+        return scope["root_path"] + "/{path}"
+    return UNMATCHED
+
+
+class MetricsMiddleware:
+    """요청마다 지연 시간/응답 크기/상태 코드 기록 (가장 바깥에 등록 → 압축 후 크기)"""
+
+    def __init__(self, app: ASGIApp, registry: "MetricsRegistry" = None):
+        self.app = app
+        self.registry = registry or metrics_registry
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status = 500
+        size = 0
+
+        async def send_wrapper(message: Message):
+            nonlocal status, size
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            self.registry.observe(
+                scope["method"], route_label(scope), status, time.perf_counter() - started, size
+            )
+
+
+# 앱 전역 인스턴스
+metrics_registry = MetricsRegistry()
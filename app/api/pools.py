@@ -1,14 +1,34 @@
-from fastapi import APIRouter, Depends, HTTPException, Query, Path
+from fastapi import APIRouter, Depends, HTTPException, Query, Path, Request, Response
+import orjson
 from sqlalchemy.orm import Session
 from typing import List, Optional
+import math
+from app.api.conditional import conditional_get, index_conditional_get, is_not_modified, serving_version
+from app.api.projection import (
+    parse_fields, column_fields, projected_response, distance_response, encode_pool, json_response,
+)
 from app.crud import swimming_pool as crud
-from app.schemas.swimming_pool import SwimmingPoolResponse, SwimmingPoolCreate, SwimmingPoolSearch
-from database.connection import get_db
+from app.crud import swimming_pool_async as crud_async
+from app.schemas.swimming_pool import SwimmingPoolResponse, SwimmingPoolCreate, SwimmingPoolSearch, NearbyBatchRequest
+from app.services import markers
+from app.services.autocomplete import TOP_K, autocomplete_index
+from app.services.clusters import cluster_cache, CLUSTER_MAX_ZOOM, MAX_BBOX_POOLS
+from app.services.snapshot import snapshot_store
+from app.services.spatial_index import spatial_index
+from app.services.stations import STATION_RADIUS_M
+from database.connection import get_db, get_read_db, get_readonly_db
 
 router = APIRouter(prefix="/pools", tags=["pools"])
 
-@router.get("/", response_model=List[SwimmingPoolResponse])
-def get_pools(
+# 공간 인덱스로 후보를 찾는 라우트: ETag에 인덱스 버전 포함 (재구축 전 결과를 새 ETag로 보내지 않음)
+spatial_conditional_get = index_conditional_get(spatial_index, with_data=True)
+
+# /nearby/batch 한 요청의 최대 기준점 수
+MAX_BATCH_ORIGINS = 5000
+
+@router.get("/", response_model=List[SwimmingPoolResponse], dependencies=[Depends(conditional_get)])
+async def get_pools(
+    response: Response,
     skip: int = 0,
     limit: int = 1000,
     source: Optional[str] = None,
@@ -17,46 +37,126 @@ def get_pools(
     max_price: Optional[int] = None,
     day: Optional[str] = Query(None, description="요일 필터 (월~일)"),
     time: Optional[str] = Query(None, description="시간 필터 (HH:MM)"),
-    db: Session = Depends(get_db)
+    near_line: Optional[str] = Query(None, description="지하철 호선 필터 (예: 2)"),
+    max_station_m: Optional[int] = Query(None, ge=1, le=STATION_RADIUS_M, description="지하철역까지 최대 거리 (m)"),
+    sort: Optional[str] = Query(None, description="정렬 (price/name)"),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (이전 응답의 X-Next-Cursor)"),
+    fields: Optional[str] = Query(None, description="필드 선택 (예: id,name,lat,lng)"),
+    db=Depends(get_read_db)
 ):
-    """모든 수영장 조회"""
-    pools = crud.get_swimming_pools(
-        db,
-        skip=skip,
-        limit=limit,
+    """모든 수영장 조회
+
+    페이지가 가득 차면 X-Next-Cursor 헤더로 다음 페이지 커서를 내려준다.
+      ?limit=100 → ?limit=100&cursor=<X-Next-Cursor>
+
+    fields를 지정하면 해당 컬럼만 로드해서 내려준다 (지도 마커용 등).
+      ?fields=id,name,lat,lng
+    """
+    selected = parse_fields(fields)
+    after = None
+    if cursor:
+        try:
+            after = crud.decode_cursor(cursor, sort)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="잘못된 커서입니다")
+
+    filters = dict(
         source=source,
         has_free_swim=has_free_swim,
         min_price=min_price,
         max_price=max_price,
         day=day,
         time=time,
+        near_line=near_line,
+        max_station_m=max_station_m,
     )
-    return pools
+    if snapshot_store.enabled:
+        pools = snapshot_store.current().list_pools(skip=skip, limit=limit, sort=sort, after=after, **filters)
+    else:
+        pools = await crud_async.get_swimming_pools(
+            db, skip=skip, limit=limit, sort=sort, after=after, columns=column_fields(selected), **filters
+        )
+
+    if limit > 0 and len(pools) == limit:
+        response.headers["X-Next-Cursor"] = crud.encode_cursor(pools[-1], sort)
+
+    return projected_response(pools, selected, response)
 
 @router.post("/", response_model=SwimmingPoolResponse)
 def create_pool(pool: SwimmingPoolCreate, db: Session = Depends(get_db)):
     """수영장 등록"""
     return crud.create_swimming_pool(db=db, pool=pool)
 
+@router.get("/search", response_model=List[SwimmingPoolResponse], dependencies=[Depends(conditional_get)])
+async def search_pools_by_text(
+    response: Response,
+    q: str = Query(..., min_length=1, max_length=100, description="검색어 (이름/주소/비고)"),
+    limit: int = Query(20, ge=1, le=100, description="최대 개수"),
+    fields: Optional[str] = Query(None, description="필드 선택 (예: id,name,lat,lng)"),
+    db=Depends(get_read_db)
+):
+    """이름/주소/비고 텍스트 검색 (관련도순)
+
+    공백으로 구분한 단어를 모두 포함하는 곳. 이름 일치가 주소/비고 일치보다 앞선다.
+      ?q=올림픽 수영장
+      ?q=강남&fields=id,name,address
+    """
+    selected = parse_fields(fields)
+    if snapshot_store.enabled:
+        pools = snapshot_store.current().search_text(q.strip(), limit=limit)
+    else:
+        pools = await crud_async.search_pools_by_text(db, q.strip(), limit=limit, columns=column_fields(selected))
+    return projected_response(pools, selected, response)
+
+# trie만으로 응답 → ETag는 trie가 만들어진 버전 (재구축이 가장 오래 걸려 데이터 버전과 가장 오래 어긋남)
+@router.get("/autocomplete", dependencies=[Depends(index_conditional_get(autocomplete_index))])
+def autocomplete_pools(
+    q: str = Query(..., min_length=1, max_length=50, description="검색어 (초성 가능, 예: ㅇㄹㅍ)"),
+    limit: int = Query(10, ge=1, le=TOP_K, description="최대 개수"),
+):
+    """검색창 자동완성 (이름/초성/구 이름 접두사, 메모리 trie)
+
+    [{"type": "pool", "id", "name", "address", "match": "name|word"},
+     {"type": "district", "name": "송파구", "count": 12}, ...]
+    """
+    return autocomplete_index.suggest(q, limit)
+
 @router.post("/search", response_model=List[SwimmingPoolResponse])
-def search_pools(search: SwimmingPoolSearch, db: Session = Depends(get_db)):
+async def search_pools(
+    search: SwimmingPoolSearch,
+    response: Response,
+    fields: Optional[str] = Query(None, description="필드 선택 (예: id,name,lat,lng)"),
+    db=Depends(get_read_db)
+):
     """위치 기반 수영장 검색 (POST)"""
-    pools = crud.search_nearby_pools(
-        db=db,
-        lat=search.lat,
-        lng=search.lng,
-        radius_km=search.radius_km,
+    selected = parse_fields(fields, extra=["distance"])
+    filters = dict(
         min_price=search.min_price,
         max_price=search.max_price,
         has_free_swim=search.has_free_swim,
         day=search.day,
         time=search.time,
+        near_line=search.near_line,
+        max_station_m=search.max_station_m,
+    )
+    if snapshot_store.enabled:
+        results = snapshot_store.current().nearby(search.lat, search.lng, search.radius_km, **filters)
+        return distance_response(results, selected, response)
+
+    pools = await crud_async.search_nearby_pools(
+        db=db,
+        lat=search.lat,
+        lng=search.lng,
+        radius_km=search.radius_km,
+        columns=column_fields(selected),
+        **filters,
     )
-    return pools
+    return projected_response(pools, selected, response)
 
 
-@router.get("/nearby", response_model=List[SwimmingPoolResponse])
-def get_nearby_pools(
+@router.get("/nearby", response_model=List[SwimmingPoolResponse], dependencies=[Depends(spatial_conditional_get)])
+async def get_nearby_pools(
+    response: Response,
     lat: float = Query(..., description="위도"),
     lng: float = Query(..., description="경도"),
     radius: float = Query(5.0, ge=0.1, le=50.0, description="검색 반경 (km)"),
@@ -65,44 +165,274 @@ def get_nearby_pools(
     has_free_swim: Optional[bool] = Query(None, description="자유수영 시간표 보유 여부"),
     day: Optional[str] = Query(None, description="요일 필터 (월~일)"),
     time: Optional[str] = Query(None, description="시간 필터 (HH:MM)"),
+    near_line: Optional[str] = Query(None, description="지하철 호선 필터 (예: 2)"),
+    max_station_m: Optional[int] = Query(None, ge=1, le=STATION_RADIUS_M, description="지하철역까지 최대 거리 (m)"),
     sort: Optional[str] = Query(None, description="정렬 (price/distance)"),
-    db: Session = Depends(get_db)
+    fields: Optional[str] = Query(None, description="필드 선택 (예: id,name,lat,lng) (distance 포함 가능)"),
+    db=Depends(get_read_db)
 ):
     """쿼리 파라미터 기반 위치 검색 (프론트엔드용)
 
     필터 예시:
       ?lat=37.5&lng=126.9&radius=5&day=토&max_price=5000&sort=price
+      ?lat=37.5&lng=126.9&fields=id,name,lat,lng,distance
     """
-    pools = crud.search_nearby_pools(
-        db=db,
-        lat=lat,
-        lng=lng,
-        radius_km=radius,
+    selected = parse_fields(fields, extra=["distance"])
+    filters = dict(
         min_price=min_price,
         max_price=max_price,
         has_free_swim=has_free_swim,
         day=day,
         time=time,
-        sort=sort,
+        near_line=near_line,
+        max_station_m=max_station_m,
+    )
+    if snapshot_store.enabled:
+        results = snapshot_store.current().nearby(lat, lng, radius, sort=sort, **filters)
+        return distance_response(results, selected, response)
+
+    pools = await crud_async.search_nearby_pools(
+        db=db, lat=lat, lng=lng, radius_km=radius, sort=sort, columns=column_fields(selected), **filters
     )
+    return projected_response(pools, selected, response)
+
+
+@router.post("/nearby/batch")
+def search_nearby_batch(
+    batch: NearbyBatchRequest,
+    fields: Optional[str] = Query(None, description="필드 선택 (예: id,name,lat,lng) (distance 포함 가능)"),
+    db: Session = Depends(get_readonly_db)
+):
+    """여러 기준점의 위치 검색을 한 번에 (역/사무실별 주변 수영장 등 일괄 작업용)
+
+    기준점마다 /nearby(거리순)와 같은 결과를 origins 순서대로 돌려준다.
+      {"results": [{"key": "강남역", "count": 3, "pools": [{..., "distance": 0.42}, ...]}, ...]}
+    """
+    if len(batch.origins) > MAX_BATCH_ORIGINS:
+        raise HTTPException(status_code=400, detail=f"기준점은 최대 {MAX_BATCH_ORIGINS}개까지 가능합니다")
+    if any(not 0.1 <= origin.radius_km <= 50.0 for origin in batch.origins):
+        raise HTTPException(status_code=400, detail="radius_km는 0.1 ~ 50 사이여야 합니다")
 
-    # 시간 필터 후처리 (SQL에서 처리 불가한 시간 범위 비교)
-    if time and day:
-        pools = [
-            p for p in pools
-            if crud.is_time_in_schedule(p.free_swim_schedule, day, time)
+    selected = parse_fields(fields, extra=["distance"])
+    if snapshot_store.enabled:
+        snapshot = snapshot_store.current()
+        results = [
+            snapshot.nearby(
+                origin.lat, origin.lng, origin.radius_km,
+                min_price=origin.min_price, max_price=origin.max_price, has_free_swim=origin.has_free_swim,
+                day=origin.day, time=origin.time, near_line=origin.near_line, max_station_m=origin.max_station_m,
+            )
+            for origin in batch.origins
         ]
+    else:
+        results = crud.search_nearby_batch(db, batch.origins, columns=column_fields(selected))
+
+    columns = [name for name in selected if name != "distance"] if selected else None
+    with_distance = not selected or "distance" in selected
+
+    # 같은 수영장이 여러 기준점에 나와도 직렬화는 한 번만 (거리만 덧붙임)
+    encoded = {}
+
+    def encode(pool, distance) -> bytes:
+        fragment = encoded.get(pool.id)
+        if fragment is None:
+            fragment = encoded[pool.id] = encode_pool(pool, columns)
+        if with_distance:
+            return fragment[:-1] + b',"distance":' + orjson.dumps(distance) + b"}"
+        return fragment
+
+    groups = [
+        b'{"key":' + orjson.dumps(origin.key) + b',"count":' + str(len(result)).encode()
+        + b',"pools":[' + b",".join(encode(pool, distance) for pool, distance in result) + b"]}"
+        for origin, result in zip(batch.origins, results)
+    ]
+    return json_response(b'{"results":[' + b",".join(groups) + b"]}")
+
+
+@router.get("/nearest", response_model=List[SwimmingPoolResponse], dependencies=[Depends(spatial_conditional_get)])
+def get_nearest_pools(
+    response: Response,
+    lat: float = Query(..., ge=-90, le=90, description="위도"),
+    lng: float = Query(..., ge=-180, le=180, description="경도"),
+    k: int = Query(10, ge=1, le=100, description="개수"),
+    min_price: Optional[int] = Query(None, description="최소 가격 (자유수영 성인 평일)"),
+    max_price: Optional[int] = Query(None, description="최대 가격 (자유수영 성인 평일)"),
+    has_free_swim: Optional[bool] = Query(None, description="자유수영 시간표 보유 여부"),
+    day: Optional[str] = Query(None, description="요일 필터 (월~일)"),
+    time: Optional[str] = Query(None, description="시간 필터 (HH:MM)"),
+    near_line: Optional[str] = Query(None, description="지하철 호선 필터 (예: 2)"),
+    max_station_m: Optional[int] = Query(None, ge=1, le=STATION_RADIUS_M, description="지하철역까지 최대 거리 (m)"),
+    fields: Optional[str] = Query(None, description="필드 선택 (예: id,name,lat,lng) (distance 포함 가능)"),
+    db: Session = Depends(get_readonly_db)
+):
+    """가장 가까운 수영장 k개 (반경 제한 없음, 거리순)
+
+    주변에 수영장이 없는 지역에서도 결과가 비지 않도록 반경 대신 개수로 찾는다.
+      ?lat=37.5&lng=126.9&k=10&day=토&max_price=5000
+    """
+    selected = parse_fields(fields, extra=["distance"])
+    filters = dict(
+        min_price=min_price,
+        max_price=max_price,
+        has_free_swim=has_free_swim,
+        day=day,
+        time=time,
+        near_line=near_line,
+        max_station_m=max_station_m,
+    )
+    if snapshot_store.enabled:
+        return distance_response(snapshot_store.current().nearest(lat, lng, k, **filters), selected, response)
+
+    pools = crud.find_nearest_pools(db=db, lat=lat, lng=lng, k=k, columns=column_fields(selected), **filters)
+    return projected_response(pools, selected, response)
+
+
+@router.get("/markers")
+def get_markers(
+    request: Request,
+    day: Optional[str] = Query(None, description="요일 (월~일, 기본: 오늘)"),
+    db: Session = Depends(get_readonly_db)
+):
+    """지도 마커용 컬럼형 데이터 (전체 활성 수영장)
+
+    {"version": ..., "day": "토", "ids": [...], "names": [...], "lats": [...],
+     "lngs": [...], "prices": [...], "free_swim": [0, 1, ...]}
+
+    i번째 수영장 = 각 배열의 i번째 값. 데이터 버전/요일별로 메모리에 캐시된 바이트를 그대로 응답.
+    """
+    day = day or markers.today()
+    if day not in markers.WEEKDAYS:
+        raise HTTPException(status_code=400, detail="요일은 월~일 중 하나여야 합니다")
+
+    version = serving_version()
+    headers = {
+        "ETag": f'W/"{version}-d{markers.WEEKDAYS.index(day)}"',
+        "Cache-Control": "no-cache",
+    }
+    if is_not_modified(request, headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+
+    if snapshot_store.enabled:
+        payload = snapshot_store.current().markers(day)
+    else:
+        payload = markers.marker_cache.get(db, version, day)
+    return Response(payload, media_type="application/json", headers=headers)
+
+
+@router.get("/clusters", dependencies=[Depends(conditional_get)])
+def get_clusters(
+    bbox: str = Query(..., description="south,west,north,east"),
+    zoom: int = Query(..., ge=0, le=22, description="지도 줌 레벨"),
+    db: Session = Depends(get_readonly_db)
+):
+    """지도 화면(bbox)과 줌 레벨에 맞춘 수영장 클러스터
+
+    zoom < CLUSTER_MAX_ZOOM: {"clusters": [{"count", "lat", "lng", "min_price"}], "pools": []}
+    zoom >= CLUSTER_MAX_ZOOM: {"clusters": [], "pools": [{"id", "name", "lat", "lng", "price"}]}
+      (bbox 안이 MAX_BBOX_POOLS개를 넘으면 개수가 MAX_BBOX_POOLS 이하인 가장 세밀한 레벨의 클러스터)
+    """
+    south, west, north, east = _parse_bbox(bbox)
+    if snapshot_store.enabled:
+        index = snapshot_store.current().clusters
+    else:
+        index = cluster_cache.get(db, serving_version())
+
+    if zoom >= CLUSTER_MAX_ZOOM:
+        pools = index.pools_in(south, west, north, east, limit=MAX_BBOX_POOLS)
+        if pools is not None:
+            return {"zoom": zoom, "clusters": [], "pools": pools}
+        # 너무 넓은 bbox: 클러스터 수가 MAX_BBOX_POOLS 이하가 되는 가장 세밀한 레벨
+        for level in range(CLUSTER_MAX_ZOOM - 1, -1, -1):
+            clusters = index.clusters(south, west, north, east, level)
+            if len(clusters) <= MAX_BBOX_POOLS:
+                break
+        return {"zoom": zoom, "clusters": clusters, "pools": []}
+    return {"zoom": zoom, "clusters": index.clusters(south, west, north, east, zoom), "pools": []}
+
+
+def _parse_bbox(bbox: str):
+    """bbox 문자열 south,west,north,east → 4개 float (형식/범위가 잘못되면 400)"""
+    try:
+        south, west, north, east = (float(v) for v in bbox.split(","))
+    except ValueError:
+        raise HTTPException(status_code=400, detail="bbox는 south,west,north,east 형식이어야 합니다")
+    if not all(math.isfinite(v) for v in (south, west, north, east)):
+        raise HTTPException(status_code=400, detail="bbox 값은 유한한 숫자여야 합니다")
+    if not (-90 <= south <= 90 and -90 <= north <= 90 and -180 <= west <= 180 and -180 <= east <= 180):
+        raise HTTPException(status_code=400, detail="bbox 위도는 -90~90, 경도는 -180~180 이어야 합니다")
+    if south > north or west > east:
+        raise HTTPException(status_code=400, detail="bbox 범위가 올바르지 않습니다")
+    return south, west, north, east
+
+
+@router.get("/in-bounds", response_model=List[SwimmingPoolResponse], dependencies=[Depends(conditional_get)])
+def get_pools_in_bounds(
+    response: Response,
+    south: float = Query(..., ge=-90, le=90, description="남쪽 위도"),
+    west: float = Query(..., ge=-180, le=180, description="서쪽 경도"),
+    north: float = Query(..., ge=-90, le=90, description="북쪽 위도"),
+    east: float = Query(..., ge=-180, le=180, description="동쪽 경도"),
+    limit: int = Query(500, ge=1, le=5000, description="최대 개수"),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (이전 응답의 X-Next-Cursor)"),
+    min_price: Optional[int] = Query(None, description="최소 가격 (자유수영 성인 평일)"),
+    max_price: Optional[int] = Query(None, description="최대 가격 (자유수영 성인 평일)"),
+    has_free_swim: Optional[bool] = Query(None, description="자유수영 시간표 보유 여부"),
+    day: Optional[str] = Query(None, description="요일 필터 (월~일)"),
+    time: Optional[str] = Query(None, description="시간 필터 (HH:MM)"),
+    near_line: Optional[str] = Query(None, description="지하철 호선 필터 (예: 2)"),
+    max_station_m: Optional[int] = Query(None, ge=1, le=STATION_RADIUS_M, description="지하철역까지 최대 거리 (m)"),
+    fields: Optional[str] = Query(None, description="필드 선택 (예: id,name,lat,lng)"),
+    db: Session = Depends(get_readonly_db)
+):
+    """지도 화면(bbox) 안의 수영장 (ID순)
+
+    limit개가 가득 차면 X-Next-Cursor 헤더로 다음 페이지 커서를 내려준다.
+    """
+    if south > north or west > east:
+        raise HTTPException(status_code=400, detail="south <= north, west <= east 이어야 합니다")
+
+    selected = parse_fields(fields)
+    after = None
+    if cursor:
+        try:
+            after = crud.decode_cursor(cursor, None)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="잘못된 커서입니다")
+
+    filters = dict(
+        has_free_swim=has_free_swim,
+        min_price=min_price,
+        max_price=max_price,
+        day=day,
+        time=time,
+        near_line=near_line,
+        max_station_m=max_station_m,
+    )
+    if snapshot_store.enabled:
+        pools = snapshot_store.current().in_bounds(south, west, north, east, limit=limit, after=after, **filters)
+    else:
+        pools = crud.get_pools_in_bounds(
+            db, south=south, west=west, north=north, east=east, limit=limit, after=after,
+            columns=column_fields(selected), **filters
+        )
+
+    if len(pools) == limit:
+        response.headers["X-Next-Cursor"] = crud.encode_cursor(pools[-1], None)
 
-    return pools
+    return projected_response(pools, selected, response)
 
 
-@router.get("/{pool_id}", response_model=SwimmingPoolResponse)
-def get_pool(
-    pool_id: int = Path(..., pattern=r"^\d+$", description="수영장 ID"),
-    db: Session = Depends(get_db)
+@router.get("/{pool_id}", response_model=SwimmingPoolResponse, dependencies=[Depends(conditional_get)])
+async def get_pool(
+    response: Response,
+    pool_id: int = Path(..., description="수영장 ID"),
+    db=Depends(get_read_db)
 ):
     """특정 수영장 조회"""
-    pool = crud.get_swimming_pool(db, pool_id=pool_id)
+    if snapshot_store.enabled:
+        pool = snapshot_store.current().get(pool_id)
+    else:
+        pool = await crud_async.get_swimming_pool(db, pool_id=pool_id)
     if pool is None:
         raise HTTPException(status_code=404, detail="수영장을 찾을 수 없습니다")
-    return pool
+    return json_response(encode_pool(pool), response)
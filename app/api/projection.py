@@ -0,0 +1,124 @@
+"""수영장 응답 직렬화 (fields= 선택 + ORM → JSON 바이트 직접 변환)
+
+response_model 경로는 행마다 Pydantic 검증 후 다시 직렬화하므로 목록 응답에서 CPU를 가장 많이 쓴다.
+여기서는 ORM 속성을 그대로 orjson으로 바이트화하고, 전체 필드 응답은 수영장별 조각을
+(id, last_updated, 가장 가까운 역) 기준으로 캐시해서 같은 행은 다시 직렬화하지 않는다.
+출력 JSON은 SwimmingPoolResponse와 같은 필드/순서/형식.
+"""
+from typing import Dict, List, Optional, Sequence
+
+import orjson
+from fastapi import HTTPException, Response
+
+from app.models.swimming_pool import SwimmingPool
+from app.schemas.swimming_pool import SwimmingPoolResponse
+
+
+# fields= 로 선택 가능한 필드 (SwimmingPoolResponse와 동일한 이름)
+POOL_FIELDS = tuple(SwimmingPoolResponse.model_fields)
+
+# 그중 DB 컬럼인 필드 (nearest_station 등은 관계에서 계산)
+COLUMN_FIELDS = frozenset(SwimmingPool.__table__.columns.keys()) & frozenset(POOL_FIELDS)
+
+# 관계를 함께 로드해야 하는 필드 (crud._load_only가 selectinload)
+RELATION_FIELDS = frozenset({"nearest_station"})
+
+# 캐시할 최대 조각 수 (넘으면 비우고 다시 채움)
+MAX_FRAGMENTS = 50_000
+
+_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+def parse_fields(fields: Optional[str], extra: Sequence[str] = ()) -> Optional[List[str]]:
+    """fields=id,name,lat,lng → ["id", "name", "lat", "lng"] (지정하지 않으면 None)
+
+    id는 항상 포함. extra는 컬럼이 아닌 계산 필드 (예: distance).
+    """
+    if not fields:
+        return None
+
+    names = [name.strip() for name in fields.split(",") if name.strip()]
+    allowed = set(POOL_FIELDS) | set(extra)
+    unknown = [name for name in names if name not in allowed]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"알 수 없는 필드: {', '.join(unknown)}")
+
+    return list(dict.fromkeys(["id", *names]))
+
+
+def column_fields(fields: Optional[List[str]]) -> Optional[List[str]]:
+    """DB에서 로드할 컬럼/관계 필드만 추림 (distance 등 계산 필드 제외)"""
+    if fields is None:
+        return None
+    return [name for name in fields if name in COLUMN_FIELDS or name in RELATION_FIELDS]
+
+
+class FragmentCache:
+    """수영장별 전체 필드 JSON 조각 캐시
+
+    키에 last_updated가 들어가므로 수정된 행은 자연히 새 조각을 만든다
+    (API 밖의 sqlite3 직접 쓰기도 트리거가 last_updated를 갱신).
+    """
+
+    def __init__(self, max_size: int = MAX_FRAGMENTS):
+        self.max_size = max_size
+        self._fragments: Dict[tuple, bytes] = {}
+
+    def get(self, pool: SwimmingPool) -> bytes:
+        station = pool.nearest_station
+        key = (pool.id, pool.last_updated, station and tuple(station.values()))
+        fragment = self._fragments.get(key)
+        if fragment is None:
+            fragment = orjson.dumps({name: getattr(pool, name) for name in POOL_FIELDS}, option=_OPTIONS)
+            if len(self._fragments) >= self.max_size:
+                self._fragments.clear()
+            self._fragments[key] = fragment
+        return fragment
+
+    def clear(self):
+        self._fragments.clear()
+
+
+# 앱 전역 인스턴스
+fragment_cache = FragmentCache()
+
+
+def encode_pool(pool, fields: Optional[List[str]] = None, extra: Optional[dict] = None) -> bytes:
+    """수영장 하나 → JSON 객체 바이트
+
+    fields가 없으면 전체 필드(캐시 사용), extra는 뒤에 덧붙일 계산 필드 (예: {"distance": 0.4}).
+    """
+    if fields is not None:
+        item = {name: getattr(pool, name, None) for name in fields}
+        if extra:
+            item.update(extra)
+        return orjson.dumps(item, option=_OPTIONS)
+
+    fragment = fragment_cache.get(pool)
+    if extra:
+        fragment = fragment[:-1] + b"," + orjson.dumps(extra, option=_OPTIONS)[1:]
+    return fragment
+
+
+def json_response(content: bytes, response: Optional[Response] = None) -> Response:
+    """JSON 바이트 응답 (response: 의존성이 설정한 ETag 등 헤더를 옮겨 담음)"""
+    headers = dict(response.headers) if response is not None else None
+    return Response(content, media_type="application/json", headers=headers)
+
+
+def projected_response(pools, fields: Optional[List[str]], response: Response) -> Response:
+    """수영장 목록 응답 (response_model 검증/직렬화 생략)
+
+    fields가 없으면 전체 필드, 있으면 선택한 필드만.
+    """
+    return json_response(b"[" + b",".join(encode_pool(pool, fields) for pool in pools) + b"]", response)
+
+
+def distance_response(results, fields: Optional[List[str]], response: Response) -> Response:
+    """(수영장, 거리) 목록 응답 — fields에 distance가 있으면 그 자리에 거리 값"""
+    if fields is None or "distance" not in fields:
+        return projected_response([pool for pool, _ in results], fields, response)
+    return json_response(
+        b"[" + b",".join(encode_pool(pool, fields, {"distance": d}) for pool, d in results) + b"]",
+        response,
+    )
@@ -0,0 +1,158 @@
+"""SQL 쿼리 계측 - 요청별 쿼리 수/DB 시간/가장 느린 쿼리 + 느린 쿼리 로그
+
+- instrument(engine): before/after_cursor_execute 이벤트로 쿼리마다 실행 시간 측정
+- QueryTimingMiddleware: 요청마다 집계 객체를 contextvar에 넣고 응답에 Server-Timing 헤더 추가
+  (동기 라우트/의존성은 스레드풀에서 실행되지만 contextvar가 복사되므로 같은 객체에 기록)
+- 느린 쿼리 로그: SLOW_QUERY_MS 이상 걸린 쿼리, 쿼리 수(SLOW_REQUEST_QUERIES)나
+  DB 시간(SLOW_REQUEST_DB_MS)이 임계값을 넘은 요청을 정규화된 SQL과 함께 기록
+  (행마다 SELECT를 하는 엑셀 가져오기 같은 N+1 패턴은 가장 많이 반복된 쿼리로 드러남)
+
+요청 밖(시작 시 인덱스 구축, 데이터 버전 스레드의 재구축 등)의 쿼리는 느린 쿼리 로그에만 남는다.
+"""
+import contextvars
+import logging
+import os
+import re
+import time
+from typing import Dict, Optional
+
+from sqlalchemy import event
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+# 임계값 (환경변수, 0이면 해당 로그 끔)
+SLOW_QUERY_MS = float(os.getenv("SLOW_QUERY_MS", "100"))
+SLOW_REQUEST_QUERIES = int(os.getenv("SLOW_REQUEST_QUERIES", "50"))
+SLOW_REQUEST_DB_MS = float(os.getenv("SLOW_REQUEST_DB_MS", "500"))
+
+# 응답에 Server-Timing 헤더를 붙일지
+SERVER_TIMING = os.getenv("SERVER_TIMING", "1").lower() in ("1", "true", "yes")
+
+logger = logging.getLogger("korea_swim.slow_query")
+
+# SLOW_QUERY_LOG=경로 → 파일에도 기록
+if os.getenv("SLOW_QUERY_LOG"):
+    _handler = logging.FileHandler(os.getenv("SLOW_QUERY_LOG"), encoding="utf-8")
+    _handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+    logger.addHandler(_handler)
+    logger.setLevel(logging.WARNING)
+
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PLACEHOLDER_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_ALIAS = re.compile(r"\s+AS\s+\w+", re.IGNORECASE)
+_WHITESPACE = re.compile(r"\s+")
+
+# 로그에 남길 SQL 최대 길이
+MAX_SQL_LENGTH = 500
+
+
+def normalize_sql(sql: str) -> str:
+    """리터럴은 ?, IN (?, ?, ...)은 (...), 컬럼 별칭(AS x) 제거, 공백 정리 → 같은 모양 쿼리는 같은 문자열"""
+    sql = _STRING.sub("?", sql)
+    sql = _NUMBER.sub("?", sql)
+    sql = _PLACEHOLDER_LIST.sub("(...)", sql)
+    sql = _ALIAS.sub("", sql)
+    sql = _WHITESPACE.sub(" ", sql).strip()
+    return sql if len(sql) <= MAX_SQL_LENGTH else sql[:MAX_SQL_LENGTH] + "..."
+
+
+class QueryStats:
+    """한 요청의 쿼리 집계"""
+
+    __slots__ = ("count", "total", "slowest", "slowest_sql", "statements")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.slowest = 0.0
+        self.slowest_sql = ""
+        self.statements: Dict[str, int] = {}
+
+    def record(self, statement: str, seconds: float):
+        self.count += 1
+        self.total += seconds
+        if seconds > self.slowest:
+            self.slowest = seconds
+            self.slowest_sql = statement
+        self.statements[statement] = self.statements.get(statement, 0) + 1
+
+    def most_repeated(self):
+        """(문장, 실행 횟수) - 가장 많이 실행된 문장"""
+        return max(self.statements.items(), key=lambda item: item[1], default=("", 0))
+
+    def server_timing(self) -> str:
+        return (
+            f'db;dur={self.total * 1000:.2f};desc="{self.count} queries", '
+            f"db-slowest;dur={self.slowest * 1000:.2f}"
+        )
+
+
+_current: contextvars.ContextVar[Optional[QueryStats]] = contextvars.ContextVar("query_stats", default=None)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if context is not None:
+        context._query_started = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = getattr(context, "_query_started", None)
+    if started is None:
+        return
+    seconds = time.perf_counter() - started
+
+    stats = _current.get()
+    if stats is not None:
+        stats.record(statement, seconds)
+    if SLOW_QUERY_MS and seconds * 1000 >= SLOW_QUERY_MS:
+        logger.warning("slow query %.1fms: %s", seconds * 1000, normalize_sql(statement))
+
+
+def instrument(bind):
+    """엔진의 모든 쿼리 실행 시간 측정 (동기 엔진, 비동기는 async_engine.sync_engine)"""
+    if not event.contains(bind, "before_cursor_execute", _before_cursor_execute):
+        event.listen(bind, "before_cursor_execute", _before_cursor_execute)
+        event.listen(bind, "after_cursor_execute", _after_cursor_execute)
+
+
+def log_request(method: str, path: str, stats: QueryStats):
+    """쿼리 수나 DB 시간이 임계값을 넘은 요청 기록"""
+    too_many = SLOW_REQUEST_QUERIES and stats.count >= SLOW_REQUEST_QUERIES
+    too_slow = SLOW_REQUEST_DB_MS and stats.total * 1000 >= SLOW_REQUEST_DB_MS
+    if not (too_many or too_slow):
+        return
+    statement, repeated = stats.most_repeated()
+    logger.warning(
+        "slow request %s %s: %d queries, %.1fms DB, slowest %.1fms: %s | most repeated x%d: %s",
+        method, path, stats.count, stats.total * 1000, stats.slowest * 1000,
+        normalize_sql(stats.slowest_sql), repeated, normalize_sql(statement),
+    )
+
+
+class QueryTimingMiddleware:
+    """요청별 쿼리 집계 → Server-Timing 헤더 + 느린 요청 로그"""
+
+    def __init__(self, app: ASGIApp, server_timing: bool = SERVER_TIMING):
+        self.app = app
+        self.server_timing = server_timing
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats()
+        token = _current.set(stats)
+
+        async def send_wrapper(message: Message):
+            if message["type"] == "http.response.start" and self.server_timing and stats.count:
+                MutableHeaders(scope=message).append("Server-Timing", stats.server_timing())
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _current.reset(token)
+            log_request(scope["method"], scope["path"], stats)
@@ -0,0 +1,32 @@
+"""정적 파일 캐시 정책
+
+scripts/fingerprint_static.py가 만든 내용 해시 파일명(styles.1a2b3c4d.css)은 내용이 바뀌면
+이름도 바뀌므로 1년 immutable로 캐시하고, 해시 없는 원본 이름과 HTML은 매번 재검증(no-cache).
+"""
+import os
+import re
+
+from starlette.types import Scope
+
+from app.api.compression import PrecompressedStaticFiles
+
+
+# name.<해시 8자리>.ext
+HASHED_NAME = re.compile(r"\.[0-9a-f]{8}\.[A-Za-z0-9]+$")
+
+IMMUTABLE = "public, max-age=31536000, immutable"
+REVALIDATE = "no-cache"
+
+
+def cache_control_for(path: str) -> str:
+    """파일 경로 → Cache-Control (해시 파일명이면 immutable)"""
+    return IMMUTABLE if HASHED_NAME.search(os.path.basename(path)) else REVALIDATE
+
+
+class StaticAssets(PrecompressedStaticFiles):
+    """미리 압축 + 파일명 기준 Cache-Control"""
+
+    def file_response(self, full_path, stat_result, scope: Scope, status_code: int = 200):
+        response = super().file_response(full_path, stat_result, scope, status_code)
+        response.headers["Cache-Control"] = cache_control_for(str(full_path))
+        return response
@@ -1,14 +1,27 @@
-from sqlalchemy.orm import Session
-from sqlalchemy import text
-from app.models.swimming_pool import SwimmingPool
+from sqlalchemy.orm import Session, load_only, selectinload
+from sqlalchemy import false, select, tuple_
+from app.models.swimming_pool import SwimmingPool, FreeSwimSession, PoolStation
 from app.schemas.swimming_pool import SwimmingPoolCreate
-from typing import List, Optional
+from app.services import distance as distance_engine, fulltext
+from app.services.spatial_index import spatial_index
+from app.services.stations import STATION_RADIUS_M, normalize_line, station_join
+from typing import List, Optional, Sequence, Tuple
+import base64
 import math
 import json
 
+import numpy as np
+
+
+# 공간 인덱스 후보를 IN (...)으로 넘길 최대 개수 (초과 시 bbox 조건으로 조회)
+MAX_IN_IDS = 900
+
+# 일괄 검색 시 한 번에 계산할 거리 행렬 원소 수 (기준점 수 × 후보 수)
+MATRIX_CELLS = 1_000_000
+
 
 def get_swimming_pool(db: Session, pool_id: int):
-    return db.query(SwimmingPool).filter(SwimmingPool.id == pool_id).first()
+    return _load_only(db.query(SwimmingPool), None).filter(SwimmingPool.id == pool_id).first()
 
 
 def get_swimming_pools(
@@ -21,48 +34,170 @@ def get_swimming_pools(
     max_price: Optional[int] = None,
     day: Optional[str] = None,
     time: Optional[str] = None,
+    near_line: Optional[str] = None,
+    max_station_m: Optional[int] = None,
+    sort: Optional[str] = None,
+    after: Optional[dict] = None,
+    columns: Optional[Sequence[str]] = None,
 ):
-    """수영장 목록 조회 (필터링 지원)"""
-    query = db.query(SwimmingPool)
+    """수영장 목록 조회 (필터링 지원)
+
+    정렬:
+      - "price": 자유수영 가격순 (가격 없는 곳은 뒤로)
+      - "name": 이름순
+      - None: ID순 (기본)
+
+    페이지네이션:
+      - after(decode_cursor 결과)가 있거나 skip이 0이면 keyset 방식
+        → 정렬 키 인덱스에서 바로 시작 위치를 찾으므로 페이지 깊이와 무관
+      - skip > 0이면 기존 offset 방식 (하위 호환)
+
+    columns: 지정하면 해당 컬럼만 로드 (나머지는 deferred, 접근하지 않아야 함)
+    """
+    sort_columns = {"price": ["free_swim_adult_weekday_price"], "name": ["name"]}.get(sort, [])
+    query = _load_only(db.query(SwimmingPool), columns, *sort_columns)
 
     if source:
         query = query.filter(SwimmingPool.source == source)
 
+    query = _apply_filters(query, has_free_swim, min_price, max_price, day, time, near_line, max_station_m)
+
+    if after is not None or skip == 0:
+        return _get_page_after(query, sort, after, limit)
+
+    price = SwimmingPool.free_swim_adult_weekday_price
+    if sort == "price":
+        query = query.order_by(price.is_(None), price, SwimmingPool.id)
+    elif sort == "name":
+        query = query.order_by(SwimmingPool.name, SwimmingPool.id)
+    else:
+        query = query.order_by(SwimmingPool.id)
+
+    return query.offset(skip).limit(limit).all()
+
+
+def get_pools_in_bounds(
+    db: Session,
+    south: float,
+    west: float,
+    north: float,
+    east: float,
+    limit: int = 500,
+    after: Optional[dict] = None,
+    has_free_swim: Optional[bool] = None,
+    min_price: Optional[int] = None,
+    max_price: Optional[int] = None,
+    day: Optional[str] = None,
+    time: Optional[str] = None,
+    near_line: Optional[str] = None,
+    max_station_m: Optional[int] = None,
+    columns: Optional[Sequence[str]] = None,
+) -> List[SwimmingPool]:
+    """지도 화면(bbox) 안의 활성 수영장 (ID순, keyset 페이지)
+
+    (lat, lng) 복합 인덱스로 범위를 찾고, 필터는 get_swimming_pools와 동일.
+    """
+    query = _load_only(db.query(SwimmingPool), columns).filter(
+        SwimmingPool.is_active == True,
+        SwimmingPool.lat.between(south, north),
+        SwimmingPool.lng.between(west, east),
+    )
+    query = _apply_filters(query, has_free_swim, min_price, max_price, day, time, near_line, max_station_m)
+    return _get_page_after(query, None, after, limit)
+
+
+def _apply_filters(
+    query,
+    has_free_swim: Optional[bool],
+    min_price: Optional[int],
+    max_price: Optional[int],
+    day: Optional[str],
+    time: Optional[str],
+    near_line: Optional[str] = None,
+    max_station_m: Optional[int] = None,
+):
+    """목록 조회 공통 필터 (자유수영 유무, 가격, 요일/시간, 지하철역)"""
     if has_free_swim is not None:
         if has_free_swim:
             query = query.filter(SwimmingPool.free_swim_schedule.isnot(None))
         else:
             query = query.filter(SwimmingPool.free_swim_schedule.is_(None))
 
-    # pricing JSON에서 자유수영 성인 평일 가격 기준 필터
-    if min_price is not None:
-        query = query.filter(
-            text("json_extract(pricing, '$.자유수영.성인.평일') >= :min_price")
-        ).params(min_price=min_price)
+    # 자유수영 성인 평일 가격 기준 필터
+    query = _filter_by_price(query, min_price, max_price)
 
-    if max_price is not None:
-        query = query.filter(
-            text("json_extract(pricing, '$.자유수영.성인.평일') <= :max_price")
-        ).params(max_price=max_price)
-
-    # 요일 필터: 해당 요일에 자유수영 시간이 있는 곳
+    # 요일/시간 필터: 해당 요일(+시간)에 자유수영 가능한 곳
     if day:
-        query = query.filter(
-            text("json_extract(free_swim_schedule, :day_path) IS NOT NULL")
-        ).params(day_path=f"$.{day}")
-
-    # 시간 필터: 해당 요일의 시간 중 time이 포함되는 곳
-    if time and day:
         query = _filter_by_time(query, day, time)
 
-    return query.offset(skip).limit(limit).all()
+    # 지하철역 필터: 해당 호선(+거리) 역이 가까운 곳
+    return _filter_by_station(query, near_line, max_station_m)
+
+
+def _get_page_after(query, sort: Optional[str], after: Optional[dict], limit: int):
+    """keyset 페이지 조회 (after가 None이면 첫 페이지, limit이 음수면 SQL LIMIT처럼 제한 없음)"""
+    pool_id = SwimmingPool.id
+    last_id = after["id"] if after else 0
+
+    if sort == "price":
+        # 가격 있는 구간 (price, id) → 가격 없는 구간 (id) 순서로 이어서 조회
+        price = SwimmingPool.free_swim_adult_weekday_price
+        results = []
+        if after is None or after["price"] is not None:
+            priced = query.filter(price.isnot(None))
+            if after is not None:
+                priced = priced.filter(tuple_(price, pool_id) > tuple_(after["price"], last_id))
+                last_id = 0
+            results = priced.order_by(price, pool_id).limit(limit).all()
+        if limit < 0 or len(results) < limit:
+            results += query.filter(price.is_(None), pool_id > last_id).order_by(
+                pool_id
+            ).limit(limit - len(results) if limit >= 0 else limit).all()
+        return results
+
+    if sort == "name":
+        if after is not None:
+            query = query.filter(tuple_(SwimmingPool.name, pool_id) > tuple_(after["name"], last_id))
+        return query.order_by(SwimmingPool.name, pool_id).limit(limit).all()
+
+    return query.filter(pool_id > last_id).order_by(pool_id).limit(limit).all()
+
+
+def encode_cursor(pool: SwimmingPool, sort: Optional[str] = None) -> str:
+    """목록의 마지막 수영장 → 다음 페이지 커서 (불투명 문자열)"""
+    key = {"sort": sort or "id", "id": pool.id}
+    if sort == "price":
+        key["price"] = pool.free_swim_adult_weekday_price
+    elif sort == "name":
+        key["name"] = pool.name
+    raw = json.dumps(key, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def decode_cursor(cursor: str, sort: Optional[str] = None) -> dict:
+    """커서 문자열 → keyset 위치 (형식이 잘못됐거나 정렬이 다르면 ValueError)"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        key = json.loads(raw.decode("utf-8"))
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError("invalid cursor") from e
+
+    if not isinstance(key, dict) or key.get("sort") != (sort or "id") or not isinstance(key.get("id"), int):
+        raise ValueError("invalid cursor")
+    if sort == "price" and not isinstance(key.get("price"), (int, type(None))):
+        raise ValueError("invalid cursor")
+    if sort == "name" and not isinstance(key.get("name"), str):
+        raise ValueError("invalid cursor")
+    return key
 
 
 def create_swimming_pool(db: Session, pool: SwimmingPoolCreate):
     db_pool = SwimmingPool(**pool.dict())
+    sync_derived_fields(db_pool)
     db.add(db_pool)
     db.commit()
     db.refresh(db_pool)
+    spatial_index.add(db_pool)
     return db_pool
 
 
@@ -81,14 +216,18 @@ def upsert_swimming_pool(db: Session, pool: SwimmingPoolCreate):
     if existing:
         for key, value in pool.dict().items():
             setattr(existing, key, value)
+        sync_derived_fields(existing)
         db.commit()
         db.refresh(existing)
+        spatial_index.add(existing)
         return existing, False
     else:
         db_pool = SwimmingPool(**pool.dict())
+        sync_derived_fields(db_pool)
         db.add(db_pool)
         db.commit()
         db.refresh(db_pool)
+        spatial_index.add(db_pool)
         return db_pool, True
 
 
@@ -97,11 +236,32 @@ def update_swimming_pool(db: Session, pool_id: int, pool_data: dict):
     if db_pool:
         for key, value in pool_data.items():
             setattr(db_pool, key, value)
+        sync_derived_fields(db_pool)
         db.commit()
         db.refresh(db_pool)
+        spatial_index.add(db_pool)
     return db_pool
 
 
+def search_pools_by_text(
+    db: Session,
+    q: str,
+    limit: int = 20,
+    columns: Optional[Sequence[str]] = None,
+) -> List[SwimmingPool]:
+    """이름/주소/비고 전문 검색 (관련도순, pools_fts 색인 사용)"""
+    ranked = fulltext.search_ids(db.connection(), q, limit)
+    if not ranked:
+        return []
+
+    by_id = {
+        pool.id: pool
+        for pool in _load_only(db.query(SwimmingPool), columns)
+        .filter(SwimmingPool.id.in_([pool_id for pool_id, _ in ranked]))
+    }
+    return [by_id[pool_id] for pool_id, _ in ranked if pool_id in by_id]
+
+
 def search_nearby_pools(
     db: Session,
     lat: float,
@@ -112,7 +272,10 @@ def search_nearby_pools(
     has_free_swim: Optional[bool] = None,
     day: Optional[str] = None,
     time: Optional[str] = None,
+    near_line: Optional[str] = None,
+    max_station_m: Optional[int] = None,
     sort: Optional[str] = None,
+    columns: Optional[Sequence[str]] = None,
 ) -> List[SwimmingPool]:
     """
     위도/경도 기반 반경 검색 (Haversine formula)
@@ -126,89 +289,428 @@ def search_nearby_pools(
     정렬:
       - "price": 자유수영 가격순
       - "distance" 또는 None: 거리순 (기본)
+
+    공간 인덱스가 준비되어 있으면 bbox 후보를 인덱스에서 얻고,
+    반경 안에 드는 ID만 SQL로 조회한다. 결과는 bbox SQL 방식과 동일.
+
+    columns: 지정하면 해당 컬럼만 로드 (get_swimming_pools와 동일)
+    """
+    lat_min, lat_max, lng_min, lng_max = _nearby_bbox(lat, lng, radius_km)
+
+    # 거리순으로 정렬된 (id, 거리) — 인덱스 미사용 시 SQL 조회 후 계산
+    distances = None
+    if spatial_index.ready:
+        candidates = sorted(spatial_index.query_bbox(lat_min, lat_max, lng_min, lng_max))
+        order, dists = distance_engine.within_radius(
+            lat, lng,
+            [c[1] for c in candidates], [c[2] for c in candidates],
+            radius_km,
+        )
+        distances = {candidates[i][0]: float(d) for i, d in zip(order, dists)}
+        if not distances:
+            return []
+
+    required = ["free_swim_adult_weekday_price"] if sort == "price" else []
+    if distances is None:
+        required += ["lat", "lng"]
+    query = _load_only(db.query(SwimmingPool), columns, *required)
+    query = query.filter(SwimmingPool.is_active == True)
+    if distances is not None and len(distances) <= MAX_IN_IDS:
+        query = query.filter(SwimmingPool.id.in_(distances))
+    else:
+        query = query.filter(
+            SwimmingPool.lat.between(lat_min, lat_max),
+            SwimmingPool.lng.between(lng_min, lng_max),
+        )
+
+    # 가격 / 자유수영 유무 / 요일·시간 필터
+    query = _filter_nearby(query, min_price, max_price, has_free_swim, day, time, near_line, max_station_m)
+
+    results = query.order_by(SwimmingPool.id).all()
+
+    # 거리 계산 및 필터링 (결과는 거리순)
+    if distances is None:
+        order, dists = distance_engine.within_radius(
+            lat, lng,
+            [p.lat for p in results], [p.lng for p in results],
+            radius_km,
+        )
+        distances = {results[i].id: float(d) for i, d in zip(order, dists)}
+
+    by_id = {pool.id: pool for pool in results}
+    nearby_pools = []
+    for pool_id, distance in distances.items():
+        pool = by_id.get(pool_id)
+        if pool is not None:
+            pool.distance = distance
+            nearby_pools.append(pool)
+
+    # 가격순 정렬 (기본은 이미 거리순, 가격 없는 곳은 뒤로, 같은 가격은 ID순)
+    if sort == "price":
+        nearby_pools.sort(key=price_sort_key)
+
+    return nearby_pools
+
+
+def price_sort_key(pool: SwimmingPool) -> tuple:
+    """가격순 정렬 키 (0원도 가격, 가격 없는 곳은 뒤로 — 목록 API의 price.is_(None), price와 같은 순서)"""
+    price = pool.free_swim_adult_weekday_price
+    return price is None, price or 0, pool.id
+
+
+def search_nearby_batch(
+    db: Session,
+    origins: Sequence,
+    columns: Optional[Sequence[str]] = None,
+) -> List[List[Tuple[SwimmingPool, float]]]:
+    """여러 기준점의 반경 검색을 한 번에 처리 (기준점별 거리순 (수영장, 거리) 목록)
+
+    origins: lat, lng, radius_km, min_price, max_price, has_free_swim, day, time 속성을
+    가진 객체 (SwimmingPoolSearch). 기준점마다의 결과는 search_nearby_pools(거리순)와 같다.
+
+      1. 모든 기준점 bbox의 후보를 공간 인덱스에서 한 번에 모음
+      2. 기준점 × 후보 거리 행렬을 MATRIX_CELLS 단위로 나눠 계산
+      3. 필터 조합마다 SQL 한 번으로 통과 ID를 구함
+      4. 결과에 나온 수영장을 한 번에 로드
     """
+    if not origins:
+        return []
+
+    boxes = np.array([_nearby_bbox(o.lat, o.lng, o.radius_km) for o in origins])
+
+    if spatial_index.ready:
+        points = {}
+        for box in boxes:
+            for pool_id, plat, plng in spatial_index.query_bbox(*box):
+                points[pool_id] = (plat, plng)
+        candidates = sorted((pool_id, plat, plng) for pool_id, (plat, plng) in points.items())
+    else:
+        candidates = db.query(SwimmingPool.id, SwimmingPool.lat, SwimmingPool.lng).filter(
+            SwimmingPool.is_active == True,
+            SwimmingPool.lat.isnot(None),
+            SwimmingPool.lng.isnot(None),
+        ).order_by(SwimmingPool.id).all()
+
+    ids = np.array([c[0] for c in candidates], dtype=np.int64)
+    lats = np.array([c[1] for c in candidates], dtype=np.float64)
+    lngs = np.array([c[2] for c in candidates], dtype=np.float64)
+    valid = (lats != 0) & (lngs != 0)
+
+    # 기준점별 (ID 배열, 거리 배열) — 거리순, 같은 거리는 ID순
+    hits = []
+    rows = max(1, MATRIX_CELLS // max(1, len(candidates)))
+    for start in range(0, len(origins), rows):
+        chunk = origins[start:start + rows]
+        matrix = distance_engine.haversine_matrix(
+            [o.lat for o in chunk], [o.lng for o in chunk], lats, lngs
+        )
+        for row, (origin, box) in enumerate(zip(chunk, boxes[start:start + rows])):
+            dists = matrix[row]
+            mask = (
+                valid & (dists <= origin.radius_km)
+                & (lats >= box[0]) & (lats <= box[1]) & (lngs >= box[2]) & (lngs <= box[3])
+            )
+            indices = np.flatnonzero(mask)
+            order = indices[np.argsort(dists[indices], kind="stable")]
+            hits.append((ids[order], dists[order]))
+
+    # 필터 조합별 통과 ID (같은 필터를 쓰는 기준점끼리 SQL 한 번)
+    groups = {}
+    for i, origin in enumerate(origins):
+        key = (
+            origin.min_price, origin.max_price, origin.has_free_swim is True,
+            origin.day or None, origin.time if origin.day else None,
+            normalize_line(origin.near_line), origin.max_station_m,
+        )
+        groups.setdefault(key, []).append(i)
+
+    passed = {}
+    for key, members in groups.items():
+        min_price, max_price, free_swim_only, day, time, near_line, max_station_m = key
+        if all(v is None for v in (min_price, max_price, day, near_line, max_station_m)) and not free_swim_only:
+            continue
+        wanted = set().union(*(hits[i][0].tolist() for i in members))
+        query = db.query(SwimmingPool.id).filter(SwimmingPool.is_active == True)
+        if len(wanted) <= MAX_IN_IDS:
+            query = query.filter(SwimmingPool.id.in_(wanted))
+        query = _filter_nearby(
+            query, min_price, max_price, free_swim_only or None, day, time, near_line, max_station_m
+        )
+        matched = {pool_id for (pool_id,) in query} & wanted
+        for i in members:
+            passed[i] = matched
+
+    results = []
+    for i, (hit_ids, hit_dists) in enumerate(hits):
+        allowed = passed.get(i)
+        results.append([
+            (pool_id, float(d))
+            for pool_id, d in zip(hit_ids.tolist(), hit_dists)
+            if allowed is None or pool_id in allowed
+        ])
+
+    # 결과에 나온 수영장만 한 번에 로드
+    needed = sorted({pool_id for result in results for pool_id, _ in result})
+    by_id = {}
+    for start in range(0, len(needed), MAX_IN_IDS):
+        query = _load_only(db.query(SwimmingPool), columns).filter(
+            SwimmingPool.is_active == True,
+            SwimmingPool.id.in_(needed[start:start + MAX_IN_IDS]),
+        )
+        by_id.update((pool.id, pool) for pool in query)
+
+    return [
+        [(by_id[pool_id], d) for pool_id, d in result if pool_id in by_id]
+        for result in results
+    ]
+
+
+def _nearby_bbox(lat: float, lng: float, radius_km: float) -> Tuple[float, float, float, float]:
+    """반경 검색 후보 bbox (lat_min, lat_max, lng_min, lng_max)"""
     lat_range = radius_km / 111.0
     lng_range = radius_km / (111.0 * math.cos(math.radians(lat)))
+    return lat - lat_range, lat + lat_range, lng - lng_range, lng + lng_range
 
-    query = db.query(SwimmingPool).filter(
-        SwimmingPool.lat.between(lat - lat_range, lat + lat_range),
-        SwimmingPool.lng.between(lng - lng_range, lng + lng_range),
-        SwimmingPool.is_active == True
-    )
 
-    # 가격 필터 (pricing JSON 기반)
-    if min_price is not None:
-        query = query.filter(
-            text("json_extract(pricing, '$.자유수영.성인.평일') >= :min_price")
-        ).params(min_price=min_price)
+def find_nearest_pools(
+    db: Session,
+    lat: float,
+    lng: float,
+    k: int = 10,
+    min_price: Optional[int] = None,
+    max_price: Optional[int] = None,
+    has_free_swim: Optional[bool] = None,
+    day: Optional[str] = None,
+    time: Optional[str] = None,
+    near_line: Optional[str] = None,
+    max_station_m: Optional[int] = None,
+    columns: Optional[Sequence[str]] = None,
+) -> List[SwimmingPool]:
+    """가장 가까운 수영장 k개 (반경 제한 없음, 거리순)
 
-    if max_price is not None:
-        query = query.filter(
-            text("json_extract(pricing, '$.자유수영.성인.평일') <= :max_price")
-        ).params(max_price=max_price)
+    공간 인덱스가 준비되어 있으면 기준 셀에서 한 겹씩 넓혀가며 후보를 모으고,
+    필터는 후보 ID 묶음에 SQL로 적용한다. k번째 거리가 아직 보지 않은 셀까지의
+    최소 거리 이하가 되면 멈춘다. 필터 의미는 search_nearby_pools와 동일.
+    """
+    if k <= 0:
+        return []
+
+    filtered = (
+        any(v is not None for v in (min_price, max_price, day, near_line, max_station_m))
+        or has_free_swim is True
+    )
 
-    # 자유수영 유무 필터
+    def matching(ids: List[int]) -> set:
+        if not filtered:
+            return set(ids)
+        matched = set()
+        for start in range(0, len(ids), MAX_IN_IDS):
+            query = db.query(SwimmingPool.id).filter(
+                SwimmingPool.is_active == True,
+                SwimmingPool.id.in_(ids[start:start + MAX_IN_IDS]),
+            )
+            matched.update(pool_id for (pool_id,) in _filter_nearby(
+                query, min_price, max_price, has_free_swim, day, time, near_line, max_station_m
+            ))
+        return matched
+
+    found = []  # (거리, id)
+    if spatial_index.ready:
+        for candidates, outside_km in spatial_index.iter_rings(lat, lng):
+            if candidates:
+                order, dists = distance_engine.within_radius(
+                    lat, lng, [c[1] for c in candidates], [c[2] for c in candidates], math.inf
+                )
+                ids = [candidates[i][0] for i in order]
+                passed = matching(ids)
+                found.extend((float(d), pool_id) for pool_id, d in zip(ids, dists) if pool_id in passed)
+                found.sort()
+            if len(found) >= k and found[k - 1][0] <= outside_km:
+                break
+    else:
+        query = db.query(SwimmingPool.id, SwimmingPool.lat, SwimmingPool.lng).filter(
+            SwimmingPool.is_active == True,
+        )
+        rows = _filter_nearby(
+            query, min_price, max_price, has_free_swim, day, time, near_line, max_station_m
+        ).all()
+        order, dists = distance_engine.within_radius(
+            lat, lng, [r[1] for r in rows], [r[2] for r in rows], math.inf
+        )
+        found = sorted((float(d), rows[i][0]) for i, d in zip(order, dists))
+
+    nearest = found[:k]
+    if not nearest:
+        return []
+
+    by_id = {
+        pool.id: pool
+        for pool in _load_only(db.query(SwimmingPool), columns)
+        .filter(SwimmingPool.id.in_([pool_id for _, pool_id in nearest]))
+    }
+    pools = []
+    for distance, pool_id in nearest:
+        pool = by_id.get(pool_id)
+        if pool is not None:
+            pool.distance = distance
+            pools.append(pool)
+    return pools
+
+
+def _filter_nearby(
+    query, min_price, max_price, has_free_swim, day, time, near_line=None, max_station_m=None
+):
+    """위치 검색용 필터 (has_free_swim=False는 무시 — search_nearby_pools와 동일)"""
+    query = _filter_by_price(query, min_price, max_price)
     if has_free_swim is True:
         query = query.filter(SwimmingPool.free_swim_schedule.isnot(None))
-
-    # 요일 필터
     if day:
-        query = query.filter(
-            text("json_extract(free_swim_schedule, :day_path) IS NOT NULL")
-        ).params(day_path=f"$.{day}")
-
-    # 시간 필터
-    if time and day:
         query = _filter_by_time(query, day, time)
+    return _filter_by_station(query, near_line, max_station_m)
 
-    results = query.all()
 
-    # 거리 계산 및 필터링
-    nearby_pools = []
-    for pool in results:
-        if pool.lat and pool.lng:
-            distance = calculate_distance(lat, lng, pool.lat, pool.lng)
-            if distance <= radius_km:
-                pool.distance = distance
-                nearby_pools.append(pool)
-
-    # 정렬
-    if sort == "price":
-        nearby_pools.sort(key=lambda p: _get_free_swim_price(p) or 999999)
-    else:
-        nearby_pools.sort(key=lambda p: p.distance)
+def _load_only(query, columns: Optional[Sequence[str]], *required: str):
+    """columns(+정렬 등에 필요한 컬럼)만 로드하도록 제한 (None이면 전체)
 
-    return nearby_pools
+    가장 가까운 역은 전체 조회이거나 columns에 nearest_station이 있을 때만 함께 로드.
+    """
+    if columns is None:
+        return query.options(selectinload(SwimmingPool.nearest_station_row))
+    names = [name for name in dict.fromkeys(["id", *columns, *required]) if name != "nearest_station"]
+    query = query.options(load_only(*(getattr(SwimmingPool, name) for name in names)))
+    if "nearest_station" in columns:
+        query = query.options(selectinload(SwimmingPool.nearest_station_row))
+    return query
 
 
-def _get_free_swim_price(pool: SwimmingPool) -> Optional[int]:
-    """수영장의 자유수영 성인 평일 가격 추출"""
-    if not pool.pricing:
+def extract_free_swim_price(pricing, day_type: str = "평일") -> Optional[int]:
+    """pricing JSON에서 자유수영 성인 가격 추출 (day_type: "평일"/"주말")
+
+    {"자유수영": {"성인": {"평일": 3400}}} 과 {"자유수영": {"성인": 3400}} 둘 다 지원.
+    """
+    if not pricing:
         return None
     try:
-        pricing = pool.pricing if isinstance(pool.pricing, dict) else json.loads(pool.pricing)
+        pricing = pricing if isinstance(pricing, dict) else json.loads(pricing)
         free_swim = pricing.get("자유수영", {})
         adult = free_swim.get("성인", {})
-        if isinstance(adult, dict):
-            return adult.get("평일")
-        return adult if isinstance(adult, (int, float)) else None
+        price = adult.get(day_type) if isinstance(adult, dict) else adult
     except (json.JSONDecodeError, TypeError, AttributeError):
         return None
+    if isinstance(price, bool) or not isinstance(price, (int, float)):
+        return None
+    return int(price)
 
 
-def _filter_by_time(query, day: str, time: str):
-    """특정 요일+시간에 자유수영 가능한 곳 필터 (Python 후처리 방식 대신 SQL 선필터)
+def _get_free_swim_price(pool: SwimmingPool) -> Optional[int]:
+    """수영장의 자유수영 성인 평일 가격 추출"""
+    return extract_free_swim_price(pool.pricing)
 
-    SQLite의 JSON 배열 내 시간 범위 비교는 복잡하므로,
-    해당 요일에 스케줄이 있는 곳만 SQL로 필터하고,
-    시간 범위 체크는 Python에서 후처리.
-    """
-    # SQL에서는 해당 요일에 스케줄이 있는지만 필터
-    # 시간 범위 체크는 search_nearby_pools/get_swimming_pools의 결과에서 후처리 필요
-    # → 여기서는 추가 필터 없이 반환 (day 필터가 이미 적용됨)
+
+def sync_derived_fields(pool: SwimmingPool):
+    """pricing/free_swim_schedule JSON에서 파생되는 컬럼·세션 행 갱신 (커밋 전에 호출)"""
+    pool.free_swim_adult_weekday_price = extract_free_swim_price(pool.pricing)
+    pool.free_swim_sessions = [
+        FreeSwimSession(day=day, start_minute=start, end_minute=end)
+        for day, start, end in compile_free_swim_sessions(pool.free_swim_schedule)
+    ]
+    pool.stations = [PoolStation(**row) for row in station_join().rows_for(pool.lat, pool.lng)]
+
+
+def _filter_by_price(query, min_price: Optional[int], max_price: Optional[int]):
+    """자유수영 성인 평일 가격 범위 필터 (인덱스 컬럼 사용)"""
+    price = SwimmingPool.free_swim_adult_weekday_price
+    if min_price is not None:
+        query = query.filter(price >= min_price)
+    if max_price is not None:
+        query = query.filter(price <= max_price)
     return query
 
 
+def _filter_by_station(query, near_line: Optional[str], max_station_m: Optional[int]):
+    """주변 지하철역 필터 (pool_stations 인덱스 사용)
+
+    near_line만 주면 STATION_RADIUS_M 안에 그 호선 역이 있는 곳,
+    max_station_m만 주면 호선과 무관하게 그 거리 안에 역이 있는 곳.
+    """
+    near_line = normalize_line(near_line)
+    if near_line is None and max_station_m is None:
+        return query
+
+    stations = select(PoolStation.pool_id).where(
+        PoolStation.distance_m <= min(max_station_m or STATION_RADIUS_M, STATION_RADIUS_M)
+    )
+    if near_line is not None:
+        stations = stations.where(PoolStation.line == near_line)
+    return query.filter(SwimmingPool.id.in_(stations))
+
+
+def _filter_by_time(query, day: str, time: Optional[str] = None):
+    """특정 요일(+시간)에 자유수영 가능한 곳 필터
+
+    free_swim_sessions의 (day, start_minute, end_minute) 인덱스 범위 조회 한 번으로 처리.
+    time이 없으면 해당 요일에 세션이 있는 곳, 있으면 그 시각을 포함하는 세션이 있는 곳.
+    """
+    sessions = select(FreeSwimSession.pool_id).where(FreeSwimSession.day == day)
+
+    if time:
+        minute = parse_minutes(time)
+        if minute is None:
+            return query.filter(false())
+        sessions = sessions.where(
+            FreeSwimSession.start_minute <= minute,
+            FreeSwimSession.end_minute >= minute,
+        )
+
+    return query.filter(SwimmingPool.id.in_(sessions))
+
+
+def parse_minutes(value: str) -> Optional[int]:
+    """HH:MM 문자열 → 00:00부터의 분 (형식이 잘못되면 None)"""
+    try:
+        hours, minutes = value.strip().split(":")
+        hours, minutes = int(hours), int(minutes)
+    except (ValueError, AttributeError):
+        return None
+    if not (0 <= hours <= 24 and 0 <= minutes < 60):
+        return None
+    return hours * 60 + minutes
+
+
+def compile_free_swim_sessions(schedule_data) -> List[tuple]:
+    """free_swim_schedule JSON → [(요일, 시작 분, 종료 분), ...]
+
+    is_time_in_schedule과 같은 규칙으로 "HH:MM-HH:MM" 슬롯만 사용하고,
+    "휴관" 같은 문자열 값이나 형식이 잘못된 슬롯은 건너뛴다.
+    """
+    if not schedule_data:
+        return []
+
+    try:
+        schedule = schedule_data if isinstance(schedule_data, dict) else json.loads(schedule_data)
+    except (json.JSONDecodeError, TypeError):
+        return []
+    if not isinstance(schedule, dict):
+        return []
+
+    sessions = []
+    for day, day_slots in schedule.items():
+        if not isinstance(day_slots, list):
+            continue
+        for slot in day_slots:
+            if not isinstance(slot, str) or "-" not in slot:
+                continue
+            parts = slot.split("-")
+            if len(parts) != 2:
+                continue
+            start, end = parse_minutes(parts[0]), parse_minutes(parts[1])
+            if start is None or end is None:
+                continue
+            sessions.append((day, start, end))
+
+    return sessions
+
+
 def is_time_in_schedule(schedule_data, day: str, time: str) -> bool:
     """특정 요일+시간이 자유수영 시간표에 포함되는지 확인
 
@@ -0,0 +1,37 @@
+"""조회 CRUD의 async 버전
+
+쿼리 구성/필터/정렬은 swimming_pool의 sync 함수를 그대로 사용한다.
+  - AsyncSession(DB_ASYNC=1): run_sync로 실행 → SQL I/O는 aiosqlite에서 await
+  - Session: 스레드풀에서 실행 (기존 sync 라우트와 같은 동작)
+결과 객체는 함수 안에서 필요한 컬럼/관계가 모두 로드되므로 밖에서 lazy load가 일어나지 않는다.
+"""
+from typing import List, Optional, Union
+
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.crud import swimming_pool as crud
+from app.models.swimming_pool import SwimmingPool
+
+
+async def _run(db: Union[AsyncSession, Session], fn, *args, **kwargs):
+    if isinstance(db, AsyncSession):
+        return await db.run_sync(fn, *args, **kwargs)
+    return await run_in_threadpool(fn, db, *args, **kwargs)
+
+
+async def get_swimming_pool(db, pool_id: int) -> Optional[SwimmingPool]:
+    return await _run(db, crud.get_swimming_pool, pool_id)
+
+
+async def get_swimming_pools(db, **kwargs) -> List[SwimmingPool]:
+    return await _run(db, crud.get_swimming_pools, **kwargs)
+
+
+async def search_nearby_pools(db, **kwargs) -> List[SwimmingPool]:
+    return await _run(db, crud.search_nearby_pools, **kwargs)
+
+
+async def search_pools_by_text(db, q: str, **kwargs) -> List[SwimmingPool]:
+    return await _run(db, crud.search_pools_by_text, q, **kwargs)
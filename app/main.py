@@ -1,9 +1,17 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, Response
 from app.api import pools, csv_operations
-from database.connection import init_db
+from app.api.compression import CompressionMiddleware
+from app.api.metrics import MetricsMiddleware, metrics_registry
+from app.api.query_stats import QueryTimingMiddleware, instrument
+from app.api.static_assets import REVALIDATE, StaticAssets
+from app.services.data_version import data_version
+from app.services.spatial_index import spatial_index
+from app.services.autocomplete import autocomplete_index
+from app.services.snapshot import snapshot_store
+from database.connection import init_db, ReadSessionLocal, THREADPOOL_SIZE, async_engine, engine, read_engine
+import anyio.to_thread
 import os
 
 app = FastAPI(
@@ -19,43 +27,80 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", "X-Next-Cursor", "Server-Timing"],
 )
 
+# 요청별 쿼리 수/DB 시간 → Server-Timing 헤더, 느린 쿼리 로그 (SLOW_QUERY_MS 등)
+for bind in (engine, read_engine, async_engine.sync_engine if async_engine else None):
+    if bind is not None:
+        instrument(bind)
+app.add_middleware(QueryTimingMiddleware)
+
+# API 응답 Brotli/gzip 압축 (COMPRESS_MIN_SIZE 이상)
+app.add_middleware(CompressionMiddleware)
+
+# 라우트별 요청 지표 (/metrics) - 가장 바깥에서 압축까지 포함해 측정
+app.add_middleware(MetricsMiddleware)
+
 # 정적 파일 서빙 (프론트엔드) - 라우터보다 먼저 마운트
 frontend_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "frontend")
 
-# CSS, JS 등 정적 파일들을 각각 마운트
+# CSS, JS 등 정적 파일들을 각각 마운트 (scripts/precompress_static.py로 만든 .br/.gz가 있으면 사용,
+# scripts/fingerprint_static.py로 만든 해시 파일명은 1년 immutable 캐시)
 if os.path.exists(frontend_path):
     # CSS 파일
     css_path = os.path.join(frontend_path, "css")
     if os.path.exists(css_path):
-        app.mount("/css", StaticFiles(directory=css_path), name="css")
+        app.mount("/css", StaticAssets(directory=css_path), name="css")
 
     # JS 파일
     js_path = os.path.join(frontend_path, "js")
     if os.path.exists(js_path):
-        app.mount("/js", StaticFiles(directory=js_path), name="js")
+        app.mount("/js", StaticAssets(directory=js_path), name="js")
 
     # data 파일
     data_path = os.path.join(frontend_path, "data")
     if os.path.exists(data_path):
-        app.mount("/data", StaticFiles(directory=data_path), name="data")
+        app.mount("/data", StaticAssets(directory=data_path), name="data")
 
 # 라우터 등록 - 정적 파일 이후에 등록
 app.include_router(pools.router, prefix="/api")
 app.include_router(csv_operations.router, prefix="/api")
 
+def rebuild_indexes():
+    """DB 기준으로 메모리 인덱스 재구축"""
+    db = ReadSessionLocal()
+    try:
+        spatial_index.rebuild(db)
+        autocomplete_index.rebuild(db)
+    finally:
+        db.close()
+
 @app.on_event("startup")
 def startup_event():
-    """앱 시작 시 DB 초기화"""
+    """앱 시작 시 DB 초기화 및 메모리 인덱스 구축"""
+    # sync 라우트 스레드 수를 조회 연결 풀 상한(THREADPOOL_SIZE)과 맞춤
+    anyio.to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_SIZE
     init_db()
+    rebuild_indexes()
+    data_version.current()
+    # 다른 프로세스(크롤러 등)가 DB를 바꾸면 백그라운드 버전 확인 스레드가 알아채고 재구축
+    # (요청은 재구축을 기다리지 않고 교체 전까지 이전 인덱스 사용)
+    data_version.subscribe(rebuild_indexes)
+    data_version.start()
+    # SERVE_SNAPSHOT=1: 조회는 메모리 스냅샷에서
+    if snapshot_store.enabled:
+        snapshot_store.start(ReadSessionLocal)
 
 @app.get("/")
 def root():
-    """프론트엔드 메인 페이지 제공"""
-    index_path = os.path.join(frontend_path, "index_refactored.html")
-    if os.path.exists(index_path):
-        return FileResponse(index_path)
+    """프론트엔드 메인 페이지 제공 (빌드된 dist/가 있으면 해시 파일명을 참조하는 버전)"""
+    for index_path in (
+        os.path.join(frontend_path, "dist", "index_refactored.html"),
+        os.path.join(frontend_path, "index_refactored.html"),
+    ):
+        if os.path.exists(index_path):
+            return FileResponse(index_path, headers={"Cache-Control": REVALIDATE})
     return {
         "message": "한국 수영장 정보 API",
         "docs": "/docs",
@@ -65,3 +110,8 @@ def root():
 @app.get("/health")
 def health_check():
     return {"status": "healthy"}
+
+@app.get("/metrics", include_in_schema=False)
+def metrics():
+    """Prometheus 텍스트 형식 요청 지표"""
+    return Response(metrics_registry.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
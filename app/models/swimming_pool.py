@@ -1,5 +1,6 @@
-from sqlalchemy import Column, Integer, String, Float, JSON, DateTime, Boolean, Text
+from sqlalchemy import Column, Integer, String, Float, JSON, DateTime, Boolean, Text, ForeignKey, Index
 from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.orm import relationship
 from datetime import datetime
 
 Base = declarative_base()
@@ -27,10 +28,29 @@ class SwimmingPool(Base):
     # {"자유수영": {"성인": {"평일": 3400, "주말": 4400}}, "강습_월": {"성인": 120000}}
     pricing = Column(JSON, nullable=True)
 
+    # pricing.자유수영.성인.평일 값 (가격 필터/정렬용, 쓰기 시점에 동기화)
+    free_swim_adult_weekday_price = Column(Integer, nullable=True, index=True)
+
     # 자유수영 시간표 (요일별)
     # {"월": ["12:00-12:50"], "토": ["06:00-07:50", "09:00-10:50"], "휴관": "매월 첫째 일요일"}
     free_swim_schedule = Column(JSON, nullable=True)
 
+    # free_swim_schedule을 분 단위 구간으로 펼친 행 (요일/시간 필터용, 쓰기 시점에 동기화)
+    free_swim_sessions = relationship(
+        "FreeSwimSession", cascade="all, delete-orphan", passive_deletes=True
+    )
+
+    # 주변 지하철역 (subway_lines.json에서 계산, 쓰기 시점에 동기화)
+    stations = relationship(
+        "PoolStation", cascade="all, delete-orphan", passive_deletes=True
+    )
+    # 목록 조회는 nearest_station을 요청할 때만 selectinload (crud._load_only)
+    nearest_station_row = relationship(
+        "PoolStation",
+        primaryjoin="and_(SwimmingPool.id == PoolStation.pool_id, PoolStation.rank == 1)",
+        uselist=False, viewonly=True,
+    )
+
     # 비고 (휴관일, 예약방법 등)
     notes = Column(Text, nullable=True)
 
@@ -52,3 +72,57 @@ class SwimmingPool(Base):
     # 평점 및 리뷰
     rating = Column(Float, nullable=True)
     review_count = Column(Integer, default=0)
+
+    __table_args__ = (
+        # 지도 화면(bbox) 범위 조회용
+        Index("ix_swimming_pools_lat_lng", "lat", "lng"),
+    )
+
+    @property
+    def nearest_station(self):
+        """가장 가까운 지하철역 {"name", "line", "distance_m"} (계산 전이면 None)"""
+        row = self.nearest_station_row
+        if row is None:
+            return None
+        return {"name": row.station, "line": row.line, "distance_m": row.distance_m}
+
+
+class FreeSwimSession(Base):
+    """자유수영 세션 구간 (free_swim_schedule에서 파생)
+
+    "토": ["09:00-10:50"] → (day="토", start_minute=540, end_minute=650)
+    """
+    __tablename__ = "free_swim_sessions"
+
+    id = Column(Integer, primary_key=True)
+    pool_id = Column(Integer, ForeignKey("swimming_pools.id", ondelete="CASCADE"), nullable=False, index=True)
+    day = Column(String, nullable=False)  # "월"~"일"
+    start_minute = Column(Integer, nullable=False)  # 00:00부터의 분
+    end_minute = Column(Integer, nullable=False)
+
+    __table_args__ = (
+        Index("ix_free_swim_sessions_day_start_end", "day", "start_minute", "end_minute"),
+    )
+
+
+class PoolStation(Base):
+    """수영장 주변 지하철역 (frontend/data/subway_lines.json에서 계산)
+
+    반경(STATION_RADIUS_M) 안의 (역, 호선)마다 한 행, rank는 거리순 (1 = 가장 가까운 역).
+    가장 가까운 역은 반경 밖이어도 rank=1로 저장.
+    """
+    __tablename__ = "pool_stations"
+
+    id = Column(Integer, primary_key=True)
+    pool_id = Column(Integer, ForeignKey("swimming_pools.id", ondelete="CASCADE"), nullable=False, index=True)
+    station = Column(String, nullable=False)  # "강남"
+    line = Column(String, nullable=False)  # "2" (subway_lines.json의 number)
+    distance_m = Column(Integer, nullable=False)
+    rank = Column(Integer, nullable=False)
+
+    __table_args__ = (
+        # near_line + max_station_m 필터용
+        Index("ix_pool_stations_line_distance", "line", "distance_m", "pool_id"),
+        # max_station_m만 지정한 경우
+        Index("ix_pool_stations_distance", "distance_m", "pool_id"),
+    )
@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import Optional, Dict, List, Any
 from datetime import datetime
 
@@ -26,6 +26,11 @@ class SwimmingPoolBase(BaseModel):
 class SwimmingPoolCreate(SwimmingPoolBase):
     pass
 
+class NearestStation(BaseModel):
+    name: str
+    line: str  # 호선 번호 ("2")
+    distance_m: int
+
 class SwimmingPoolResponse(SwimmingPoolBase):
     id: int
     last_updated: Optional[datetime] = None
@@ -33,6 +38,7 @@ class SwimmingPoolResponse(SwimmingPoolBase):
     review_count: int = 0
     enrichment_status: Optional[str] = None
     last_enriched: Optional[datetime] = None
+    nearest_station: Optional[NearestStation] = None
 
     class Config:
         from_attributes = True
@@ -46,3 +52,11 @@ class SwimmingPoolSearch(BaseModel):
     has_free_swim: Optional[bool] = None
     day: Optional[str] = None  # 요일 필터: "월"~"일"
     time: Optional[str] = None  # 시간 필터: "HH:MM"
+    near_line: Optional[str] = None  # 지하철 호선 필터: "2"
+    max_station_m: Optional[int] = Field(None, ge=1)  # 가장 가까운 역까지 최대 거리 (m)
+
+class NearbyBatchOrigin(SwimmingPoolSearch):
+    key: Optional[str] = None  # 결과 구분용 이름 (역 이름, 사무실 ID 등)
+
+class NearbyBatchRequest(BaseModel):
+    origins: List[NearbyBatchOrigin]
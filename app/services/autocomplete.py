@@ -0,0 +1,181 @@
+"""수영장 이름 자동완성 (접두사 trie, 초성 검색 지원)
+
+이름, 이름 속 단어, 주소의 구/군/시 이름을 그대로 한 벌, 초성으로 바꿔서 한 벌 넣는다.
+"ㅇㄹㅍ" → "올림픽공원 수영장", "송파" → "송파구", "수영" → "... 수영장"
+
+- 각 노드가 그 접두사로 시작하는 상위 TOP_K개 후보를 미리 들고 있어
+  조회는 검색어 길이만큼 노드를 따라가는 것으로 끝남
+- 앱 시작 시, 데이터 버전이 바뀔 때 rebuild()로 전체 재구성
+  (version: 재구성에 쓴 데이터 버전, /autocomplete ETag 기준)
+"""
+import re
+import threading
+from bisect import insort
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.models.swimming_pool import SwimmingPool
+from app.services.data_version import read_version
+
+
+# 노드마다 보관할 후보 수 (= 한 번에 돌려줄 수 있는 최대 개수)
+TOP_K = 20
+
+CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+_HANGUL_START, _HANGUL_END = 0xAC00, 0xD7A3
+_JAMO = re.compile("[ㄱ-ㅎ]")
+
+# 일치 종류 (작을수록 앞)
+NAME, DISTRICT, WORD = 0, 1, 2
+_KIND_LABEL = {NAME: "name", DISTRICT: "district", WORD: "word"}
+
+# 주소에서 구/군/시 (광역/특별시 제외)
+_DISTRICT = re.compile(r"^[가-힣]+(구|군|시)$")
+_METRO_SUFFIXES = ("특별시", "광역시", "특별자치시")
+
+
+def to_choseong(text: str) -> str:
+    """한글 음절을 초성으로 ("올림픽" → "ㅇㄹㅍ"), 나머지 글자는 그대로"""
+    return "".join(
+        CHOSEONG[(ord(ch) - _HANGUL_START) // 588] if _HANGUL_START <= ord(ch) <= _HANGUL_END else ch
+        for ch in text
+    )
+
+
+def normalize(text: str) -> str:
+    """공백 제거 + 소문자"""
+    return "".join(text.split()).lower()
+
+
+def districts_of(address: Optional[str]) -> List[str]:
+    """주소의 구/군/시 이름 ("서울 송파구 올림픽로" → ["송파구"])"""
+    if not address:
+        return []
+    return [
+        token for token in address.split()
+        if _DISTRICT.match(token) and not token.endswith(_METRO_SUFFIXES)
+    ]
+
+
+class _Node:
+    __slots__ = ("children", "top")
+
+    def __init__(self):
+        self.children: Dict[str, "_Node"] = {}
+        # (종류, 표시 이름 길이, 표시 이름, 대상) — 대상: 수영장 id 또는 구 이름
+        self.top: List[tuple] = []
+
+
+def _offer(node: _Node, entry: tuple):
+    """노드 후보에 추가 (같은 대상은 더 좋은 것 하나만, 상위 TOP_K개 유지)"""
+    for i, existing in enumerate(node.top):
+        if existing[3] == entry[3]:
+            if existing <= entry:
+                return
+            del node.top[i]
+            break
+    insort(node.top, entry)
+    del node.top[TOP_K:]
+
+
+class AutocompleteIndex:
+    """이름/초성 접두사 trie"""
+
+    def __init__(self):
+        self.ready = False
+        self.version: Optional[str] = None
+        self._root = _Node()
+        self._pools: Dict[int, Tuple[str, Optional[str]]] = {}
+        self._districts: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def rebuild(self, db: Session):
+        """DB의 활성 수영장 이름/주소로 trie 전체 재구성"""
+        version = read_version(db)
+        rows = db.query(SwimmingPool.id, SwimmingPool.name, SwimmingPool.address).filter(
+            SwimmingPool.is_active == True,
+        ).all()
+
+        root = _Node()
+        pools = {}
+        districts: Dict[str, int] = {}
+        for pool_id, name, address in rows:
+            if not name:
+                continue
+            pools[pool_id] = (name, address)
+            entry_name = (len(name), name, ("pool", pool_id))
+            self._insert(root, normalize(name), (NAME, *entry_name))
+            for word in name.split()[1:]:
+                self._insert(root, normalize(word), (WORD, *entry_name))
+            for district in districts_of(address):
+                districts[district] = districts.get(district, 0) + 1
+
+        for district in districts:
+            self._insert(root, normalize(district), (DISTRICT, len(district), district, ("district", district)))
+
+        with self._lock:
+            self._root = root
+            self._pools = pools
+            self._districts = districts
+            self.version = version
+            self.ready = True
+
+    @staticmethod
+    def _insert(root: _Node, key: str, entry: tuple):
+        """key 그대로 + 초성 변환 key 두 갈래로 넣음"""
+        for variant in {key, to_choseong(key)}:
+            node = root
+            for ch in variant:
+                node = node.children.setdefault(ch, _Node())
+                _offer(node, entry)
+
+    def suggest(self, q: str, limit: int = 10) -> List[dict]:
+        """검색어로 시작하는 후보 limit개
+
+        초성과 완성 글자를 섞어 쓴 경우("올ㄹㅍ")는 원래 이름 trie를 검색어와 함께 따라간다.
+        완성 글자 자리는 같은 글자 자식으로, 초성 자리는 그 초성으로 시작하는 모든 자식으로 가고,
+        도착한 노드들의 후보를 합친다 (노드마다 상위 TOP_K개이므로 합친 상위 limit개도 정확).
+        """
+        key = normalize(q)
+        if not key:
+            return []
+
+        if not (_JAMO.search(key) and key != to_choseong(key)):
+            node = self._root
+            for ch in key:
+                node = node.children.get(ch)
+                if node is None:
+                    return []
+            return [self._render(entry) for entry in node.top[:limit]]
+
+        nodes = [self._root]
+        for ch in key:
+            if _JAMO.match(ch):
+                nodes = [
+                    child for node in nodes
+                    for label, child in node.children.items() if to_choseong(label) == ch
+                ]
+            else:
+                nodes = [node.children[ch] for node in nodes if ch in node.children]
+            if not nodes:
+                return []
+
+        best: Dict[tuple, tuple] = {}
+        for node in nodes:
+            for entry in node.top:
+                existing = best.get(entry[3])
+                if existing is None or entry < existing:
+                    best[entry[3]] = entry
+        return [self._render(entry) for entry in sorted(best.values())[:limit]]
+
+    def _render(self, entry: tuple) -> dict:
+        kind, _, label, (target_type, target) = entry
+        if target_type == "district":
+            return {"type": "district", "name": label, "count": self._districts.get(label, 0)}
+        name, address = self._pools.get(target, (label, None))
+        return {"type": "pool", "id": target, "name": name, "address": address, "match": _KIND_LABEL[kind]}
+
+
+# 앱 전역 인스턴스
+autocomplete_index = AutocompleteIndex()
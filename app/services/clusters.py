@@ -0,0 +1,159 @@
+"""줌 레벨별 마커 클러스터 (계층 격자)
+
+줌 z의 셀 크기는 CELL_DEG_AT_ZOOM0 / 2**z 도. 줌이 하나 올라가면 셀이 4등분되므로
+가장 세밀한 레벨만 좌표로 채우고, 상위 레벨은 자식 셀 4개를 합쳐서 만든다.
+
+- 데이터 버전이 바뀌면 다음 요청 때 전체 재구성
+- zoom >= CLUSTER_MAX_ZOOM이면 클러스터 대신 개별 수영장 반환
+  (bbox 안이 MAX_BBOX_POOLS개를 넘으면 클러스터로 대신함)
+"""
+import math
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.models.swimming_pool import SwimmingPool
+
+
+# 줌 0에서 셀 하나의 크기 (256px 타일 = 360도 → 64px 셀 = 90도)
+CELL_DEG_AT_ZOOM0 = 90.0
+# 이 줌 이상에서는 개별 수영장 반환
+CLUSTER_MAX_ZOOM = 15
+# 개별 수영장으로 내려줄 최대 개수 (넘으면 클러스터)
+MAX_BBOX_POOLS = 2000
+
+# 셀 집계값: [개수, 위도 합, 경도 합, 최저가(없으면 None)]
+Cell = List
+
+
+def cell_deg(zoom: int) -> float:
+    return CELL_DEG_AT_ZOOM0 / (2 ** zoom)
+
+
+def _min_price(a: Optional[int], b: Optional[int]) -> Optional[int]:
+    if a is None:
+        return b
+    if b is None:
+        return a
+    return min(a, b)
+
+
+class ClusterIndex:
+    """한 데이터 버전에 대한 레벨별 클러스터 격자"""
+
+    def __init__(self, pools: List[Tuple[int, str, float, float, Optional[int]]]):
+        # pools: (id, name, lat, lng, price)
+        self.levels: List[Dict[Tuple[int, int], Cell]] = [dict() for _ in range(CLUSTER_MAX_ZOOM)]
+        # 가장 세밀한 셀별 개별 수영장 (높은 줌에서 사용)
+        self.cell_pools: Dict[Tuple[int, int], list] = {}
+
+        finest = CLUSTER_MAX_ZOOM - 1
+        size = cell_deg(finest)
+        cells = self.levels[finest]
+        for pool in pools:
+            _, _, lat, lng, price = pool
+            key = (math.floor(lat / size), math.floor(lng / size))
+            self.cell_pools.setdefault(key, []).append(pool)
+            cell = cells.get(key)
+            if cell is None:
+                cells[key] = [1, lat, lng, price]
+            else:
+                cell[0] += 1
+                cell[1] += lat
+                cell[2] += lng
+                cell[3] = _min_price(cell[3], price)
+
+        for zoom in range(finest - 1, -1, -1):
+            parents = self.levels[zoom]
+            for (row, col), child in self.levels[zoom + 1].items():
+                key = (row >> 1, col >> 1)
+                cell = parents.get(key)
+                if cell is None:
+                    parents[key] = list(child)
+                else:
+                    cell[0] += child[0]
+                    cell[1] += child[1]
+                    cell[2] += child[2]
+                    cell[3] = _min_price(cell[3], child[3])
+
+    @staticmethod
+    def _select(cells: dict, south: float, west: float, north: float, east: float, size: float) -> list:
+        """bbox에 걸치는 셀 값 목록 (셀 범위가 채워진 셀보다 많으면 채워진 셀만 순회)"""
+        row_min, row_max = math.floor(south / size), math.floor(north / size)
+        col_min, col_max = math.floor(west / size), math.floor(east / size)
+
+        if (row_max - row_min + 1) * (col_max - col_min + 1) > len(cells):
+            return [
+                cell for (row, col), cell in cells.items()
+                if row_min <= row <= row_max and col_min <= col <= col_max
+            ]
+        return [
+            cells[(row, col)]
+            for row in range(row_min, row_max + 1)
+            for col in range(col_min, col_max + 1)
+            if (row, col) in cells
+        ]
+
+    def clusters(self, south: float, west: float, north: float, east: float, zoom: int) -> List[dict]:
+        """bbox에 걸치는 셀의 클러스터 (개수, 중심 좌표, 최저가)"""
+        selected = self._select(self.levels[zoom], south, west, north, east, cell_deg(zoom))
+        return [
+            {
+                "count": count,
+                "lat": sum_lat / count,
+                "lng": sum_lng / count,
+                "min_price": min_price,
+            }
+            for count, sum_lat, sum_lng, min_price in selected
+        ]
+
+    def pools_in(
+        self, south: float, west: float, north: float, east: float, limit: Optional[int] = None
+    ) -> Optional[List[dict]]:
+        """bbox 안의 개별 수영장 (ID순, limit개를 넘으면 None)"""
+        size = cell_deg(CLUSTER_MAX_ZOOM - 1)
+        pools = [
+            pool
+            for cell in self._select(self.cell_pools, south, west, north, east, size)
+            for pool in cell
+            if south <= pool[2] <= north and west <= pool[3] <= east
+        ]
+        if limit is not None and len(pools) > limit:
+            return None
+        pools.sort()
+        return [
+            {"id": pool_id, "name": name, "lat": lat, "lng": lng, "price": price}
+            for pool_id, name, lat, lng, price in pools
+        ]
+
+
+class ClusterCache:
+    """데이터 버전별 ClusterIndex (최신 버전 하나만 보관)"""
+
+    def __init__(self):
+        self._version: Optional[str] = None
+        self._index: Optional[ClusterIndex] = None
+        self._lock = threading.Lock()
+
+    def get(self, db: Session, version: str) -> ClusterIndex:
+        if self._version == version and self._index is not None:
+            return self._index
+
+        with self._lock:
+            if self._version != version or self._index is None:
+                rows = db.query(
+                    SwimmingPool.id, SwimmingPool.name, SwimmingPool.lat, SwimmingPool.lng,
+                    SwimmingPool.free_swim_adult_weekday_price,
+                ).filter(
+                    SwimmingPool.is_active == True,
+                    SwimmingPool.lat.isnot(None),
+                    SwimmingPool.lng.isnot(None),
+                ).order_by(SwimmingPool.id).all()
+                self._index = ClusterIndex([tuple(row) for row in rows])
+                self._version = version
+            return self._index
+
+
+# 앱 전역 인스턴스
+cluster_cache = ClusterCache()
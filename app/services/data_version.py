@@ -0,0 +1,177 @@
+"""swimming_pools 데이터 버전 추적
+
+SQLite 트리거가 swimming_pools의 INSERT/UPDATE/DELETE마다 data_version.version을 올린다.
+API 프로세스 밖(크롤러, llm_enricher의 sqlite3 직접 쓰기)의 변경도 같은 카운터에 반영됨.
+
+- epoch: 테이블 생성 시 만든 임의 토큰 (DB를 새로 만들면 바뀜)
+- 버전 문자열 "{epoch}-{version}"은 ETag, 메모리 캐시 무효화 기준으로 사용
+- 매 요청마다 DB를 읽지 않도록 DATA_VERSION_TTL초 동안 메모리 값을 재사용
+- 같은 프로세스의 커밋은 즉시 무효화되어 다음 조회 때 새 버전을 읽음
+- start(): 요청이 없어도 TTL마다 버전을 확인하는 스레드 (다른 프로세스의 변경 반영)
+- 구독자(메모리 인덱스 재구축)는 요청 경로가 아닌 알림 스레드에서 실행되고,
+  재구축이 끝나 교체될 때까지 이전 인덱스가 그대로 쓰인다
+- last_updated를 건드리지 않은 UPDATE는 트리거가 현재 시각으로 채움
+"""
+import os
+import threading
+import time
+import uuid
+from typing import Callable, List, Optional
+
+from sqlalchemy import event, text
+from sqlalchemy.orm import Session
+
+from database.connection import engine, read_engine
+
+
+DATA_VERSION_TTL = float(os.getenv("DATA_VERSION_TTL", "5"))
+
+_DDL = [
+    """
+    CREATE TABLE IF NOT EXISTS data_version (
+        id INTEGER PRIMARY KEY CHECK (id = 1),
+        epoch TEXT NOT NULL,
+        version INTEGER NOT NULL
+    )
+    """,
+    "INSERT OR IGNORE INTO data_version (id, epoch, version) VALUES (1, :epoch, 0)",
+] + [
+    f"""
+    CREATE TRIGGER IF NOT EXISTS swimming_pools_version_{op.lower()}
+    AFTER {op} ON swimming_pools
+    BEGIN
+        UPDATE data_version SET version = version + 1 WHERE id = 1;
+    END
+    """
+    for op in ("INSERT", "UPDATE", "DELETE")
+] + [
+    # last_updated를 직접 쓰지 않는 sqlite3 쓰기(크롤러 등)도 수정 시각을 남김
+    # (응답 조각 캐시가 (id, last_updated)를 키로 사용). ORM 형식과 같은 마이크로초 6자리.
+    """
+    CREATE TRIGGER IF NOT EXISTS swimming_pools_touch_last_updated
+    AFTER UPDATE ON swimming_pools
+    WHEN new.last_updated IS old.last_updated
+    BEGIN
+        UPDATE swimming_pools
+        SET last_updated = strftime('%Y-%m-%d %H:%M:%f', 'now') || '000'
+        WHERE id = new.id;
+    END
+    """
+]
+
+
+def install(bind=engine):
+    """data_version 테이블과 트리거 생성 (이미 있으면 그대로)"""
+    with bind.begin() as conn:
+        for sql in _DDL:
+            conn.execute(text(sql), {"epoch": uuid.uuid4().hex[:12]})
+
+
+def bump(bind=engine):
+    """버전을 직접 올림 (트리거가 없는 파생 테이블을 일괄 갱신한 뒤 호출)"""
+    with bind.begin() as conn:
+        conn.execute(text("UPDATE data_version SET version = version + 1 WHERE id = 1"))
+
+
+def read_version(db) -> Optional[str]:
+    """세션/연결에서 읽은 데이터 버전 (data_version 테이블이 없으면 None)
+
+    메모리 인덱스는 행을 읽기 전에 이 값을 기록해 둔다 (그 사이 바뀌었으면 다음 재구축이 따라옴).
+    """
+    exists = db.execute(
+        text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'data_version'")
+    ).first()
+    if not exists:
+        return None
+    return db.execute(text("SELECT epoch || '-' || version FROM data_version WHERE id = 1")).scalar()
+
+
+class DataVersion:
+    """DB 데이터 버전의 메모리 캐시 + 변경 알림"""
+
+    def __init__(self, ttl: float = DATA_VERSION_TTL, bind=read_engine):
+        self.ttl = ttl
+        self.bind = bind
+        self._value: Optional[str] = None
+        self._checked_at = 0.0
+        self._listeners: List[Callable[[], None]] = []
+        self._lock = threading.Lock()
+        # 알림 대기 표시 (재구축 중에 여러 번 바뀌어도 한 번 더 실행으로 합침)
+        self._pending = threading.Event()
+        self._notifier: Optional[threading.Thread] = None
+        self._poller: Optional[threading.Thread] = None
+
+    def current(self) -> str:
+        """현재 데이터 버전 (TTL 안에서는 DB를 읽지 않음)"""
+        if self._value is None or time.monotonic() - self._checked_at >= self.ttl:
+            self.refresh()
+        return self._value
+
+    def refresh(self):
+        """DB에서 버전을 다시 읽고, 바뀌었으면 구독자에게 알림"""
+        with self._lock:
+            with self.bind.connect() as conn:
+                epoch, version = conn.execute(
+                    text("SELECT epoch, version FROM data_version WHERE id = 1")
+                ).one()
+            value = f"{epoch}-{version}"
+            changed = self._value is not None and value != self._value
+            self._value = value
+            self._checked_at = time.monotonic()
+
+        if changed:
+            self._notify()
+
+    def _notify(self):
+        """구독자 호출을 알림 스레드에 맡김 (호출한 요청은 기다리지 않음)"""
+        self._pending.set()
+        with self._lock:
+            if self._notifier is None:
+                self._notifier = threading.Thread(
+                    target=self._run_listeners, name="data-version-notifier", daemon=True
+                )
+                self._notifier.start()
+
+    def _run_listeners(self):
+        while True:
+            self._pending.wait()
+            self._pending.clear()
+            for listener in list(self._listeners):
+                try:
+                    listener()
+                except Exception as e:
+                    print(f"데이터 버전 구독자 실패: {e}")
+
+    def invalidate(self):
+        """다음 current() 호출 때 DB에서 다시 읽도록 표시"""
+        self._checked_at = 0.0
+
+    def subscribe(self, listener: Callable[[], None]):
+        """버전이 바뀔 때 호출할 함수 등록 (메모리 인덱스 재구축 등)"""
+        self._listeners.append(listener)
+
+    def start(self, interval: float = None):
+        """TTL마다 버전을 확인하는 스레드 시작 (이미 시작했으면 그대로)"""
+        interval = self.ttl if interval is None else interval
+        if self._poller is not None:
+            return
+
+        def poll():
+            while True:
+                time.sleep(interval)
+                try:
+                    self.refresh()
+                except Exception as e:
+                    print(f"데이터 버전 확인 실패: {e}")
+
+        self._poller = threading.Thread(target=poll, name="data-version-poller", daemon=True)
+        self._poller.start()
+
+
+# 앱 전역 인스턴스
+data_version = DataVersion()
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_on_commit(session):
+    data_version.invalidate()
@@ -0,0 +1,79 @@
+"""NumPy 기반 일괄 Haversine 거리 계산
+
+crud.calculate_distance(스칼라 기준 구현)와 같은 공식을 배열 단위로 계산한다.
+후보 전체의 거리 계산 → 반경 마스크 → 거리순 정렬을 한 번의 호출로 처리.
+"""
+from typing import Sequence, Tuple
+
+import numpy as np
+
+
+EARTH_RADIUS_KM = 6371
+
+
+def haversine_many(lat: float, lng: float, lats, lngs) -> np.ndarray:
+    """기준점 (lat, lng)에서 각 좌표까지의 거리 배열 (km)"""
+    lats = np.asarray(lats, dtype=np.float64)
+    lngs = np.asarray(lngs, dtype=np.float64)
+
+    dlat = np.radians(lats - lat)
+    dlng = np.radians(lngs - lng)
+
+    a = (np.sin(dlat / 2) ** 2 +
+         np.cos(np.radians(lat)) * np.cos(np.radians(lats)) *
+         np.sin(dlng / 2) ** 2)
+
+    c = 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+
+    return EARTH_RADIUS_KM * c
+
+
+def haversine_matrix(lats0, lngs0, lats, lngs) -> np.ndarray:
+    """기준점 여러 개 × 좌표 여러 개의 거리 행렬 (km, shape = (기준점 수, 좌표 수))
+
+    haversine_many와 같은 식을 브로드캐스팅으로 계산한다.
+    """
+    lats0 = np.asarray(lats0, dtype=np.float64)[:, None]
+    lngs0 = np.asarray(lngs0, dtype=np.float64)[:, None]
+    lats = np.asarray(lats, dtype=np.float64)[None, :]
+    lngs = np.asarray(lngs, dtype=np.float64)[None, :]
+
+    dlat = np.radians(lats - lats0)
+    dlng = np.radians(lngs - lngs0)
+
+    a = (np.sin(dlat / 2) ** 2 +
+         np.cos(np.radians(lats0)) * np.cos(np.radians(lats)) *
+         np.sin(dlng / 2) ** 2)
+
+    c = 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+
+    return EARTH_RADIUS_KM * c
+
+
+def within_radius(
+    lat: float,
+    lng: float,
+    lats: Sequence[float],
+    lngs: Sequence[float],
+    radius_km: float,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """반경 안의 좌표를 거리순으로 반환
+
+    좌표가 없거나 0인 항목(None/NaN/0)은 제외한다 (crud의 `if pool.lat and pool.lng`와 동일).
+    거리가 같으면 입력 순서를 유지한다 (stable sort).
+
+    Returns:
+        (입력 배열 기준 인덱스, 해당 거리) — 둘 다 거리 오름차순
+    """
+    lats = np.asarray(lats, dtype=np.float64)
+    lngs = np.asarray(lngs, dtype=np.float64)
+    if lats.size == 0:
+        return np.empty(0, dtype=np.intp), np.empty(0, dtype=np.float64)
+
+    distances = haversine_many(lat, lng, lats, lngs)
+
+    valid = ~np.isnan(lats) & ~np.isnan(lngs) & (lats != 0) & (lngs != 0)
+    indices = np.flatnonzero(valid & (distances <= radius_km))
+    order = indices[np.argsort(distances[indices], kind="stable")]
+
+    return order, distances[order]
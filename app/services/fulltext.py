@@ -0,0 +1,223 @@
+"""수영장 이름/주소/비고 전문 검색 (SQLite FTS5, trigram 토크나이저)
+
+pools_fts는 swimming_pools를 content로 쓰는 external content 테이블이라 본문을 중복 저장하지 않는다.
+트리거가 swimming_pools의 INSERT/UPDATE/DELETE를 따라가므로
+API 밖(크롤러, llm_enricher의 sqlite3 직접 쓰기)의 변경도 색인에 반영됨.
+
+- trigram: 한글도 3글자 단위 부분 문자열로 색인 ("강남구" → "구민회관" 등 중간 일치 가능)
+- 3글자 미만 검색어("강남", "풀")는 trigram으로 찾을 수 없어 pools_bigram으로 처리:
+  이름/주소/비고의 위치마다 2글자 조각(끝 글자는 1글자)을 (gram, pool_id) 기본키로 저장하고
+  2글자는 gram 일치, 1글자는 gram 접두 범위로 찾는다 (같은 트리거로 동기화)
+  - 앞 MAX_BIGRAM_CHARS 글자까지만 색인 (실데이터 비고 최대 260자)
+  - 합성 10만 건(scripts/generate_pools.py): "강남"/"마포"/"송파" LIKE 전체 스캔 80~105ms → 3~6ms,
+    색인 크기 약 270만 행(+40MB). "수"처럼 거의 모든 행에 있는 1글자는 후보가 전체라 여전히 ~90ms
+- 순위: bm25 (이름 > 주소 > 비고 가중치)
+"""
+from typing import List, Tuple
+
+from sqlalchemy import text
+
+from database.connection import engine
+
+
+# bm25 열 가중치 (name, address, notes)
+BM25_WEIGHTS = (10.0, 3.0, 1.0)
+
+# trigram 토크나이저로 찾을 수 있는 최소 검색어 길이
+MIN_TRIGRAM_LEN = 3
+
+# pools_bigram에 색인하는 열당 최대 글자 수
+MAX_BIGRAM_CHARS = 1000
+
+# 한 행(new/old)의 2글자 조각 (공백으로 시작하는 조각 제외, 영문은 소문자)
+_GRAMS = """
+    SELECT DISTINCT lower(substr(cols.s, pos.n, 2)) AS gram
+    FROM (SELECT {row}.name AS s UNION ALL SELECT {row}.address UNION ALL SELECT {row}.notes) AS cols
+    JOIN pools_bigram_pos AS pos ON pos.n <= length(cols.s)
+    WHERE substr(cols.s, pos.n, 1) <> ' '
+"""
+
+_DDL = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS pools_fts USING fts5(
+        name, address, notes,
+        content='swimming_pools', content_rowid='id',
+        tokenize='trigram'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS swimming_pools_fts_insert
+    AFTER INSERT ON swimming_pools
+    BEGIN
+        INSERT INTO pools_fts (rowid, name, address, notes)
+        VALUES (new.id, new.name, new.address, new.notes);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS swimming_pools_fts_delete
+    AFTER DELETE ON swimming_pools
+    BEGIN
+        INSERT INTO pools_fts (pools_fts, rowid, name, address, notes)
+        VALUES ('delete', old.id, old.name, old.address, old.notes);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS swimming_pools_fts_update
+    AFTER UPDATE OF name, address, notes ON swimming_pools
+    BEGIN
+        INSERT INTO pools_fts (pools_fts, rowid, name, address, notes)
+        VALUES ('delete', old.id, old.name, old.address, old.notes);
+        INSERT INTO pools_fts (rowid, name, address, notes)
+        VALUES (new.id, new.name, new.address, new.notes);
+    END
+    """,
+    "CREATE TABLE IF NOT EXISTS pools_bigram_pos (n INTEGER PRIMARY KEY)",
+    """
+    CREATE TABLE IF NOT EXISTS pools_bigram (
+        gram TEXT NOT NULL,
+        pool_id INTEGER NOT NULL,
+        PRIMARY KEY (gram, pool_id)
+    ) WITHOUT ROWID
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS swimming_pools_bigram_insert
+    AFTER INSERT ON swimming_pools
+    BEGIN
+        INSERT OR IGNORE INTO pools_bigram (gram, pool_id)
+        SELECT gram, new.id FROM ({_GRAMS.format(row="new")});
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS swimming_pools_bigram_delete
+    AFTER DELETE ON swimming_pools
+    BEGIN
+        DELETE FROM pools_bigram
+        WHERE pool_id = old.id AND gram IN ({_GRAMS.format(row="old")});
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS swimming_pools_bigram_update
+    AFTER UPDATE OF name, address, notes ON swimming_pools
+    BEGIN
+        DELETE FROM pools_bigram
+        WHERE pool_id = old.id AND gram IN ({_GRAMS.format(row="old")});
+        INSERT OR IGNORE INTO pools_bigram (gram, pool_id)
+        SELECT gram, new.id FROM ({_GRAMS.format(row="new")});
+    END
+    """,
+]
+
+
+def install(bind=engine):
+    """pools_fts/pools_bigram 테이블과 동기화 트리거 생성 (새로 만든 경우 기존 행 색인)"""
+    with bind.begin() as conn:
+        existing = {
+            row[0] for row in conn.execute(text(
+                "SELECT name FROM sqlite_master WHERE type = 'table' AND name IN ('pools_fts', 'pools_bigram')"
+            ))
+        }
+        for sql in _DDL:
+            conn.execute(text(sql))
+        conn.execute(
+            text("""
+                WITH RECURSIVE seq(n) AS (SELECT 1 UNION ALL SELECT n + 1 FROM seq WHERE n < :max)
+                INSERT OR IGNORE INTO pools_bigram_pos (n) SELECT n FROM seq
+            """),
+            {"max": MAX_BIGRAM_CHARS},
+        )
+        if "pools_fts" not in existing:
+            conn.execute(text("INSERT INTO pools_fts (pools_fts) VALUES ('rebuild')"))
+        if "pools_bigram" not in existing:
+            conn.execute(text("""
+                INSERT OR IGNORE INTO pools_bigram (gram, pool_id)
+                SELECT lower(substr(cols.s, pos.n, 2)), cols.id
+                FROM (SELECT id, name AS s FROM swimming_pools
+                      UNION ALL SELECT id, address FROM swimming_pools
+                      UNION ALL SELECT id, notes FROM swimming_pools) AS cols
+                JOIN pools_bigram_pos AS pos ON pos.n <= length(cols.s)
+                WHERE substr(cols.s, pos.n, 1) <> ' '
+            """))
+
+
+def _quote(term: str) -> str:
+    """FTS5 문자열 리터럴 ("는 두 번)"""
+    return '"' + term.replace('"', '""') + '"'
+
+
+def _fold(term: str) -> str:
+    """SQLite lower()와 같은 대소문자 접기 (ASCII만)"""
+    return "".join(c.lower() if c.isascii() else c for c in term)
+
+
+def _gram_condition(i: int, term: str, params: dict) -> str:
+    """짧은 검색어 → pools_bigram 기본키로 찾는 id 조건 (2글자 일치, 1글자 접두 범위)"""
+    params[f"gram{i}"] = term = _fold(term)
+    if len(term) == 2:
+        grams = f"gram = :gram{i}"
+    else:
+        params[f"gram{i}_end"] = chr(ord(term) + 1)
+        grams = f"gram >= :gram{i} AND gram < :gram{i}_end"
+    return f"p.id IN (SELECT pool_id FROM pools_bigram WHERE {grams})"
+
+
+def _escape_like(term: str) -> str:
+    """LIKE 패턴 특수문자 이스케이프 (ESCAPE '\\')"""
+    return term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def build_query(terms: List[str], limit: int) -> Tuple[str, dict]:
+    """검색 단어(1개 이상) → (SQL, 파라미터)
+
+    3글자 이상 단어는 FTS5 MATCH, 짧은 단어는 pools_bigram으로 후보를 찾는다.
+    긴 단어가 있으면 짧은 단어는 FTS 후보에만 LIKE로 확인한다.
+    """
+    long_terms = [t for t in terms if len(t) >= MIN_TRIGRAM_LEN]
+    short_terms = [t for t in terms if len(t) < MIN_TRIGRAM_LEN]
+
+    params = {"limit": limit}
+    likes = []
+    for i, term in enumerate(short_terms):
+        params[f"like{i}"] = f"%{_escape_like(term)}%"
+        likes.append(
+            f"(p.name LIKE :like{i} ESCAPE '\\' OR p.address LIKE :like{i} ESCAPE '\\'"
+            f" OR p.notes LIKE :like{i} ESCAPE '\\')"
+        )
+
+    if long_terms:
+        params["match"] = " ".join(_quote(t) for t in long_terms)
+        weights = ", ".join(str(w) for w in BM25_WEIGHTS)
+        sql = f"""
+            SELECT p.id, bm25(pools_fts, {weights}) AS score
+            FROM pools_fts JOIN swimming_pools p ON p.id = pools_fts.rowid
+            WHERE pools_fts MATCH :match AND p.is_active = 1
+            {''.join(' AND ' + like for like in likes)}
+            ORDER BY score, p.id
+            LIMIT :limit
+        """
+    else:
+        # 짧은 검색어만: 이름 시작 일치 > 이름 포함 > 주소/비고 포함
+        params["prefix"] = f"{_escape_like(short_terms[0])}%"
+        grams = [_gram_condition(i, term, params) for i, term in enumerate(short_terms)]
+        sql = f"""
+            SELECT p.id,
+                   CASE WHEN p.name LIKE :prefix ESCAPE '\\' THEN 0
+                        WHEN p.name LIKE :like0 ESCAPE '\\' THEN 1
+                        ELSE 2 END AS score
+            FROM swimming_pools p
+            WHERE p.is_active = 1 AND {' AND '.join(grams)}
+            ORDER BY score, p.id
+            LIMIT :limit
+        """
+    return sql, params
+
+
+def search_ids(conn, q: str, limit: int) -> List[Tuple[int, float]]:
+    """검색어에 맞는 활성 수영장 (id, 점수) — 점수가 작을수록 관련도 높음
+
+    공백으로 나눈 단어를 모두 포함해야 일치 (AND).
+    """
+    terms = q.split()
+    if not terms:
+        return []
+    sql, params = build_query(terms, limit)
+    return [(row[0], float(row[1])) for row in conn.execute(text(sql), params)]
@@ -0,0 +1,98 @@
+"""지도 마커용 컬럼형(columnar) 데이터셋
+
+첫 지도 로드에 필요한 값(id, 이름, 좌표, 오늘 가격, 오늘 자유수영 여부)만
+평행 배열로 묶어 JSON 바이트로 미리 만들어 둔다.
+(데이터 버전, 요일)별로 한 번만 만들고 이후에는 메모리에서 그대로 응답.
+"""
+import json
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.crud.swimming_pool import extract_free_swim_price
+from app.models.swimming_pool import FreeSwimSession, SwimmingPool
+
+
+KST = timezone(timedelta(hours=9))
+WEEKDAYS = ["월", "화", "수", "목", "금", "토", "일"]
+
+
+def today() -> str:
+    """한국 시간 기준 오늘 요일 ("월"~"일")"""
+    return WEEKDAYS[datetime.now(KST).weekday()]
+
+
+def build_markers(db: Session, day: str) -> dict:
+    """활성 수영장의 마커 데이터를 컬럼형으로 구성
+
+    prices: 자유수영 성인 가격 (주말이면 주말 가격, 없으면 평일 가격)
+    free_swim: 해당 요일에 자유수영 세션이 있으면 1
+    """
+    rows = db.query(
+        SwimmingPool.id, SwimmingPool.name, SwimmingPool.lat, SwimmingPool.lng, SwimmingPool.pricing
+    ).filter(
+        SwimmingPool.is_active == True,
+        SwimmingPool.lat.isnot(None),
+        SwimmingPool.lng.isnot(None),
+    ).order_by(SwimmingPool.id).all()
+
+    free_swim_ids = set(db.scalars(
+        select(FreeSwimSession.pool_id).where(FreeSwimSession.day == day).distinct()
+    ))
+    return columnar_markers(rows, free_swim_ids, day)
+
+
+def columnar_markers(rows, free_swim_ids, day: str) -> dict:
+    """(id, 이름, 위도, 경도, pricing) 행(ID순) → 컬럼형 마커 데이터"""
+    weekend = day in ("토", "일")
+    markers = {"day": day, "ids": [], "names": [], "lats": [], "lngs": [], "prices": [], "free_swim": []}
+    for pool_id, name, lat, lng, pricing in rows:
+        price = extract_free_swim_price(pricing)
+        if weekend:
+            weekend_price = extract_free_swim_price(pricing, "주말")
+            if weekend_price is not None:  # 주말 무료(0원)도 주말 가격
+                price = weekend_price
+        markers["ids"].append(pool_id)
+        markers["names"].append(name)
+        markers["lats"].append(lat)
+        markers["lngs"].append(lng)
+        markers["prices"].append(price)
+        markers["free_swim"].append(1 if pool_id in free_swim_ids else 0)
+
+    return markers
+
+
+def encode_markers(markers: dict, version: str) -> bytes:
+    markers["version"] = version
+    return json.dumps(markers, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+class MarkerCache:
+    """(데이터 버전, 요일) → 인코딩된 마커 JSON 바이트 (최신 버전만 보관)"""
+
+    def __init__(self):
+        self._entries: Dict[Tuple[str, str], bytes] = {}
+        self._lock = threading.Lock()
+
+    def get(self, db: Session, version: str, day: str) -> bytes:
+        key = (version, day)
+        payload = self._entries.get(key)
+        if payload is not None:
+            return payload
+
+        with self._lock:
+            payload = self._entries.get(key)
+            if payload is None:
+                payload = encode_markers(build_markers(db, day), version)
+                self._entries = {
+                    k: v for k, v in self._entries.items() if k[0] == version
+                }
+                self._entries[key] = payload
+        return payload
+
+
+# 앱 전역 인스턴스
+marker_cache = MarkerCache()
@@ -0,0 +1,354 @@
+"""메모리 스냅샷 서빙 모드 (SERVE_SNAPSHOT=1)
+
+데이터가 작고 변경이 드물어서, 한 데이터 버전의 수영장 전체를 메모리에 올려두고
+모든 조회 엔드포인트를 DB 없이 응답한다.
+
+- PoolSnapshot: 한 버전의 불변 데이터 (ORM 객체는 세션에서 분리, JSON 컬럼은 이미 파싱됨)
+  + ID/가격/이름 정렬 목록, 격자 공간 인덱스, 자유수영 세션·지하철역 필터용 행,
+    클러스터 격자, 메모리 SQLite FTS5 색인 (DB와 같은 bm25 순위)
+- SnapshotStore: data_version 스레드가 DATA_VERSION_TTL마다 버전을 확인하고,
+  바뀌면 새 스냅샷을 다 만든 뒤 참조 하나만 교체 → 요청은 항상 완성된 스냅샷 하나를 봄
+- 응답 ETag도 스냅샷 버전 기준 (새 스냅샷이 준비되기 전에는 이전 버전 ETag)
+
+필터/정렬/페이지 의미는 crud.swimming_pool과 같다.
+"""
+import bisect
+import math
+import os
+import threading
+from itertools import islice
+from typing import Callable, Dict, FrozenSet, List, Optional, Tuple
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.pool import StaticPool
+
+from app.crud.swimming_pool import parse_minutes, price_sort_key
+from app.models.swimming_pool import FreeSwimSession, PoolStation, SwimmingPool
+from app.services import distance as distance_engine, fulltext
+from app.services.clusters import ClusterIndex
+from app.services.data_version import data_version
+from app.services.markers import columnar_markers, encode_markers
+from app.services.spatial_index import SpatialIndex
+from app.services.stations import STATION_RADIUS_M, normalize_line
+
+
+SERVE_SNAPSHOT = os.getenv("SERVE_SNAPSHOT", "0").lower() in ("1", "true", "yes")
+
+Filter = Optional[Callable[[SwimmingPool], bool]]
+
+
+def _take(pools, limit: int) -> list:
+    """SQL LIMIT과 같은 의미 (음수면 제한 없음)"""
+    return list(pools) if limit < 0 else list(islice(pools, limit))
+
+
+def _name_key(pool: SwimmingPool) -> tuple:
+    """이름순 정렬 키 (SQL처럼 NULL이 먼저, 문자열은 코드포인트 = UTF-8 바이트 순)"""
+    return pool.name is not None, pool.name or "", pool.id
+
+
+class PoolSnapshot:
+    """한 데이터 버전의 수영장 전체 (생성 후 변경하지 않음)"""
+
+    def __init__(self, db: Session, version: str):
+        self.version = version
+
+        pools = db.query(SwimmingPool).options(
+            selectinload(SwimmingPool.nearest_station_row)
+        ).order_by(SwimmingPool.id).all()
+        # JSON null('null')과 SQL NULL 구분 (has_free_swim 필터는 SQL NULL 기준)
+        null_schedule = frozenset(db.scalars(
+            text("SELECT id FROM swimming_pools WHERE free_swim_schedule IS NULL")
+        ))
+        sessions = db.query(
+            FreeSwimSession.pool_id, FreeSwimSession.day,
+            FreeSwimSession.start_minute, FreeSwimSession.end_minute,
+        ).all()
+        stations = db.query(PoolStation.pool_id, PoolStation.line, PoolStation.distance_m).all()
+        db.expunge_all()
+
+        self.pools: Tuple[SwimmingPool, ...] = tuple(pools)
+        self.by_id: Dict[int, SwimmingPool] = {pool.id: pool for pool in pools}
+        self.null_schedule = null_schedule
+
+        price = lambda pool: pool.free_swim_adult_weekday_price
+        self.priced = tuple(sorted((p for p in pools if price(p) is not None), key=lambda p: (price(p), p.id)))
+        self.priced_keys = [(price(p), p.id) for p in self.priced]
+        self.unpriced = tuple(p for p in pools if price(p) is None)
+        self.unpriced_ids = [p.id for p in self.unpriced]
+        self.by_name = tuple(sorted(pools, key=_name_key))
+        self.name_keys = [_name_key(p) for p in self.by_name]
+        self.ids = [p.id for p in pools]
+
+        # 요일 → (pool_id, 시작 분, 종료 분)
+        self.sessions: Dict[str, List[Tuple[int, int, int]]] = {}
+        for pool_id, day, start, end in sessions:
+            self.sessions.setdefault(day, []).append((pool_id, start, end))
+        self.stations = stations
+
+        located = [p for p in pools if p.is_active and p.lat is not None and p.lng is not None]
+        self.spatial = SpatialIndex()
+        self.spatial.load([(p.id, p.lat, p.lng) for p in located])
+        self.clusters = ClusterIndex([
+            (p.id, p.name, p.lat, p.lng, p.free_swim_adult_weekday_price) for p in located
+        ])
+        self._marker_rows = [(p.id, p.name, p.lat, p.lng, p.pricing) for p in located]
+        self._markers: Dict[str, bytes] = {}
+
+        self._fts = self._build_fts(pools)
+        self._fts_lock = threading.Lock()
+
+        # 필터용 ID 집합 캐시 (스냅샷 데이터에서 계산되는 값이라 교체 시 함께 버려짐)
+        self._id_sets: Dict[tuple, FrozenSet[int]] = {}
+
+    @staticmethod
+    def _build_fts(pools):
+        """검색용 메모리 SQLite (이름/주소/비고 + pools_fts, 디스크 I/O 없음)"""
+        fts = create_engine(
+            "sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False}
+        )
+        with fts.begin() as conn:
+            conn.execute(text(
+                "CREATE TABLE swimming_pools ("
+                "id INTEGER PRIMARY KEY, name TEXT, address TEXT, notes TEXT, is_active BOOLEAN)"
+            ))
+            conn.execute(
+                text("INSERT INTO swimming_pools VALUES (:id, :name, :address, :notes, :is_active)"),
+                [
+                    {"id": p.id, "name": p.name, "address": p.address, "notes": p.notes, "is_active": p.is_active}
+                    for p in pools
+                ],
+            )
+        # 행을 먼저 넣고 색인은 install에서 한 번에 (행마다 트리거보다 빠름)
+        fulltext.install(fts)
+        return fts
+
+    # ── 필터 ──
+
+    def _session_ids(self, day: str, minute: Optional[int]) -> FrozenSet[int]:
+        key = ("session", day, minute)
+        ids = self._id_sets.get(key)
+        if ids is None:
+            ids = self._id_sets[key] = frozenset(
+                pool_id for pool_id, start, end in self.sessions.get(day, ())
+                if minute is None or start <= minute <= end
+            )
+        return ids
+
+    def _station_ids(self, line: Optional[str], max_m: int) -> FrozenSet[int]:
+        key = ("station", line, max_m)
+        ids = self._id_sets.get(key)
+        if ids is None:
+            ids = self._id_sets[key] = frozenset(
+                pool_id for pool_id, station_line, distance_m in self.stations
+                if distance_m <= max_m and (line is None or station_line == line)
+            )
+        return ids
+
+    def _filter(
+        self,
+        has_free_swim: Optional[bool] = None,
+        min_price: Optional[int] = None,
+        max_price: Optional[int] = None,
+        day: Optional[str] = None,
+        time: Optional[str] = None,
+        near_line: Optional[str] = None,
+        max_station_m: Optional[int] = None,
+        source: Optional[str] = None,
+        nearby: bool = False,
+    ) -> Filter:
+        """crud._apply_filters(nearby=True면 _filter_nearby)와 같은 조건의 판정 함수 (조건 없으면 None)"""
+        checks = []
+        if source:
+            checks.append(lambda p: p.source == source)
+        if has_free_swim is not None and (has_free_swim or not nearby):
+            nulls = self.null_schedule
+            checks.append(lambda p: (p.id not in nulls) == has_free_swim)
+        if min_price is not None:
+            checks.append(lambda p: p.free_swim_adult_weekday_price is not None
+                          and p.free_swim_adult_weekday_price >= min_price)
+        if max_price is not None:
+            checks.append(lambda p: p.free_swim_adult_weekday_price is not None
+                          and p.free_swim_adult_weekday_price <= max_price)
+        if day:
+            minute = None
+            if time:
+                minute = parse_minutes(time)
+                if minute is None:
+                    return lambda p: False
+            sessions = self._session_ids(day, minute)
+            checks.append(lambda p: p.id in sessions)
+        near_line = normalize_line(near_line)
+        if near_line is not None or max_station_m is not None:
+            stations = self._station_ids(near_line, min(max_station_m or STATION_RADIUS_M, STATION_RADIUS_M))
+            checks.append(lambda p: p.id in stations)
+
+        if not checks:
+            return None
+        if len(checks) == 1:
+            return checks[0]
+        return lambda p: all(check(p) for check in checks)
+
+    # ── 조회 (crud.swimming_pool 대응) ──
+
+    def get(self, pool_id: int) -> Optional[SwimmingPool]:
+        return self.by_id.get(pool_id)
+
+    def list_pools(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        sort: Optional[str] = None,
+        after: Optional[dict] = None,
+        **filters,
+    ) -> List[SwimmingPool]:
+        """get_swimming_pools와 같은 결과 (비활성 포함, keyset/offset 페이지)"""
+        ok = self._filter(**filters)
+        ordered = self._ordered_after(sort, after)
+        if ok is not None:
+            ordered = filter(ok, ordered)
+        if after is None and skip > 0:
+            ordered = islice(ordered, skip, None)
+        return _take(ordered, limit)
+
+    def _ordered_after(self, sort: Optional[str], after: Optional[dict]):
+        """정렬 순서대로 after 다음 위치부터의 수영장 (after가 None이면 처음부터)"""
+        if sort == "price":
+            if after is None:
+                return (*self.priced, *self.unpriced)
+            if after["price"] is not None:
+                start = bisect.bisect_right(self.priced_keys, (after["price"], after["id"]))
+                return (*self.priced[start:], *self.unpriced)
+            return self.unpriced[bisect.bisect_right(self.unpriced_ids, after["id"]):]
+        if sort == "name":
+            if after is None:
+                return self.by_name
+            return self.by_name[bisect.bisect_right(self.name_keys, (True, after["name"], after["id"])):]
+        if after is None:
+            return self.pools
+        return self.pools[bisect.bisect_right(self.ids, after["id"]):]
+
+    def in_bounds(
+        self,
+        south: float,
+        west: float,
+        north: float,
+        east: float,
+        limit: int = 500,
+        after: Optional[dict] = None,
+        **filters,
+    ) -> List[SwimmingPool]:
+        """get_pools_in_bounds와 같은 결과 (활성, ID순 keyset 페이지)"""
+        ok = self._filter(**filters)
+        last_id = after["id"] if after else 0
+        pools = (
+            self.by_id[pool_id]
+            for pool_id in sorted(c[0] for c in self.spatial.query_bbox(south, north, west, east))
+            if pool_id > last_id
+        )
+        if ok is not None:
+            pools = filter(ok, pools)
+        return _take(pools, limit)
+
+    def nearby(
+        self,
+        lat: float,
+        lng: float,
+        radius_km: float = 5.0,
+        sort: Optional[str] = None,
+        **filters,
+    ) -> List[Tuple[SwimmingPool, float]]:
+        """search_nearby_pools와 같은 결과 ((수영장, 거리) 목록, 거리순 또는 가격순)"""
+        ok = self._filter(nearby=True, **filters)
+        lat_range = radius_km / 111.0
+        lng_range = radius_km / (111.0 * math.cos(math.radians(lat)))
+        candidates = sorted(self.spatial.query_bbox(lat - lat_range, lat + lat_range, lng - lng_range, lng + lng_range))
+        order, dists = distance_engine.within_radius(
+            lat, lng, [c[1] for c in candidates], [c[2] for c in candidates], radius_km
+        )
+
+        results = []
+        for i, d in zip(order.tolist(), dists.tolist()):
+            pool = self.by_id[candidates[i][0]]
+            if ok is None or ok(pool):
+                results.append((pool, d))
+
+        if sort == "price":
+            results.sort(key=lambda r: price_sort_key(r[0]))
+        return results
+
+    def nearest(self, lat: float, lng: float, k: int = 10, **filters) -> List[Tuple[SwimmingPool, float]]:
+        """find_nearest_pools와 같은 결과 (가까운 k개, 거리순)"""
+        if k <= 0:
+            return []
+        ok = self._filter(nearby=True, **filters)
+
+        found = []  # (거리, id)
+        for candidates, outside_km in self.spatial.iter_rings(lat, lng):
+            if candidates:
+                order, dists = distance_engine.within_radius(
+                    lat, lng, [c[1] for c in candidates], [c[2] for c in candidates], math.inf
+                )
+                for i, d in zip(order.tolist(), dists.tolist()):
+                    pool_id = candidates[i][0]
+                    if ok is None or ok(self.by_id[pool_id]):
+                        found.append((d, pool_id))
+                found.sort()
+            if len(found) >= k and found[k - 1][0] <= outside_km:
+                break
+
+        return [(self.by_id[pool_id], d) for d, pool_id in found[:k]]
+
+    def search_text(self, q: str, limit: int = 20) -> List[SwimmingPool]:
+        """search_pools_by_text와 같은 결과 (관련도순)"""
+        with self._fts_lock, self._fts.connect() as conn:
+            ranked = fulltext.search_ids(conn, q, limit)
+        return [self.by_id[pool_id] for pool_id, _ in ranked if pool_id in self.by_id]
+
+    def markers(self, day: str) -> bytes:
+        """요일별 마커 JSON 바이트 (MarkerCache와 같은 형식)"""
+        payload = self._markers.get(day)
+        if payload is None:
+            free_swim_ids = self._session_ids(day, None)
+            payload = self._markers[day] = encode_markers(
+                columnar_markers(self._marker_rows, free_swim_ids, day), self.version
+            )
+        return payload
+
+
+class SnapshotStore:
+    """현재 스냅샷 참조 + 버전 변경 시 교체"""
+
+    def __init__(self, enabled: bool = SERVE_SNAPSHOT):
+        self.enabled = enabled
+        self._snapshot: Optional[PoolSnapshot] = None
+        self._build_lock = threading.Lock()
+
+    def current(self) -> PoolSnapshot:
+        return self._snapshot
+
+    def rebuild(self, session_factory: Callable[[], Session]):
+        """현재 DB 버전으로 새 스냅샷을 만든 뒤 교체 (이미 같은 버전이면 그대로)"""
+        with self._build_lock:
+            db = session_factory()
+            try:
+                version = db.execute(
+                    text("SELECT epoch || '-' || version FROM data_version WHERE id = 1")
+                ).scalar_one()
+                if self._snapshot is not None and self._snapshot.version == version:
+                    return
+                snapshot = PoolSnapshot(db, version)
+            finally:
+                db.close()
+            self._snapshot = snapshot
+
+    def start(self, session_factory: Callable[[], Session]):
+        """첫 스냅샷을 만들고 버전이 바뀌면 교체 (버전 확인은 data_version 스레드, 요청 경로에서는 DB를 읽지 않음)"""
+        self.rebuild(session_factory)
+        data_version.subscribe(lambda: self.rebuild(session_factory))
+        data_version.start()
+
+
+# 앱 전역 인스턴스
+snapshot_store = SnapshotStore()
@@ -0,0 +1,191 @@
+"""수영장 좌표 격자(grid) 공간 인덱스
+
+위도/경도를 cell_deg 크기의 격자로 나누어 수영장 ID를 메모리에 보관한다.
+반경 검색 시 SQL 전체 bbox 스캔 대신 bbox에 걸치는 셀만 훑어서 후보 ID를 얻는다.
+
+- 앱 시작 시 rebuild()로 DB에서 한 번 적재
+- crud의 생성/수정 함수가 커밋 후 add()로 갱신
+- version: 인덱스가 반영한 데이터 버전 (ETag용, add/remove 후에는 이 프로세스만의 새 값)
+- 프로세스(워커)마다 별도 인스턴스를 가짐
+"""
+import math
+import threading
+import uuid
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.models.swimming_pool import SwimmingPool
+from app.services.data_version import read_version
+from app.services.distance import EARTH_RADIUS_KM
+
+
+# 셀 크기 (도 단위, 약 5.5km x 4.4km @ 서울)
+DEFAULT_CELL_DEG = 0.05
+
+
+class SpatialIndex:
+    """활성 수영장의 (id, lat, lng)를 격자 셀 단위로 보관하는 인덱스"""
+
+    def __init__(self, cell_deg: float = DEFAULT_CELL_DEG):
+        self.cell_deg = cell_deg
+        self.ready = False
+        self.version: Optional[str] = None
+        self._cells: Dict[Tuple[int, int], Dict[int, Tuple[float, float]]] = {}
+        self._points: Dict[int, Tuple[float, float]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._points)
+
+    def _cell_of(self, lat: float, lng: float) -> Tuple[int, int]:
+        return math.floor(lat / self.cell_deg), math.floor(lng / self.cell_deg)
+
+    def rebuild(self, db: Session):
+        """DB의 활성 수영장 좌표로 인덱스 전체 재구성"""
+        version = read_version(db)
+        rows = db.query(SwimmingPool.id, SwimmingPool.lat, SwimmingPool.lng).filter(
+            SwimmingPool.is_active == True,
+            SwimmingPool.lat.isnot(None),
+            SwimmingPool.lng.isnot(None),
+        ).all()
+        self.load(rows, version)
+
+    def load(self, rows, version: Optional[str] = None):
+        """(id, lat, lng) 목록으로 인덱스 전체 재구성"""
+        cells: Dict[Tuple[int, int], Dict[int, Tuple[float, float]]] = {}
+        points: Dict[int, Tuple[float, float]] = {}
+        for pool_id, lat, lng in rows:
+            points[pool_id] = (lat, lng)
+            cells.setdefault(self._cell_of(lat, lng), {})[pool_id] = (lat, lng)
+
+        with self._lock:
+            self._cells = cells
+            self._points = points
+            self.version = version
+            self.ready = True
+
+    def add(self, pool: SwimmingPool):
+        """수영장 추가/갱신 (비활성이거나 좌표가 없으면 제거)"""
+        if not pool.is_active or pool.lat is None or pool.lng is None:
+            self.remove(pool.id)
+            return
+
+        with self._lock:
+            self._discard(pool.id)
+            self._touch()
+            self._points[pool.id] = (pool.lat, pool.lng)
+            self._cells.setdefault(self._cell_of(pool.lat, pool.lng), {})[pool.id] = (pool.lat, pool.lng)
+
+    def remove(self, pool_id: int):
+        with self._lock:
+            self._discard(pool_id)
+            self._touch()
+
+    def _touch(self):
+        """증분 갱신 후 버전: 다른 워커와 겹치지 않는 값 (다음 재구축 때 DB 버전으로 돌아감)"""
+        self.version = f"{self.version}+{uuid.uuid4().hex[:8]}"
+
+    def _discard(self, pool_id: int):
+        point = self._points.pop(pool_id, None)
+        if point is None:
+            return
+        cell_key = self._cell_of(*point)
+        cell = self._cells.get(cell_key)
+        if cell is not None:
+            cell.pop(pool_id, None)
+            if not cell:
+                del self._cells[cell_key]
+
+    def query_bbox(
+        self, lat_min: float, lat_max: float, lng_min: float, lng_max: float
+    ) -> List[Tuple[int, float, float]]:
+        """bbox 안의 (id, lat, lng) 목록 (경계 포함, SQL BETWEEN과 동일)"""
+        row_min, col_min = self._cell_of(lat_min, lng_min)
+        row_max, col_max = self._cell_of(lat_max, lng_max)
+
+        results = []
+        with self._lock:
+            # bbox가 넓어 셀 수가 채워진 셀보다 많으면 채워진 셀만 순회
+            if (row_max - row_min + 1) * (col_max - col_min + 1) > len(self._cells):
+                cells = [
+                    cell for (row, col), cell in self._cells.items()
+                    if row_min <= row <= row_max and col_min <= col <= col_max
+                ]
+            else:
+                cells = [
+                    self._cells[(row, col)]
+                    for row in range(row_min, row_max + 1)
+                    for col in range(col_min, col_max + 1)
+                    if (row, col) in self._cells
+                ]
+
+            for cell in cells:
+                for pool_id, (lat, lng) in cell.items():
+                    if lat_min <= lat <= lat_max and lng_min <= lng <= lng_max:
+                        results.append((pool_id, lat, lng))
+
+        return results
+
+    def iter_rings(
+        self, lat: float, lng: float
+    ) -> Iterator[Tuple[List[Tuple[int, float, float]], float]]:
+        """기준점 셀에서 바깥으로 한 겹(ring)씩 넓혀가며 (id, lat, lng) 목록을 반환
+
+        각 단계마다 (이번 ring의 좌표 목록, 아직 반환하지 않은 좌표까지의 최소 거리 km)를 낸다.
+        kNN 검색은 k번째 거리가 이 최소 거리 이하가 되면 멈추면 된다.
+        ring의 셀 수가 채워진 셀 수보다 많아지면 남은 좌표를 한 번에 반환하고 끝낸다.
+        """
+        row0, col0 = self._cell_of(lat, lng)
+        ring = 0
+        while True:
+            with self._lock:
+                last = ring > 0 and 8 * ring > len(self._cells)
+                if last:
+                    points = [
+                        (pool_id, plat, plng)
+                        for (row, col), cell in self._cells.items()
+                        if max(abs(row - row0), abs(col - col0)) >= ring
+                        for pool_id, (plat, plng) in cell.items()
+                    ]
+                else:
+                    points = self._ring_points(row0, col0, ring)
+
+            if last:
+                yield points, math.inf
+                return
+            yield points, self._outside_distance(lat, lng, row0, col0, ring)
+            ring += 1
+
+    def _ring_points(self, row0: int, col0: int, ring: int) -> List[Tuple[int, float, float]]:
+        """중심 셀에서 체비셰프 거리가 정확히 ring인 셀들의 좌표 (lock 안에서 호출)"""
+        points = []
+        for row in range(row0 - ring, row0 + ring + 1):
+            # 위/아래 변은 전체, 나머지 행은 좌우 끝 셀만
+            step = 1 if row in (row0 - ring, row0 + ring) else 2 * ring
+            for col in range(col0 - ring, col0 + ring + 1, step):
+                cell = self._cells.get((row, col))
+                if cell:
+                    points.extend((pool_id, lat, lng) for pool_id, (lat, lng) in cell.items())
+        return points
+
+    def _outside_distance(self, lat: float, lng: float, row0: int, col0: int, ring: int) -> float:
+        """ring까지 덮은 사각형 밖의 점까지의 최소 거리 (km, 보수적 하한)"""
+        lat_lo = (row0 - ring) * self.cell_deg
+        lat_hi = (row0 + ring + 1) * self.cell_deg
+        dlat = min(lat - lat_lo, lat_hi - lat)
+        dlng = min(lng - (col0 - ring) * self.cell_deg, (col0 + ring + 1) * self.cell_deg - lng)
+
+        # 위도 방향: 자오선 거리 이상
+        by_lat = EARTH_RADIUS_KM * math.radians(dlat)
+        # 경도 방향: 덮은 위도 범위 안에서 cos(위도)가 가장 작은 경우 기준
+        cos_min = max(0.0, min(math.cos(math.radians(max(-90.0, lat_lo))),
+                               math.cos(math.radians(min(90.0, lat_hi)))))
+        sin_half = math.sqrt(math.cos(math.radians(lat)) * cos_min) * math.sin(math.radians(dlng) / 2)
+        by_lng = 2 * EARTH_RADIUS_KM * math.asin(min(1.0, sin_half))
+
+        return min(by_lat, by_lng)
+
+
+# 앱 전역 인스턴스
+spatial_index = SpatialIndex()
@@ -0,0 +1,118 @@
+"""수영장 ↔ 지하철역 근접 계산 (격자 공간 조인)
+
+frontend/data/subway_lines.json의 역 좌표를 반경 크기의 격자 셀에 담아두고,
+수영장마다 자기 셀과 주변 8개 셀의 역만 거리 계산한다 (수영장 수 × 역 수 반복 없음).
+
+- STATION_RADIUS_M 안의 (역, 호선)은 모두 저장 → near_line / max_station_m 필터용
+- 가장 가까운 역은 반경 밖이어도 rank=1로 저장 → 응답의 nearest_station
+"""
+import json
+import math
+import os
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from app.services.distance import haversine_many
+
+
+SUBWAY_LINES_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    "frontend", "data", "subway_lines.json",
+)
+
+# 저장할 최대 도보 반경 (m) — max_station_m 필터의 상한
+STATION_RADIUS_M = 2000
+
+# 위도 1도 거리 (m, 셀 크기 계산용 — 약간 작게 잡아 셀이 반경보다 크도록)
+METERS_PER_DEG = 110_000
+
+
+class Station(NamedTuple):
+    name: str
+    line: str
+    lat: float
+    lng: float
+
+
+def normalize_line(line: Optional[str]) -> Optional[str]:
+    """"2호선" / "2" → "2" """
+    if line is None:
+        return None
+    line = line.strip()
+    return line[:-2] if line.endswith("호선") else line
+
+
+@lru_cache(maxsize=None)
+def load_stations(path: str = SUBWAY_LINES_PATH) -> Tuple[Station, ...]:
+    """subway_lines.json의 모든 (역, 호선) — 환승역은 호선마다 한 번씩"""
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    return tuple(
+        Station(station["name"], str(line["number"]), station["lat"], station["lng"])
+        for line in data["lines"]
+        for station in line["stations"]
+    )
+
+
+class StationJoin:
+    """역 격자 인덱스 — 좌표 하나에 대한 주변 역 행을 계산"""
+
+    def __init__(self, stations: Tuple[Station, ...], radius_m: int = STATION_RADIUS_M):
+        self.stations = stations
+        self.radius_m = radius_m
+        self.lats = np.array([s.lat for s in stations], dtype=np.float64)
+        self.lngs = np.array([s.lng for s in stations], dtype=np.float64)
+
+        # 반경 안의 역은 항상 주변 3x3 셀에 들어오도록 셀 크기를 잡음
+        self.lat_deg = radius_m / METERS_PER_DEG
+        max_lat = min(89.0, float(np.abs(self.lats).max(initial=0.0)) + self.lat_deg)
+        self.lng_deg = radius_m / (METERS_PER_DEG * math.cos(math.radians(max_lat)))
+
+        self._cells: Dict[Tuple[int, int], List[int]] = {}
+        for i, station in enumerate(stations):
+            self._cells.setdefault(self._cell_of(station.lat, station.lng), []).append(i)
+
+    def _cell_of(self, lat: float, lng: float) -> Tuple[int, int]:
+        return math.floor(lat / self.lat_deg), math.floor(lng / self.lng_deg)
+
+    def rows_for(self, lat: Optional[float], lng: Optional[float]) -> List[dict]:
+        """좌표 주변 역 행 [{"station", "line", "distance_m", "rank"}] (거리순)"""
+        if not lat or not lng or not self.stations:
+            return []
+
+        row, col = self._cell_of(lat, lng)
+        candidates = [
+            i
+            for r in (row - 1, row, row + 1)
+            for c in (col - 1, col, col + 1)
+            for i in self._cells.get((r, c), ())
+        ]
+        found = []
+        if candidates:
+            dists = haversine_many(lat, lng, self.lats[candidates], self.lngs[candidates]) * 1000
+            found = [(d, i) for i, d in zip(candidates, dists.tolist()) if d <= self.radius_m]
+
+        if not found:
+            # 반경 안에 역이 없으면 전체 중 가장 가까운 역 하나
+            dists = haversine_many(lat, lng, self.lats, self.lngs) * 1000
+            nearest = int(np.argmin(dists))
+            found = [(float(dists[nearest]), nearest)]
+
+        found.sort(key=lambda item: (item[0], self.stations[item[1]].line, self.stations[item[1]].name))
+        return [
+            {
+                "station": self.stations[i].name,
+                "line": self.stations[i].line,
+                "distance_m": round(d),
+                "rank": rank,
+            }
+            for rank, (d, i) in enumerate(found, start=1)
+        ]
+
+
+@lru_cache(maxsize=None)
+def station_join() -> StationJoin:
+    """subway_lines.json 기준 StationJoin (프로세스당 한 번 생성)"""
+    return StationJoin(load_stations())
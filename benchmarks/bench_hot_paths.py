@@ -0,0 +1,300 @@
+# -*- coding: utf-8 -*-
+"""
+검색/필터 핫 패스 벤치마크 (수영장 1k / 10k / 100k)
+
+규모마다 새 SQLite DB에 합성 수영장(scripts/generate_pools.py)을 채운 뒤 다음을 측정한다.
+  - get_swimming_pools: 출처/자유수영 유무/가격/요일·시간/지하철역 필터 × 정렬의 모든 조합
+  - search_nearby_pools: 반경 × 가격/자유수영 유무/요일·시간/지하철역 필터 × 정렬의 모든 조합
+  - is_time_in_schedule, _get_free_swim_price: 전체 수영장에 대한 호출 1회당 시간
+  - /api/pools/nearby: 앱 전체(미들웨어, 직렬화 포함) 요청 처리
+
+DB 엔진은 import 시점의 DATABASE_URL로 만들어지므로 규모마다 하위 프로세스로 실행.
+결과는 --output JSON 파일로 남기고, --compare로 이전 결과와 비교해 느려진 항목을 찾는다
+(--threshold 배 이상 느려진 항목이 있으면 종료 코드 1).
+
+사용법:
+  python benchmarks/bench_hot_paths.py                              # 1k, 10k, 100k
+  python benchmarks/bench_hot_paths.py --sizes 1000 10000 --repeat 10
+  python benchmarks/bench_hot_paths.py --output before.json
+  python benchmarks/bench_hot_paths.py --output after.json --compare before.json --threshold 1.2
+"""
+import sys
+import os
+import io
+sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', line_buffering=True)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import json
+import time
+import sqlite3
+import argparse
+import platform
+import itertools
+import statistics
+import subprocess
+import tempfile
+from datetime import datetime
+from typing import Callable, Dict, List
+
+
+DEFAULT_SIZES = (1000, 10000, 100000)
+
+# 검색 기준점 (서울 시청 / GET /nearby는 도시를 돌아가며)
+CENTER = (37.5665, 126.9780)
+CITY_CENTERS = ((37.5665, 126.9780), (35.1796, 129.0756), (37.4563, 126.7052), (35.8714, 128.6014), (37.2636, 127.0286))
+
+
+# ---------------------------------------------------------------------------
+# 측정
+# ---------------------------------------------------------------------------
+
+def _percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+def measure(fn: Callable, repeat: int, calls: int = 1) -> Dict[str, float]:
+    """fn을 repeat번 실행 → 호출 1회당 ms 통계 (calls: fn 한 번에 포함된 호출 수)"""
+    fn()  # 준비 실행 (캐시, 지연 로드)
+    timings = []
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn()
+        timings.append((time.perf_counter() - started) * 1000 / calls)
+    stats = {
+        "median_ms": statistics.median(timings),
+        "p95_ms": _percentile(timings, 95),
+        "min_ms": min(timings),
+        "mean_ms": statistics.fmean(timings),
+    }
+    if isinstance(result, list):
+        stats["rows"] = len(result)
+    return stats
+
+
+def _case(**params) -> str:
+    """필터 조합 → "min_price=3000,day=토" (값이 None인 항목 제외)"""
+    return ",".join(f"{key}={value}" for key, value in params.items() if value is not None) or "-"
+
+
+def list_cases():
+    """get_swimming_pools 필터 × 정렬 모든 조합"""
+    for source, has_free_swim, price, schedule, station, sort in itertools.product(
+        (None, "public"),
+        (None, True),
+        ((None, None), (3000, 5000)),
+        ((None, None), ("토", None), ("토", "10:00")),
+        ((None, None), ("2", 1000)),
+        (None, "price", "name"),
+    ):
+        yield dict(
+            source=source, has_free_swim=has_free_swim,
+            min_price=price[0], max_price=price[1],
+            day=schedule[0], time=schedule[1],
+            near_line=station[0], max_station_m=station[1],
+            sort=sort,
+        )
+
+
+def nearby_cases():
+    """search_nearby_pools 반경 × 필터 × 정렬 모든 조합 (넓은 반경은 GET /nearby에서)"""
+    for radius_km, has_free_swim, price, schedule, station, sort in itertools.product(
+        (1.0, 5.0),
+        (None, True),
+        ((None, None), (None, 5000)),
+        ((None, None), ("토", None), ("토", "10:00")),
+        ((None, None), ("2", 1000)),
+        (None, "price"),
+    ):
+        yield dict(
+            radius_km=radius_km, has_free_swim=has_free_swim,
+            min_price=price[0], max_price=price[1],
+            day=schedule[0], time=schedule[1],
+            near_line=station[0], max_station_m=station[1],
+            sort=sort,
+        )
+
+
+NEARBY_URLS = (
+    "/api/pools/nearby?lat={lat}&lng={lng}&radius=1",
+    "/api/pools/nearby?lat={lat}&lng={lng}&radius=5",
+    "/api/pools/nearby?lat={lat}&lng={lng}&radius=20",
+    "/api/pools/nearby?lat={lat}&lng={lng}&radius=5&day=토&time=10:00&max_price=5000&sort=price",
+    "/api/pools/nearby?lat={lat}&lng={lng}&radius=5&fields=id,name,lat,lng,distance",
+)
+
+
+def run_size(count: int, repeat: int, seed: int) -> List[dict]:
+    """현재 DATABASE_URL DB 하나에 대한 전체 측정 (하위 프로세스에서 실행)"""
+    from fastapi.testclient import TestClient
+
+    from app import main
+    from app.crud import swimming_pool as crud
+    from app.models.swimming_pool import SwimmingPool
+    from database.connection import ReadSessionLocal, sqlite_path
+    from scripts.generate_pools import bulk_load, generate_pools
+
+    results = []
+
+    def record(benchmark: str, case: str, stats: Dict[str, float]):
+        results.append({"pools": count, "benchmark": benchmark, "case": case, **stats})
+
+    started = time.perf_counter()
+    bulk_load(sqlite_path(), count, seed, overwrite=True)
+    rows = list(generate_pools(count, seed))
+    print(f"  데이터 생성: {count:,}개, {time.perf_counter() - started:.1f}초")
+
+    lat, lng = CENTER
+    with TestClient(main.app) as client:  # 시작 이벤트에서 공간 인덱스 등 구축
+        db = ReadSessionLocal()
+        try:
+            for params in list_cases():
+                record("get_swimming_pools", _case(**params), measure(
+                    lambda: crud.get_swimming_pools(db, limit=100, **params), repeat
+                ))
+                db.expunge_all()
+            print(f"  get_swimming_pools: 조합 {sum(1 for _ in list_cases())}개")
+
+            for params in nearby_cases():
+                record("search_nearby_pools", _case(**params), measure(
+                    lambda: crud.search_nearby_pools(db, lat=lat, lng=lng, **params), repeat
+                ))
+                db.expunge_all()
+            print(f"  search_nearby_pools: 조합 {sum(1 for _ in nearby_cases())}개")
+        finally:
+            db.close()
+
+        schedules = [row["free_swim_schedule"] for row in rows]
+        for day, hhmm in (("토", "10:00"), ("월", "12:30"), ("일", "23:00")):
+            record("is_time_in_schedule", _case(day=day, time=hhmm), measure(
+                lambda: [crud.is_time_in_schedule(s, day, hhmm) for s in schedules], repeat, len(schedules)
+            ))
+
+        pools = [SwimmingPool(pricing=row["pricing"]) for row in rows]
+        record("_get_free_swim_price", "-", measure(
+            lambda: [crud._get_free_swim_price(pool) for pool in pools], repeat, len(pools)
+        ))
+
+        for template in NEARBY_URLS:
+            urls = itertools.cycle([template.format(lat=c_lat, lng=c_lng) for c_lat, c_lng in CITY_CENTERS])
+
+            def request():
+                response = client.get(next(urls))
+                response.raise_for_status()
+                return response.json()
+
+            record("GET /nearby", template.split("?", 1)[1].replace("lat={lat}&lng={lng}&", ""), measure(request, repeat))
+        print(f"  함수/요청 벤치마크 완료")
+
+    return results
+
+
+# ---------------------------------------------------------------------------
+# 출력 / 비교
+# ---------------------------------------------------------------------------
+
+def print_summary(results: List[dict]):
+    """벤치마크별 중앙값 요약 (조합이 많은 항목은 최소/중앙/최대)"""
+    print(f"\n  {'벤치마크':<22}{'규모':>9}{'조합':>6}{'중앙값 ms (최소 / 중앙 / 최대)':>36}")
+    groups: Dict[tuple, List[float]] = {}
+    for result in results:
+        groups.setdefault((result["benchmark"], result["pools"]), []).append(result["median_ms"])
+    for (benchmark, pools), medians in groups.items():
+        spread = f"{min(medians):.4f} / {statistics.median(medians):.4f} / {max(medians):.4f}"
+        print(f"  {benchmark:<22}{pools:>9,}{len(medians):>6}{spread:>36}")
+
+
+def compare(results: List[dict], baseline_path: str, threshold: float) -> int:
+    """baseline 대비 threshold배 이상 느려진 항목 출력 → 개수"""
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = {
+            (r["pools"], r["benchmark"], r["case"]): r["median_ms"]
+            for r in json.load(f)["results"]
+        }
+
+    regressions = []
+    for result in results:
+        before = baseline.get((result["pools"], result["benchmark"], result["case"]))
+        if before and result["median_ms"] / before >= threshold:
+            regressions.append((result["median_ms"] / before, before, result))
+
+    print(f"\n  기준 대비 {threshold:.2f}배 이상 느려진 항목: {len(regressions)}개")
+    for ratio, before, result in sorted(regressions, key=lambda item: item[0], reverse=True):
+        print(f"    {ratio:5.2f}x  {result['benchmark']} [{result['pools']:,}] {result['case']}"
+              f"  {before:.4f} → {result['median_ms']:.4f} ms")
+    return len(regressions)
+
+
+def run_child(count: int, repeat: int, seed: int, output: str):
+    results = run_size(count, repeat, seed)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(results, f, ensure_ascii=False)
+
+
+def run(sizes, repeat: int, seed: int, output: str = None, baseline: str = None, threshold: float = 1.25) -> int:
+    print(f"\n{'='*60}")
+    print(f"  검색/필터 핫 패스 벤치마크 ({', '.join(f'{s:,}' for s in sizes)}개, {repeat}회)")
+    print(f"{'='*60}")
+
+    results = []
+    with tempfile.TemporaryDirectory(prefix="bench_hot_paths_") as tmp:
+        for count in sizes:
+            print(f"\n  [{count:,}개]")
+            db_path = os.path.join(tmp, f"pools_{count}.db")
+            part = os.path.join(tmp, f"results_{count}.json")
+            env = dict(
+                os.environ, DATABASE_URL=f"sqlite:///{db_path}", SERVE_SNAPSHOT="0", DB_ASYNC="0",
+                SLOW_QUERY_MS="0", SLOW_REQUEST_QUERIES="0", SLOW_REQUEST_DB_MS="0",
+            )
+            subprocess.run(
+                [sys.executable, os.path.abspath(__file__), "--child", str(count),
+                 "--repeat", str(repeat), "--seed", str(seed), "--output", part],
+                env=env, check=True,
+            )
+            with open(part, encoding="utf-8") as f:
+                results.extend(json.load(f))
+
+    print_summary(results)
+
+    if output:
+        document = {
+            "meta": {
+                "created": datetime.now().isoformat(timespec="seconds"),
+                "python": platform.python_version(),
+                "sqlite": sqlite3.sqlite_version,
+                "platform": platform.platform(),
+                "repeat": repeat,
+                "seed": seed,
+            },
+            "results": results,
+        }
+        with open(output, "w", encoding="utf-8") as f:
+            json.dump(document, f, ensure_ascii=False, indent=1)
+        print(f"\n  결과 저장: {output} ({len(results)}개 항목)")
+
+    regressions = compare(results, baseline, threshold) if baseline else 0
+
+    print(f"\n{'='*60}\n")
+    return 1 if regressions else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="검색/필터 핫 패스 벤치마크")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES), help="수영장 수 (여러 개)")
+    parser.add_argument("--repeat", type=int, default=5, help="항목별 반복 횟수")
+    parser.add_argument("--seed", type=int, default=42, help="데이터 생성 시드")
+    parser.add_argument("--output", help="결과 JSON 파일 경로")
+    parser.add_argument("--compare", help="비교할 이전 결과 JSON 파일")
+    parser.add_argument("--threshold", type=float, default=1.25, help="느려짐 판정 배율 (중앙값 기준)")
+    parser.add_argument("--child", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(args.child, args.repeat, args.seed, args.output)
+        return
+    sys.exit(run(args.sizes, args.repeat, args.seed, args.output, args.compare, args.threshold))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+"""
+목록 응답 직렬화 벤치마크: response_model 경로 vs ORM → orjson 직접 경로
+
+같은 ORM 객체 목록을 두 라우트로 내려받아 요청당 시간을 비교한다.
+  - response_model: 행마다 SwimmingPoolResponse 검증 → jsonable_encoder → json.dumps
+  - fast (cold): projected_response, 조각 캐시를 매번 비움
+  - fast (warm): projected_response, 조각 캐시 재사용
+
+사용법:
+  python benchmarks/bench_serialization.py              # 1000행, 20회
+  python benchmarks/bench_serialization.py --rows 5000 --repeat 10
+"""
+import sys
+import os
+import io
+sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import json
+import time
+import random
+import argparse
+import statistics
+from datetime import datetime, timedelta
+from typing import List
+
+from fastapi import FastAPI, Response
+from fastapi.testclient import TestClient
+
+from app.api.projection import fragment_cache, projected_response
+from app.models.swimming_pool import PoolStation, SwimmingPool
+from app.schemas.swimming_pool import SwimmingPoolResponse
+
+
+def make_pools(count: int, seed: int = 42) -> List[SwimmingPool]:
+    """DB 없이 실제 응답 크기와 비슷한 ORM 객체 생성"""
+    rng = random.Random(seed)
+    now = datetime(2025, 1, 1)
+    pools = []
+    for i in range(1, count + 1):
+        price = rng.choice([3000, 3400, 4000, 5000, None])
+        pool = SwimmingPool(
+            id=i,
+            name=f"벤치마크 수영장 {i}",
+            address=f"서울특별시 송파구 올림픽로 {i}",
+            lat=37.4 + rng.random() * 0.3,
+            lng=126.8 + rng.random() * 0.4,
+            phone="02-000-0000",
+            operating_hours={day: "06:00-22:00" for day in "월화수목금토일"},
+            lanes=rng.randint(4, 10),
+            pool_size="25m x 6레인",
+            facilities=["사우나", "주차장", "락커"],
+            pricing={"자유수영": {"성인": {"평일": price, "주말": price and price + 1000}}},
+            free_swim_schedule={"토": ["06:00-07:50", "09:00-10:50"], "휴관": "매월 첫째 일요일"},
+            notes="주차 2시간 무료. 수모 착용 필수.",
+            parking=True,
+            source="benchmark",
+            url=None,
+            image_url=None,
+            description="벤치마크용 데이터 " * 5,
+            rating=round(rng.uniform(3, 5), 1),
+            review_count=rng.randint(0, 500),
+            last_updated=now + timedelta(seconds=i),
+            is_active=True,
+            enrichment_status="done",
+            last_enriched=now,
+        )
+        pool.nearest_station_row = PoolStation(station="잠실", line="2", distance_m=rng.randint(50, 2000), rank=1)
+        pools.append(pool)
+    return pools
+
+
+def build_app(pools: List[SwimmingPool]) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/model", response_model=List[SwimmingPoolResponse])
+    def with_response_model():
+        return pools
+
+    @app.get("/fast", response_model=List[SwimmingPoolResponse])
+    def with_fast_path(response: Response):
+        return projected_response(pools, None, response)
+
+    return app
+
+
+def measure(client: TestClient, path: str, repeat: int, clear_cache: bool = False) -> List[float]:
+    timings = []
+    for _ in range(repeat):
+        if clear_cache:
+            fragment_cache.clear()
+        started = time.perf_counter()
+        response = client.get(path)
+        timings.append((time.perf_counter() - started) * 1000)
+        response.raise_for_status()
+    return timings
+
+
+def run(rows: int, repeat: int):
+    print(f"\n{'='*60}")
+    print(f"  직렬화 벤치마크 ({rows}행, {repeat}회)")
+    print(f"{'='*60}\n")
+
+    pools = make_pools(rows)
+    client = TestClient(build_app(pools))
+
+    # 두 경로의 출력이 같은지 먼저 확인
+    assert json.loads(client.get("/model").content) == json.loads(client.get("/fast").content)
+
+    results = {
+        "response_model": measure(client, "/model", repeat),
+        "fast (cold)": measure(client, "/fast", repeat, clear_cache=True),
+        "fast (warm)": measure(client, "/fast", repeat),
+    }
+
+    baseline = statistics.median(results["response_model"])
+    print(f"  {'경로':<16}{'중앙값(ms)':>12}{'최소(ms)':>12}{'배율':>8}")
+    for name, timings in results.items():
+        median = statistics.median(timings)
+        print(f"  {name:<16}{median:>12.2f}{min(timings):>12.2f}{baseline / median:>7.1f}x")
+    print(f"\n{'='*60}\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="목록 응답 직렬화 벤치마크")
+    parser.add_argument("--rows", type=int, default=1000, help="응답 행 수")
+    parser.add_argument("--repeat", type=int, default=20, help="경로별 반복 횟수")
+    args = parser.parse_args()
+
+    run(args.rows, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+"""
+조회 API 부하 테스트: sync 세션(스레드풀) vs async 세션(DB_ASYNC=1, aiosqlite)
+
+같은 DB로 uvicorn을 모드별로 띄우고, 동시 요청을 보내 처리량과 지연 분포를 비교한다.
+요청은 /api/pools, /nearby, /search(GET), /{id}를 섞어서 보냄 (ETag 304를 피하려고 조건부 헤더 없음).
+
+사용법:
+  python benchmarks/load_test_db.py                         # 기본 DB, 동시 100, 2000요청
+  python benchmarks/load_test_db.py --db /tmp/pools.db --concurrency 200 --requests 5000
+  python benchmarks/load_test_db.py --generate 100000            # 합성 수영장 10만 개 DB로 (임시 폴더에 한 번 생성)
+"""
+import sys
+import os
+import io
+sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+import time
+import random
+import tempfile
+import asyncio
+import argparse
+import statistics
+import subprocess
+
+import httpx
+
+
+DEFAULT_DB = os.path.join(PROJECT_ROOT, "swimming_pools.db")
+
+
+def request_mix(count: int, seed: int = 7):
+    """조회 라우트 혼합 요청 목록"""
+    rng = random.Random(seed)
+    paths = []
+    for _ in range(count):
+        lat, lng = 37.45 + rng.random() * 0.2, 126.85 + rng.random() * 0.3
+        paths.append(rng.choice([
+            f"/api/pools/?limit=100&skip=0&fields=id,name,lat,lng",
+            f"/api/pools/nearby?lat={lat:.4f}&lng={lng:.4f}&radius=5",
+            f"/api/pools/nearby?lat={lat:.4f}&lng={lng:.4f}&radius=10&day=토",
+            f"/api/pools/search?q=수영장&limit=20",
+            f"/api/pools/{rng.randint(1, 300)}",
+        ]))
+    return paths
+
+
+def start_server(db_path: str, port: int, use_async: bool) -> subprocess.Popen:
+    env = dict(
+        os.environ,
+        DATABASE_URL=f"sqlite:///{os.path.abspath(db_path)}",
+        DB_ASYNC="1" if use_async else "0",
+    )
+    return subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port), "--log-level", "warning"],
+        cwd=PROJECT_ROOT, env=env,
+    )
+
+
+async def wait_ready(base: str, timeout: float = 30.0):
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient(base_url=base) as client:
+        while time.monotonic() < deadline:
+            try:
+                if (await client.get("/health")).status_code == 200:
+                    return
+            except httpx.TransportError:
+                pass
+            await asyncio.sleep(0.2)
+    raise RuntimeError(f"서버 시작 실패: {base}")
+
+
+async def load(base: str, paths, concurrency: int):
+    """동시 concurrency개로 paths 전체 요청 → (총 시간, 요청별 지연 ms, 실패 수)"""
+    queue = list(reversed(paths))
+    latencies, failures = [], 0
+
+    async def worker(client):
+        nonlocal failures
+        while queue:
+            path = queue.pop()
+            started = time.perf_counter()
+            try:
+                response = await client.get(path)
+                if response.status_code >= 400 and response.status_code != 404:
+                    failures += 1
+            except httpx.HTTPError:
+                failures += 1
+            latencies.append((time.perf_counter() - started) * 1000)
+
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base, limits=limits, timeout=60) as client:
+        started = time.perf_counter()
+        await asyncio.gather(*(worker(client) for _ in range(concurrency)))
+        return time.perf_counter() - started, latencies, failures
+
+
+def percentile(values, pct):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * pct / 100))]
+
+
+def run(db_path: str, concurrency: int, requests: int, port: int):
+    print(f"\n{'='*60}")
+    print(f"  조회 API 부하 테스트 (동시 {concurrency}, {requests}요청)")
+    print(f"  DB: {db_path}")
+    print(f"{'='*60}\n")
+
+    paths = request_mix(requests)
+    print(f"  {'모드':<8}{'req/s':>10}{'p50(ms)':>10}{'p95(ms)':>10}{'p99(ms)':>10}{'실패':>6}")
+
+    for use_async in (False, True):
+        server = start_server(db_path, port, use_async)
+        base = f"http://127.0.0.1:{port}"
+        try:
+            asyncio.run(wait_ready(base))
+            asyncio.run(load(base, paths[:min(200, len(paths))], concurrency))  # 워밍업
+            elapsed, latencies, failures = asyncio.run(load(base, paths, concurrency))
+        finally:
+            server.terminate()
+            server.wait()
+
+        mode = "async" if use_async else "sync"
+        print(f"  {mode:<8}{len(paths) / elapsed:>10.0f}{statistics.median(latencies):>10.1f}"
+              f"{percentile(latencies, 95):>10.1f}{percentile(latencies, 99):>10.1f}{failures:>6}")
+
+    print(f"\n{'='*60}\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="sync/async DB 세션 부하 테스트")
+    parser.add_argument("--db", default=DEFAULT_DB, help="SQLite DB 파일 경로")
+    parser.add_argument("--concurrency", type=int, default=100, help="동시 요청 수")
+    parser.add_argument("--requests", type=int, default=2000, help="총 요청 수")
+    parser.add_argument("--port", type=int, default=8765, help="테스트 서버 포트")
+    parser.add_argument("--generate", type=int, help="합성 수영장 N개 DB를 만들어 사용 (--db 무시)")
+    args = parser.parse_args()
+
+    db_path = args.db
+    if args.generate:
+        db_path = os.path.join(tempfile.gettempdir(), f"synthetic_pools_{args.generate}.db")
+        if not os.path.exists(db_path):
+            sys.path.insert(0, PROJECT_ROOT)
+            from scripts.generate_pools import bulk_load
+            print(f"  합성 수영장 {args.generate:,}개 생성 → {db_path}")
+            bulk_load(db_path, args.generate)
+
+    run(db_path, args.concurrency, args.requests, args.port)
+
+
+if __name__ == "__main__":
+    main()
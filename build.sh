@@ -4,6 +4,14 @@ set -o errexit
 
 pip install -r requirements.txt
 
+# Content-hashed static file names (+ frontend/dist/index_refactored.html)
+echo "Fingerprinting static files..."
+python scripts/fingerprint_static.py
+
+# Precompress static assets (.br/.gz)
+echo "Precompressing static files..."
+python scripts/precompress_static.py
+
 # Process data
 echo "Processing data..."
 python scripts/process_pools.py
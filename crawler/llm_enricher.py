@@ -23,7 +23,6 @@ import argparse
 import json
 import time
 import re
-import sqlite3
 from datetime import datetime
 from typing import Optional, Dict, Any
 
@@ -33,6 +32,10 @@ load_dotenv()
 from bs4 import BeautifulSoup
 import anthropic
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from app.crud.swimming_pool import extract_free_swim_price, compile_free_swim_sessions
+from database.connection import sqlite_connect
+
 
 # LLM에 전달할 JSON 추출 스키마
 EXTRACTION_SCHEMA = """{
@@ -323,6 +326,11 @@ class LLMPoolEnricher:
                 updates.append(f"{field} = ?")
                 params.append(value)
 
+        # 가격 필터용 파생 컬럼 동기화
+        if "pricing" in data:
+            updates.append("free_swim_adult_weekday_price = ?")
+            params.append(extract_free_swim_price(data["pricing"]))
+
         # 상태 업데이트
         updates.append("enrichment_status = ?")
         params.append("success")
@@ -333,6 +341,14 @@ class LLMPoolEnricher:
         sql = f"UPDATE swimming_pools SET {', '.join(updates)} WHERE id = ?"
         cursor.execute(sql, params)
 
+        # 요일/시간 필터용 세션 행 동기화
+        if "free_swim_schedule" in data:
+            cursor.execute("DELETE FROM free_swim_sessions WHERE pool_id = ?", (pool_id,))
+            cursor.executemany(
+                "INSERT INTO free_swim_sessions (pool_id, day, start_minute, end_minute) VALUES (?, ?, ?, ?)",
+                [(pool_id, *session) for session in compile_free_swim_sessions(data["free_swim_schedule"])]
+            )
+
     def enrich_pool(self, pool_id: int, name: str, url: str, cursor, dry_run: bool = False) -> bool:
         """단일 수영장 데이터 추출 파이프라인"""
 
@@ -405,7 +421,7 @@ class LLMPoolEnricher:
     def enrich_all(self, test_count: int = 0, dry_run: bool = False,
                    pool_id: Optional[int] = None, retry_failed: bool = False):
         """메인 루프: DB 조회 → 크롤링 → LLM → 검증 → 저장"""
-        conn = sqlite3.connect(DB_PATH)
+        conn = sqlite_connect(DB_PATH)
         cursor = conn.cursor()
 
         try:
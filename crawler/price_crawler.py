@@ -25,7 +25,9 @@ import json
 import time
 import re
 from typing import Dict, Optional, List
-import sqlite3
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from database.connection import sqlite_connect
 
 
 class PoolDataCrawler:
@@ -360,7 +362,7 @@ class PoolDataCrawler:
             test_count: 0이면 전체, N이면 N건만 크롤링
             dry_run: True이면 DB 업데이트 없이 결과만 출력
         """
-        conn = sqlite3.connect('swimming_pools.db')
+        conn = sqlite_connect()
         try:
             self._crawl_pools_inner(conn, test_count, dry_run)
         finally:
@@ -1,19 +1,116 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
 import os
+import sqlite3
 from dotenv import load_dotenv
 
 load_dotenv()
 
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./swimming_pools.db")
+IS_SQLITE = DATABASE_URL.startswith("sqlite")
 
-engine = create_engine(
-    DATABASE_URL,
-    connect_args={"check_same_thread": False} if "sqlite" in DATABASE_URL else {}
-)
+# SQLite 연결마다 적용하는 PRAGMA (환경변수로 조정)
+# - WAL: 크롤러가 쓰는 동안에도 API 조회가 막히지 않음 (파일에 영구 저장되는 설정)
+# - busy_timeout: 쓰기 잠금이 풀릴 때까지 기다림 ("database is locked" 대신)
+# - synchronous=NORMAL: WAL에서는 체크포인트 때만 fsync (커밋 자체는 안전)
+SQLITE_CACHE_SIZE_KB = int(os.getenv("SQLITE_CACHE_SIZE_KB", "65536"))
+SQLITE_MMAP_SIZE = int(os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024)))
+SQLITE_BUSY_TIMEOUT_MS = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000"))
+SQLITE_SYNCHRONOUS = os.getenv("SQLITE_SYNCHRONOUS", "NORMAL")
+
+# 조회 전용 연결 풀 크기 (쓰기 연결은 프로세스당 1개)
+READ_POOL_SIZE = int(os.getenv("READ_POOL_SIZE", "8"))
+
+# sync 라우트가 동시에 도는 스레드 수 (Starlette/anyio 스레드풀 기본 40)
+# 조회 풀은 READ_POOL_SIZE개를 유지하고 이 수까지는 임시 연결(반환 시 닫힘)을 더 연다.
+# 풀이 스레드 수보다 작으면 남는 요청이 연결을 기다리다 pool_timeout(30초) 후 실패하고,
+# 연결마다 페이지 캐시(SQLITE_CACHE_SIZE_KB)가 있어 평소 유지하는 연결 수는 작게 둔다.
+THREADPOOL_SIZE = int(os.getenv("THREADPOOL_SIZE", "40"))
+
+
+def sqlite_pragmas(readonly: bool = False) -> list:
+    """연결에 적용할 PRAGMA 문 목록"""
+    pragmas = [
+        f"PRAGMA busy_timeout = {SQLITE_BUSY_TIMEOUT_MS}",
+        f"PRAGMA cache_size = -{SQLITE_CACHE_SIZE_KB}",
+        f"PRAGMA mmap_size = {SQLITE_MMAP_SIZE}",
+        f"PRAGMA synchronous = {SQLITE_SYNCHRONOUS}",
+        "PRAGMA temp_store = MEMORY",
+        "PRAGMA foreign_keys = ON",
+    ]
+    if readonly:
+        pragmas.append("PRAGMA query_only = ON")
+    else:
+        pragmas.insert(1, "PRAGMA journal_mode = WAL")
+    return pragmas
+
+
+def apply_pragmas(dbapi_connection, readonly: bool = False):
+    cursor = dbapi_connection.cursor()
+    try:
+        for sql in sqlite_pragmas(readonly):
+            cursor.execute(sql)
+    finally:
+        cursor.close()
+
+
+def configure_sqlite(bind, readonly: bool = False):
+    """엔진의 새 연결마다 PRAGMA 적용"""
+    @event.listens_for(bind, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        apply_pragmas(dbapi_connection, readonly)
+
+
+def sqlite_path(url: str = DATABASE_URL) -> str:
+    """sqlite:///경로 URL → 파일 경로"""
+    return url.split(":///", 1)[1] if ":///" in url else ""
+
+
+def sqlite_connect(path: str = None, readonly: bool = False) -> sqlite3.Connection:
+    """ORM을 거치지 않는 sqlite3 연결 (크롤러 등). API 엔진과 같은 PRAGMA 적용."""
+    conn = sqlite3.connect(path or sqlite_path(), timeout=SQLITE_BUSY_TIMEOUT_MS / 1000)
+    apply_pragmas(conn, readonly)
+    return conn
+
+
+def _engine_kwargs(pool_size: int, max_overflow: int = 0) -> dict:
+    if not IS_SQLITE:
+        return {}
+    kwargs = {"connect_args": {"check_same_thread": False}}
+    if sqlite_path() not in ("", ":memory:"):
+        kwargs.update(pool_size=pool_size, max_overflow=max_overflow)
+    return kwargs
+
+
+# 쓰기 경로: 연결 1개로 직렬화 (SQLite는 어차피 쓰기 잠금이 하나)
+engine = create_engine(DATABASE_URL, **_engine_kwargs(pool_size=1))
+
+# 조회 경로: query_only 연결 풀 → 쓰기 연결을 기다리지 않음
+# (스레드풀의 모든 스레드가 동시에 조회해도 연결을 얻도록 overflow 허용)
+read_engine = create_engine(DATABASE_URL, **_engine_kwargs(
+    pool_size=READ_POOL_SIZE, max_overflow=max(THREADPOOL_SIZE - READ_POOL_SIZE, 0)
+))
+
+if IS_SQLITE:
+    configure_sqlite(engine)
+    configure_sqlite(read_engine, readonly=True)
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=read_engine)
+
+# DB_ASYNC=1이면 API 조회 경로(/pools, /nearby, /search, /{id})가 aiosqlite 비동기 세션 사용
+# → 요청이 DB를 기다리는 동안 스레드풀 워커를 점유하지 않음
+DB_ASYNC = os.getenv("DB_ASYNC", "0").lower() in ("1", "true", "yes")
+
+async_engine = None
+AsyncSessionLocal = None
+if DB_ASYNC:
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+    async_engine = create_async_engine(DATABASE_URL.replace("sqlite://", "sqlite+aiosqlite://", 1))
+    configure_sqlite(async_engine.sync_engine, readonly=True)
+    AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
 
 Base = declarative_base()
 
@@ -24,6 +121,53 @@ def get_db():
     finally:
         db.close()
 
-def init_db():
+def get_readonly_db():
+    db = ReadSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+# 조회 라우트용 세션 의존성 (DB_ASYNC 설정에 따라 선택)
+get_read_db = get_async_db if DB_ASYNC else get_readonly_db
+
+def migrate_price_column(conn):
+    """free_swim_adult_weekday_price 컬럼이 없는 기존 DB에 컬럼 추가 + pricing JSON에서 백필
+
+    create_all은 기존 테이블에 컬럼을 추가하지 않으므로 init_db가 인덱스 생성 전에 호출한다.
+    이미 있으면 None, 추가했으면 가격을 채운 행 수.
+    """
+    from app.crud.swimming_pool import extract_free_swim_price
+    columns = {row[1] for row in conn.exec_driver_sql("PRAGMA table_info(swimming_pools)")}
+    if "free_swim_adult_weekday_price" in columns:
+        return None
+
+    conn.exec_driver_sql("ALTER TABLE swimming_pools ADD COLUMN free_swim_adult_weekday_price INTEGER")
+    updates = [
+        (extract_free_swim_price(pricing), pool_id)
+        for pool_id, pricing in conn.exec_driver_sql("SELECT id, pricing FROM swimming_pools").fetchall()
+    ]
+    if updates:
+        conn.exec_driver_sql("UPDATE swimming_pools SET free_swim_adult_weekday_price = ? WHERE id = ?", updates)
+    return sum(1 for price, _ in updates if price is not None)
+
+def init_db(bind=None):
     from app.models.swimming_pool import Base
-    Base.metadata.create_all(bind=engine)
+    from app.services import data_version, fulltext
+    bind = engine if bind is None else bind
+    Base.metadata.create_all(bind=bind)
+    # 기존 테이블에 나중에 추가된 컬럼 (인덱스보다 먼저)
+    with bind.begin() as conn:
+        filled = migrate_price_column(conn)
+    if filled is not None:
+        print(f"가격 컬럼 추가: {filled}건 백필")
+    # 기존 테이블에 나중에 추가된 인덱스 생성 (create_all은 새 테이블에만 적용)
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=bind, checkfirst=True)
+    data_version.install(bind)
+    fulltext.install(bind)
@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+"""
+자유수영 세션 구간 테이블(free_swim_sessions) 백필
+
+기존 DB의 free_swim_schedule JSON을 요일별 분 단위 구간으로 펼쳐서 저장한다.
+테이블이 없으면 생성하고, 전체 수영장의 세션 행을 다시 만든다.
+이후에는 crud 생성/수정 함수와 llm_enricher가 쓰기 시점에 동기화.
+
+가격 컬럼(free_swim_adult_weekday_price)이 없는 DB는 init_db()가 먼저 컬럼을 추가/백필한다
+(예전에는 scripts/migrate_price_column.py를 먼저 실행해야 했음).
+free_swim_sessions에는 버전 트리거가 없으므로 끝나면 data_version을 직접 올린다.
+
+사용법:
+  python scripts/backfill_free_swim_sessions.py
+"""
+import sys
+import os
+import io
+sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database.connection import SessionLocal, init_db
+from app.crud.swimming_pool import sync_derived_fields
+from app.models.swimming_pool import SwimmingPool
+from app.services import data_version
+
+
+def backfill():
+    print(f"\n{'='*60}")
+    print(f"  자유수영 세션 구간 백필")
+    print(f"{'='*60}\n")
+
+    init_db()
+    db = SessionLocal()
+
+    try:
+        pools = db.query(SwimmingPool).order_by(SwimmingPool.id).all()
+        session_count = 0
+
+        for pool in pools:
+            sync_derived_fields(pool)
+            session_count += len(pool.free_swim_sessions)
+
+        db.commit()
+        # free_swim_sessions에는 버전 트리거가 없으므로 직접 올려서 ETag/캐시/인덱스 갱신
+        data_version.bump()
+
+        print(f"  수영장 {len(pools)}건 → 세션 {session_count}건 생성")
+        print(f"{'='*60}\n")
+
+    except Exception as e:
+        print(f"\n  백필 실패: {e}")
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    backfill()
@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+"""
+수영장 ↔ 지하철역 근접 테이블(pool_stations) 빌드
+
+frontend/data/subway_lines.json의 역 좌표와 수영장 좌표를 격자 공간 조인해서
+수영장마다 도보 반경(STATION_RADIUS_M) 안의 역과 가장 가까운 역을 저장한다.
+테이블이 없으면 생성하고, 전체 행을 다시 만든다.
+역 데이터(subway_lines.json)가 바뀌면 다시 실행. 수영장 좌표 변경은
+crud 생성/수정 함수가 쓰기 시점에 동기화.
+
+사용법:
+  python scripts/build_pool_stations.py           # 빌드 실행
+  python scripts/build_pool_stations.py --dry-run # 건수만 출력
+"""
+import sys
+import os
+import io
+sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import time
+import argparse
+
+from database.connection import SessionLocal, init_db
+from app.models.swimming_pool import SwimmingPool, PoolStation
+from app.services import data_version
+from app.services.stations import STATION_RADIUS_M, load_stations, station_join
+
+
+def build(dry_run=False):
+    mode = " [DRY-RUN]" if dry_run else ""
+    print(f"\n{'='*60}")
+    print(f"  지하철역 근접 테이블 빌드{mode}")
+    print(f"{'='*60}\n")
+
+    init_db()
+    db = SessionLocal()
+
+    try:
+        started = time.perf_counter()
+        join = station_join()
+        print(f"  역 {len(load_stations())}개 (호선별), 반경 {STATION_RADIUS_M}m")
+
+        pools = db.query(SwimmingPool.id, SwimmingPool.lat, SwimmingPool.lng).order_by(SwimmingPool.id).all()
+        rows = [
+            dict(row, pool_id=pool_id)
+            for pool_id, lat, lng in pools
+            for row in join.rows_for(lat, lng)
+        ]
+        nearest = [row for row in rows if row["rank"] == 1]
+        within = sum(1 for row in nearest if row["distance_m"] <= STATION_RADIUS_M)
+        print(f"  수영장 {len(pools)}건 → {len(rows)}행 "
+              f"(반경 안 역 있음 {within}건, {time.perf_counter() - started:.2f}s)")
+
+        if dry_run:
+            return
+
+        db.query(PoolStation).delete()
+        db.bulk_insert_mappings(PoolStation, rows)
+        db.commit()
+        # pool_stations에는 버전 트리거가 없으므로 직접 올려서 ETag/캐시 무효화
+        data_version.bump()
+
+        print(f"\n{'='*60}")
+        print(f"  빌드 완료!")
+        print(f"{'='*60}\n")
+
+    except Exception as e:
+        print(f"\n  빌드 실패: {e}")
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="지하철역 근접 테이블 빌드")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="DB 변경 없이 건수만 출력")
+    args = parser.parse_args()
+
+    build(dry_run=args.dry_run)
+
+
+if __name__ == "__main__":
+    main()
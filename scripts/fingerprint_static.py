@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+"""
+정적 파일 내용 해시 파일명 빌드
+
+frontend/data → js → css 순서로 파일마다 내용 해시(sha256 앞 8자리)를 붙인 사본을 만들고
+(styles.css → styles.1a2b3c4d.css), 앞 단계 파일을 가리키는 참조를 해시 이름으로 바꾼다
+(app.js의 'data/config.json' 등). 마지막으로 index_refactored.html의 css/js 참조를 바꿔
+frontend/dist/index_refactored.html에 쓰고, 원본 → 해시 이름 매핑을 dist/asset-manifest.json에 남긴다.
+
+해시 파일은 앱에서 1년 immutable 캐시로, HTML은 no-cache로 응답 (app/api/static_assets.py).
+원본 파일과 HTML은 그대로 두므로 빌드 없이도 개발 서버가 동작한다.
+이전 빌드의 해시 파일은 삭제. build.sh에서 precompress_static.py보다 먼저 실행.
+
+사용법:
+  python scripts/fingerprint_static.py          # 빌드 실행
+  python scripts/fingerprint_static.py --clean  # 해시 파일/dist 삭제
+"""
+import sys
+import os
+import io
+sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import re
+import json
+import shutil
+import hashlib
+import argparse
+
+from app.api.static_assets import HASHED_NAME
+
+
+FRONTEND_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "frontend")
+DIST_DIR = os.path.join(FRONTEND_DIR, "dist")
+HTML_FILES = ("index_refactored.html",)
+
+# 처리 순서: 앞 단계 파일의 해시 이름이 뒤 단계 내용에 들어가야 함
+STAGES = (("data", (".json",)), ("js", (".js",)), ("css", (".css",)))
+
+# HTML의 css/js/data 참조 (쿼리 문자열 ?v=N 포함)
+HTML_REF = re.compile(r'((?:href|src)=")((?:css|js|data)/[^"?#]+)(\?[^"#]*)?(")')
+
+
+def content_hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()[:8]
+
+
+def hashed_name(rel: str, digest: str) -> str:
+    """css/styles.css → css/styles.<해시>.css"""
+    stem, ext = os.path.splitext(rel)
+    return f"{stem}.{digest}{ext}"
+
+
+def source_files(name, extensions):
+    """해시가 붙지 않은 원본 파일 (frontend 기준 상대 경로, '/' 구분)"""
+    directory = os.path.join(FRONTEND_DIR, name)
+    if not os.path.isdir(directory):
+        return []
+    return [
+        f"{name}/{filename}"
+        for filename in sorted(os.listdir(directory))
+        if filename.endswith(extensions) and not HASHED_NAME.search(filename)
+    ]
+
+
+def rewrite_refs(text: str, manifest: dict) -> str:
+    """문자열 안의 원본 경로 참조를 해시 이름으로 (긴 경로부터)"""
+    for rel in sorted(manifest, key=len, reverse=True):
+        text = text.replace(rel, manifest[rel])
+    return text
+
+
+def clean_hashed():
+    """이전 빌드의 해시 파일(+압축 파일)과 dist 삭제"""
+    removed = 0
+    for name, _ in STAGES:
+        directory = os.path.join(FRONTEND_DIR, name)
+        if not os.path.isdir(directory):
+            continue
+        for filename in os.listdir(directory):
+            base = re.sub(r"\.(br|gz)$", "", filename)
+            if HASHED_NAME.search(base):
+                os.remove(os.path.join(directory, filename))
+                removed += 1
+    if os.path.isdir(DIST_DIR):
+        shutil.rmtree(DIST_DIR)
+    return removed
+
+
+def build():
+    """해시 파일 생성 + HTML 재작성 → manifest"""
+    manifest = {}
+    for name, extensions in STAGES:
+        for rel in source_files(name, extensions):
+            with open(os.path.join(FRONTEND_DIR, rel), "rb") as f:
+                data = f.read()
+            if name != "data":
+                data = rewrite_refs(data.decode("utf-8"), manifest).encode("utf-8")
+            target = hashed_name(rel, content_hash(data))
+            with open(os.path.join(FRONTEND_DIR, target), "wb") as f:
+                f.write(data)
+            manifest[rel] = target
+            print(f"  {rel} → {target}")
+
+    os.makedirs(DIST_DIR, exist_ok=True)
+    for html in HTML_FILES:
+        with open(os.path.join(FRONTEND_DIR, html), encoding="utf-8") as f:
+            text = f.read()
+        missing = []
+
+        def replace(match):
+            rel = match.group(2)
+            if rel not in manifest:
+                missing.append(rel)
+                return match.group(0)
+            return match.group(1) + manifest[rel] + match.group(4)
+
+        text = HTML_REF.sub(replace, text)
+        with open(os.path.join(DIST_DIR, html), "w", encoding="utf-8") as f:
+            f.write(text)
+        print(f"  {html} → dist/{html}")
+        for rel in missing:
+            print(f"    ! 원본 없음: {rel}")
+
+    with open(os.path.join(DIST_DIR, "asset-manifest.json"), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    return manifest
+
+
+def run(clean=False):
+    mode = " [CLEAN]" if clean else ""
+    print(f"\n{'='*60}")
+    print(f"  정적 파일 해시 파일명 빌드{mode}")
+    print(f"{'='*60}\n")
+
+    removed = clean_hashed()
+    print(f"  이전 빌드 파일 {removed}개 삭제\n")
+    if not clean:
+        manifest = build()
+        print(f"\n  해시 파일 {len(manifest)}개")
+
+    print(f"\n{'='*60}")
+    print(f"  완료!{mode}")
+    print(f"{'='*60}\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="정적 파일 내용 해시 파일명 빌드")
+    parser.add_argument("--clean", action="store_true",
+                        help="해시 파일과 dist 디렉토리만 삭제")
+    args = parser.parse_args()
+
+    run(clean=args.clean)
+
+
+if __name__ == "__main__":
+    main()
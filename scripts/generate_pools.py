@@ -0,0 +1,446 @@
+# -*- coding: utf-8 -*-
+"""
+합성 수영장 데이터 생성기 (규모 테스트용)
+
+실제 DB와 같은 모양의 수영장을 N개 만든다.
+  - 주소: 시도/시군구 + 동 지번 또는 도로명 (실데이터처럼 두 형식 혼재)
+  - 좌표: 시군구 중심 주변 정규분포 (인구 가중치 → 수도권/광역시에 몰림)
+  - 이름/출처: 구민체육센터(공공데이터), 민간 스포츠센터(네이버 검색), 피트니스 체인 지점(체인 제휴)
+  - pricing: 평일/주말 구분, 성인 단일 가격, 대상별, 강습만, 문자열 가격("시간대별 상이"), 빈 값
+  - free_swim_schedule: 요일별 슬롯 + "휴관" 문자열, 휴관 정보만 있는 경우, 잘못된 슬롯
+  - operating_hours: 요일별 "06:00-22:00" / "휴관"
+
+bulk_load()는 새 SQLite 파일에 인덱스/트리거 없이 테이블을 만들고 sqlite3 executemany로
+일괄 삽입한 뒤 인덱스, 전문 검색(FTS), 데이터 버전 트리거를 만든다 (100만 개 수 분).
+파생 컬럼/테이블(자유수영 가격, 세션, 주변 지하철역)은 crud 쓰기 경로와 같은 함수로 계산.
+
+사용법:
+  python scripts/generate_pools.py --count 100000 --db /tmp/pools_100k.db
+  python scripts/generate_pools.py --count 1000000 --db /tmp/pools_1m.db --overwrite
+  python scripts/generate_pools.py --count 3 --print      # DB 없이 생성 결과만 출력
+
+라이브러리:
+  from scripts.generate_pools import generate_pools, bulk_load
+"""
+import sys
+import os
+import io
+if __name__ == "__main__":
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import json
+import time
+import random
+import sqlite3
+import argparse
+from datetime import datetime, timedelta
+from typing import Callable, Iterator, Optional
+
+from sqlalchemy import create_engine
+from sqlalchemy.schema import CreateTable
+
+from app.crud.swimming_pool import compile_free_swim_sessions, extract_free_swim_price
+from app.models.swimming_pool import Base, FreeSwimSession, PoolStation, SwimmingPool
+from app.services import data_version, fulltext
+from app.services.stations import station_join
+
+
+# (시도, 시군구, 위도, 경도, 가중치 = 대략 인구 만 명)
+REGIONS = (
+    ("서울특별시", "강남구", 37.5172, 127.0473, 54), ("서울특별시", "강동구", 37.5301, 127.1238, 46),
+    ("서울특별시", "강북구", 37.6396, 127.0257, 29), ("서울특별시", "강서구", 37.5509, 126.8495, 56),
+    ("서울특별시", "관악구", 37.4784, 126.9516, 49), ("서울특별시", "광진구", 37.5385, 127.0823, 34),
+    ("서울특별시", "구로구", 37.4954, 126.8874, 40), ("서울특별시", "금천구", 37.4569, 126.8955, 23),
+    ("서울특별시", "노원구", 37.6542, 127.0568, 50), ("서울특별시", "도봉구", 37.6688, 127.0471, 31),
+    ("서울특별시", "동대문구", 37.5744, 127.0400, 34), ("서울특별시", "동작구", 37.5124, 126.9393, 38),
+    ("서울특별시", "마포구", 37.5663, 126.9019, 37), ("서울특별시", "서대문구", 37.5791, 126.9368, 31),
+    ("서울특별시", "서초구", 37.4837, 127.0324, 41), ("서울특별시", "성동구", 37.5633, 127.0371, 28),
+    ("서울특별시", "성북구", 37.5894, 127.0167, 43), ("서울특별시", "송파구", 37.5145, 127.1059, 66),
+    ("서울특별시", "양천구", 37.5170, 126.8665, 44), ("서울특별시", "영등포구", 37.5264, 126.8962, 38),
+    ("서울특별시", "용산구", 37.5324, 126.9900, 22), ("서울특별시", "은평구", 37.6027, 126.9291, 47),
+    ("서울특별시", "종로구", 37.5735, 126.9790, 14), ("서울특별시", "중구", 37.5641, 126.9979, 12),
+    ("서울특별시", "중랑구", 37.6066, 127.0927, 38),
+    ("부산광역시", "해운대구", 35.1631, 129.1636, 39), ("부산광역시", "부산진구", 35.1629, 129.0532, 36),
+    ("부산광역시", "동래구", 35.2049, 129.0837, 27), ("부산광역시", "남구", 35.1366, 129.0844, 26),
+    ("부산광역시", "사하구", 35.1046, 128.9748, 30), ("부산광역시", "북구", 35.1972, 128.9903, 28),
+    ("부산광역시", "금정구", 35.2430, 129.0922, 22), ("부산광역시", "연제구", 35.1762, 129.0797, 21),
+    ("인천광역시", "남동구", 37.4473, 126.7314, 50), ("인천광역시", "부평구", 37.5070, 126.7219, 48),
+    ("인천광역시", "서구", 37.5454, 126.6760, 59), ("인천광역시", "연수구", 37.4101, 126.6783, 39),
+    ("인천광역시", "미추홀구", 37.4634, 126.6503, 40),
+    ("대구광역시", "달서구", 35.8299, 128.5327, 53), ("대구광역시", "수성구", 35.8582, 128.6306, 41),
+    ("대구광역시", "북구", 35.8858, 128.5829, 42), ("대구광역시", "동구", 35.8866, 128.6355, 34),
+    ("대전광역시", "서구", 36.3555, 127.3838, 46), ("대전광역시", "유성구", 36.3622, 127.3563, 35),
+    ("대전광역시", "중구", 36.3255, 127.4213, 23),
+    ("광주광역시", "북구", 35.1740, 126.9120, 42), ("광주광역시", "광산구", 35.1396, 126.7937, 40),
+    ("광주광역시", "서구", 35.1520, 126.8900, 29),
+    ("울산광역시", "남구", 35.5438, 129.3302, 31), ("울산광역시", "중구", 35.5693, 129.3326, 21),
+    ("세종특별자치시", "세종시", 36.4800, 127.2890, 38),
+    ("경기도", "수원시", 37.2636, 127.0286, 119), ("경기도", "성남시", 37.4201, 127.1265, 92),
+    ("경기도", "고양시", 37.6584, 126.8320, 107), ("경기도", "용인시", 37.2411, 127.1776, 107),
+    ("경기도", "부천시", 37.5034, 126.7660, 80), ("경기도", "안산시", 37.3219, 126.8309, 65),
+    ("경기도", "안양시", 37.3943, 126.9568, 55), ("경기도", "화성시", 37.1995, 126.8312, 90),
+    ("경기도", "남양주시", 37.6360, 127.2165, 73), ("경기도", "평택시", 36.9921, 127.1129, 57),
+    ("경기도", "의정부시", 37.7381, 127.0337, 46), ("경기도", "파주시", 37.7599, 126.7800, 49),
+    ("경기도", "김포시", 37.6153, 126.7156, 48), ("경기도", "광명시", 37.4786, 126.8646, 28),
+    ("강원특별자치도", "춘천시", 37.8813, 127.7298, 28), ("강원특별자치도", "원주시", 37.3422, 127.9202, 36),
+    ("강원특별자치도", "강릉시", 37.7519, 128.8761, 21),
+    ("충청북도", "청주시", 36.6424, 127.4890, 85), ("충청북도", "충주시", 36.9910, 127.9260, 21),
+    ("충청남도", "천안시", 36.8151, 127.1139, 66), ("충청남도", "아산시", 36.7898, 127.0019, 33),
+    ("전북특별자치도", "전주시", 35.8242, 127.1480, 65), ("전북특별자치도", "익산시", 35.9483, 126.9576, 27),
+    ("전라남도", "여수시", 34.7604, 127.6622, 27), ("전라남도", "순천시", 34.9506, 127.4872, 28),
+    ("전라남도", "목포시", 34.8118, 126.3922, 22),
+    ("경상북도", "포항시", 36.0190, 129.3435, 50), ("경상북도", "구미시", 36.1195, 128.3446, 41),
+    ("경상북도", "경주시", 35.8562, 129.2247, 25),
+    ("경상남도", "창원시", 35.2280, 128.6811, 102), ("경상남도", "김해시", 35.2285, 128.8894, 53),
+    ("경상남도", "진주시", 35.1800, 128.1076, 34), ("경상남도", "양산시", 35.3350, 129.0372, 35),
+    ("제주특별자치도", "제주시", 33.4996, 126.5312, 49), ("제주특별자치도", "서귀포시", 33.2541, 126.5601, 18),
+)
+
+AREA_CODES = {
+    "서울특별시": "02", "부산광역시": "051", "인천광역시": "032", "대구광역시": "053",
+    "대전광역시": "042", "광주광역시": "062", "울산광역시": "052", "세종특별자치시": "044",
+    "경기도": "031", "강원특별자치도": "033", "충청북도": "043", "충청남도": "041",
+    "전북특별자치도": "063", "전라남도": "061", "경상북도": "054", "경상남도": "055",
+    "제주특별자치도": "064",
+}
+
+DONGS = (
+    "중앙동", "신흥동", "상동", "중동", "신정동", "대림동", "수정동", "평화동", "산본동", "정자동",
+    "서현동", "연산동", "용호동", "화정동", "월곡동", "봉명동", "신월동", "문화동", "효자동", "송도동",
+    "우산동", "반송동", "덕천동", "매탄동", "영통동", "호계동", "인계동", "장안동", "복정동", "금곡동",
+)
+
+ROADS = (
+    "중앙로", "시청로", "번영로", "문화로", "체육관로", "공원로", "학교로", "평화로", "대학로", "역전로",
+    "새마을로", "하나로", "동부로", "서부로", "남부순환로", "강변로", "청사로", "월드컵로", "상공로", "호수로",
+)
+
+# 피트니스 체인 (가상 브랜드)
+CHAINS = ("아쿠아라이프", "블루핀 스포츠", "스윔앤핏", "워터짐", "파워스윔 클럽", "오션피트니스")
+
+FACILITIES = ("사우나", "주차장", "락커", "샤워실", "헬스장", "유아풀", "다이빙풀", "매점")
+
+HOLIDAYS = (
+    "매월 첫째 일요일", "매월 둘째, 넷째 일요일", "매월 두번째 일요일", "매주 월요일",
+    "법정공휴일", "토요일, 일요일", "설날·추석 연휴", "매월 마지막 주 화요일",
+)
+
+WEEKDAYS = "월화수목금"
+DAYS = "월화수목금토일"
+
+# 자유수영 슬롯 후보 (평일 / 주말)
+WEEKDAY_SLOTS = ("06:00-06:50", "07:00-07:50", "12:00-12:50", "13:00-13:50", "19:00-19:50", "20:00-21:50")
+WEEKEND_SLOTS = ("06:00-07:50", "09:00-10:50", "11:00-12:50", "13:00-14:50", "15:00-16:50")
+
+# 생성 시각 기준 (last_updated 등, 재현 가능하도록 고정)
+BASE_TIME = datetime(2025, 1, 1)
+
+
+def _round(value: int, step: int = 100) -> int:
+    return int(round(value / step) * step)
+
+
+def make_pricing(rng: random.Random, kind: str):
+    """pricing JSON (실데이터에 있는 모양들)"""
+    if kind == "chain":
+        monthly = _round(rng.randint(70000, 160000), 1000)
+        return {
+            "회원권": {"1개월": monthly, "3개월": monthly * 3 - 20000},
+            "자유수영": {"성인": {"평일": _round(rng.randint(7000, 15000), 1000)}},
+        }
+
+    base = _round(rng.randint(2000, 5500)) if kind == "public" else _round(rng.randint(5000, 12000), 500)
+    shape = rng.random()
+    if shape < 0.35:
+        return {"자유수영": {"성인": {"평일": base, "주말": base + rng.choice([0, 500, 1000, 1600])}}}
+    if shape < 0.6:
+        return {"자유수영": {"성인": base}}
+    if shape < 0.72:
+        return {
+            "자유수영": {
+                "성인": {"평일": base, "주말": base + 1000},
+                "청소년": {"평일": base - 1000, "주말": base},
+                "어린이": base - 1500,
+            },
+            "강습_월": {"성인": _round(rng.randint(60000, 150000), 1000)},
+        }
+    if shape < 0.8:
+        return {"강습_월": {"성인": _round(rng.randint(60000, 150000), 1000), "주2회": _round(rng.randint(40000, 80000), 1000)}}
+    if shape < 0.85:
+        return {"자유수영": {"성인": rng.choice(["시간대별 상이", "가격 다양, 표 참조", "문의"])}}
+    if shape < 0.88:
+        return {}
+    return None
+
+
+def make_schedule(rng: random.Random):
+    """free_swim_schedule JSON ("휴관" 문자열 값 포함)"""
+    shape = rng.random()
+    if shape < 0.3:
+        return None
+    if shape < 0.42:
+        return {"휴관": rng.choice(HOLIDAYS)}
+
+    schedule = {}
+    weekday = sorted(rng.sample(WEEKDAY_SLOTS, rng.randint(1, 3)))
+    for day in WEEKDAYS:
+        if rng.random() < 0.8:
+            schedule[day] = list(weekday)
+    weekend = sorted(rng.sample(WEEKEND_SLOTS, rng.randint(1, 3)))
+    for day in "토일":
+        roll = rng.random()
+        if roll < 0.7:
+            schedule[day] = list(weekend)
+        elif roll < 0.8:
+            schedule[day] = "휴관"
+    if rng.random() < 0.03:
+        schedule.setdefault("월", []).append("오전 중")  # 형식이 잘못된 슬롯 (무시되어야 함)
+    if rng.random() < 0.6:
+        schedule["휴관"] = rng.choice(HOLIDAYS)
+    return schedule
+
+
+def make_operating_hours(rng: random.Random):
+    """operating_hours JSON (요일별, 휴관일은 "휴관")"""
+    if rng.random() < 0.3:
+        return None
+    open_, close = rng.choice([(6, 22), (6, 21), (5, 23), (9, 18)])
+    hours = {day: f"{open_:02d}:00-{close:02d}:00" for day in WEEKDAYS}
+    hours["토"] = f"{open_:02d}:00-{min(close, 18):02d}:00"
+    hours["일"] = rng.choice(["휴관", f"{max(open_, 9):02d}:00-17:00"])
+    if rng.random() < 0.2:
+        hours[rng.choice(WEEKDAYS)] = "휴관"
+    return hours
+
+
+def make_address(rng: random.Random, sido: str, sigungu: str, dong: str) -> str:
+    if rng.random() < 0.55:
+        lot = str(rng.randint(1, 999)) + (f"-{rng.randint(1, 30)}" if rng.random() < 0.4 else "")
+        return f"{sido} {sigungu} {dong} {lot}"
+    road = rng.choice(ROADS)
+    if rng.random() < 0.3:
+        road += f"{rng.randint(1, 80)}번길"
+    return f"{sido} {sigungu} {road} {rng.randint(1, 400)}"
+
+
+def make_name(rng: random.Random, kind: str, sigungu: str, dong: str) -> str:
+    area = sigungu[:-1] if len(sigungu) > 2 else sigungu
+    if kind == "chain":
+        return f"{rng.choice(CHAINS)} {dong[:-1]}점"
+    if kind == "public":
+        return rng.choice([
+            f"{area}구민체육센터" if sigungu.endswith("구") else f"{area}시민체육관 수영장",
+            f"{sigungu} 국민체육센터",
+            f"{dong} 문화체육센터 수영장",
+            f"{area} 실내수영장",
+            f"{dong}종합사회복지관",
+        ])
+    return rng.choice([f"{dong} 스포츠센터", f"{area} 아쿠아센터", f"{dong} 휘트니스 수영장", f"{area} 호텔 실내수영장"])
+
+
+def generate_pools(count: int, seed: int = 42, start_id: int = 1) -> Iterator[dict]:
+    """수영장 count개 (SwimmingPool 컬럼 이름 → 값, JSON 컬럼은 dict/list/None)
+
+    같은 seed면 항상 같은 결과. 파생 컬럼(free_swim_adult_weekday_price)은 넣지 않음.
+    """
+    rng = random.Random(seed)
+    weights = [region[4] for region in REGIONS]
+    kinds, kind_weights = ("public", "private", "chain"), (0.55, 0.3, 0.15)
+    sources = {"public": ("공공데이터", "서울시공공데이터"), "private": ("네이버 검색", "민간시설"), "chain": ("체인 제휴",)}
+
+    for pool_id in range(start_id, start_id + count):
+        sido, sigungu, lat, lng, _ = rng.choices(REGIONS, weights)[0]
+        kind = rng.choices(kinds, kind_weights)[0]
+        dong = rng.choice(DONGS)
+        lanes = rng.choice([4, 5, 6, 6, 8, 8, 10])
+        source = rng.choice(sources[kind])
+        if source == "서울시공공데이터" and sido != "서울특별시":
+            source = "공공데이터"
+
+        yield dict(
+            id=pool_id,
+            name=make_name(rng, kind, sigungu, dong),
+            address=make_address(rng, sido, sigungu, dong),
+            lat=round(lat + rng.gauss(0, 0.02), 7),
+            lng=round(lng + rng.gauss(0, 0.025), 7),
+            phone=f"{AREA_CODES[sido]}-{rng.randint(200, 999)}-{rng.randint(0, 9999):04d}" if rng.random() < 0.85 else None,
+            operating_hours=make_operating_hours(rng),
+            lanes=lanes if rng.random() < 0.6 else None,
+            pool_size=f"{rng.choice([25, 25, 25, 50])}m x {lanes}레인" if rng.random() < 0.6 else None,
+            water_temp=rng.choice(["28~29도", "29도", "27~28도", None, None]),
+            facilities=sorted(rng.sample(FACILITIES, rng.randint(1, 5))) if rng.random() < 0.5 else None,
+            pricing=make_pricing(rng, kind),
+            free_swim_schedule=make_schedule(rng),
+            notes=rng.choice([None, None, "주차 2시간 무료", "수모 착용 필수", "매월 첫째 일요일 휴관", "사전 예약제 운영"]),
+            parking=rng.choice([True, False, None]),
+            source=source,
+            url=f"https://example.com/pools/{pool_id}" if rng.random() < 0.4 else None,
+            image_url=None,
+            description=None,
+            last_updated=BASE_TIME + timedelta(seconds=rng.randint(0, 180 * 86400)),
+            is_active=rng.random() < 0.97,
+            last_enriched=None,
+            enrichment_status=rng.choice(["pending", "success", "failed"]),
+            rating=round(rng.uniform(3.0, 5.0), 1) if rng.random() < 0.7 else None,
+            review_count=rng.randint(0, 800),
+        )
+
+
+def _converter(column) -> Callable:
+    """컬럼 값 → SQLite 저장 값 (SQLAlchemy와 같은 형식, JSON은 json.dumps라 None도 'null')"""
+    type_name = type(column.type).__name__
+    if type_name == "JSON":
+        return json.dumps
+    if type_name == "DateTime":
+        return lambda value: None if value is None else value.strftime("%Y-%m-%d %H:%M:%S.%f")
+    if type_name == "Boolean":
+        return lambda value: None if value is None else int(value)
+    return None
+
+
+def _insert_sql(table) -> str:
+    names = ", ".join(column.name for column in table.columns)
+    marks = ", ".join("?" for _ in table.columns)
+    return f"INSERT INTO {table.name} ({names}) VALUES ({marks})"
+
+
+def bulk_load(
+    path: str,
+    count: int,
+    seed: int = 42,
+    stations: bool = True,
+    chunk_size: int = 50000,
+    overwrite: bool = False,
+    progress: Optional[Callable[[int], None]] = None,
+) -> dict:
+    """새 SQLite 파일에 합성 수영장 count개 적재 → 행 수 통계
+
+    테이블만 먼저 만들고 삽입한 뒤 인덱스/FTS/데이터 버전 트리거를 만든다 (행마다 인덱스 갱신 없음).
+    stations=False면 pool_stations를 비워둠 (지하철역 필터만 빈 결과, 적재 시간 단축).
+    """
+    if os.path.exists(path):
+        if not overwrite:
+            raise FileExistsError(f"이미 있는 파일: {path} (overwrite=True로 덮어쓰기)")
+        for suffix in ("", "-wal", "-shm", "-journal"):
+            if os.path.exists(path + suffix):
+                os.remove(path + suffix)
+
+    engine = create_engine(f"sqlite:///{path}")
+    with engine.begin() as conn:
+        for table in Base.metadata.sorted_tables:
+            conn.execute(CreateTable(table))
+
+    pools_table, sessions_table, stations_table = (
+        SwimmingPool.__table__, FreeSwimSession.__table__, PoolStation.__table__
+    )
+    pool_columns = [(column.name, _converter(column)) for column in pools_table.columns]
+    join = station_join() if stations else None
+    totals = {"pools": 0, "free_swim_sessions": 0, "pool_stations": 0}
+
+    conn = sqlite3.connect(path)
+    try:
+        conn.execute("PRAGMA journal_mode = OFF")
+        conn.execute("PRAGMA synchronous = OFF")
+        conn.execute("PRAGMA cache_size = -262144")
+        pool_sql, session_sql = _insert_sql(pools_table), _insert_sql(sessions_table)
+        station_sql = _insert_sql(stations_table)
+
+        chunk = []
+        for pool in generate_pools(count, seed):
+            pool["free_swim_adult_weekday_price"] = extract_free_swim_price(pool["pricing"])
+            chunk.append(pool)
+            if len(chunk) >= chunk_size:
+                _insert_chunk(conn, chunk, pool_columns, (pool_sql, session_sql, station_sql), join, totals)
+                chunk = []
+                if progress:
+                    progress(totals["pools"])
+        if chunk:
+            _insert_chunk(conn, chunk, pool_columns, (pool_sql, session_sql, station_sql), join, totals)
+            if progress:
+                progress(totals["pools"])
+        conn.execute("PRAGMA journal_mode = WAL")
+    finally:
+        conn.close()
+
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine)
+    fulltext.install(engine)
+    data_version.install(engine)
+    engine.dispose()
+    return totals
+
+
+def _insert_chunk(conn, pools, pool_columns, statements, join, totals):
+    pool_sql, session_sql, station_sql = statements
+    session_id = totals["free_swim_sessions"]
+    station_id = totals["pool_stations"]
+    pool_rows, session_rows, station_rows = [], [], []
+    for pool in pools:
+        pool_rows.append(tuple(
+            convert(pool.get(name)) if convert else pool.get(name) for name, convert in pool_columns
+        ))
+        for day, start, end in compile_free_swim_sessions(pool["free_swim_schedule"]):
+            session_id += 1
+            session_rows.append((session_id, pool["id"], day, start, end))
+        if join is not None:
+            for row in join.rows_for(pool["lat"], pool["lng"]):
+                station_id += 1
+                station_rows.append((station_id, pool["id"], row["station"], row["line"], row["distance_m"], row["rank"]))
+
+    with conn:
+        conn.executemany(pool_sql, pool_rows)
+        conn.executemany(session_sql, session_rows)
+        conn.executemany(station_sql, station_rows)
+    totals["pools"] += len(pool_rows)
+    totals["free_swim_sessions"] = session_id
+    totals["pool_stations"] = station_id
+
+
+def run(count, db_path, seed=42, stations=True, overwrite=False, print_only=False):
+    if print_only:
+        for pool in generate_pools(count, seed):
+            print(json.dumps(pool, ensure_ascii=False, default=str, indent=2))
+        return
+
+    print(f"\n{'='*60}")
+    print(f"  합성 수영장 데이터 생성 ({count:,}개 → {db_path})")
+    print(f"{'='*60}\n")
+
+    started = time.perf_counter()
+
+    def progress(done):
+        elapsed = time.perf_counter() - started
+        print(f"  {done:,} / {count:,}  ({elapsed:.1f}초, {done / elapsed:,.0f}개/초)")
+
+    totals = bulk_load(db_path, count, seed, stations=stations, overwrite=overwrite, progress=progress)
+    elapsed = time.perf_counter() - started
+
+    print(f"\n  수영장: {totals['pools']:,}")
+    print(f"  자유수영 세션: {totals['free_swim_sessions']:,}")
+    print(f"  지하철역 행: {totals['pool_stations']:,}" + ("" if stations else " (--no-stations)"))
+    print(f"  파일 크기: {os.path.getsize(db_path) / 1024 / 1024:,.1f}MB")
+    print(f"  소요 시간: {elapsed:.1f}초 (인덱스/FTS 포함)")
+
+    print(f"\n{'='*60}")
+    print(f"  완료!")
+    print(f"{'='*60}\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="합성 수영장 데이터 생성기")
+    parser.add_argument("--count", type=int, default=100000, help="생성할 수영장 수")
+    parser.add_argument("--db", default="synthetic_pools.db", help="만들 SQLite 파일 경로")
+    parser.add_argument("--seed", type=int, default=42, help="난수 시드 (같으면 같은 데이터)")
+    parser.add_argument("--no-stations", action="store_true", help="주변 지하철역(pool_stations) 계산 생략")
+    parser.add_argument("--overwrite", action="store_true", help="파일이 있으면 지우고 새로 만듦")
+    parser.add_argument("--print", dest="print_only", action="store_true", help="DB 없이 생성 결과 JSON만 출력")
+    args = parser.parse_args()
+
+    run(args.count, args.db, args.seed, stations=not args.no_stations,
+        overwrite=args.overwrite, print_only=args.print_only)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+"""
+DB 마이그레이션: 자유수영 성인 평일 가격 컬럼 추가
+
+변경사항:
+  - 추가 컬럼: free_swim_adult_weekday_price (INTEGER) + 인덱스
+  - 기존 데이터 백필: pricing JSON의 자유수영.성인.평일 값을 컬럼에 저장
+
+가격 필터/정렬이 json_extract 대신 이 컬럼의 인덱스를 사용한다.
+이후에는 crud 생성/수정 함수와 llm_enricher가 쓰기 시점에 동기화.
+
+init_db()(앱 시작, 백필 스크립트)가 컬럼이 없으면 같은 추가/백필을 자동으로 실행한다
+(database.connection.migrate_price_column). 이 스크립트는 백업/--dry-run을 거쳐 수동으로
+실행하거나, 이미 있는 컬럼을 pricing JSON에서 다시 백필할 때 사용.
+
+사용법:
+  python scripts/migrate_price_column.py           # 마이그레이션 실행
+  python scripts/migrate_price_column.py --dry-run # 변경 사항만 출력
+"""
+import sys
+import os
+import io
+sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import sqlite3
+import shutil
+import argparse
+from datetime import datetime
+
+from app.crud.swimming_pool import extract_free_swim_price
+
+
+DB_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "swimming_pools.db")
+
+COLUMN = "free_swim_adult_weekday_price"
+INDEX = f"ix_swimming_pools_{COLUMN}"
+
+
+def get_existing_columns(cursor):
+    """현재 테이블의 컬럼 목록 반환"""
+    cursor.execute("PRAGMA table_info(swimming_pools)")
+    return {row[1] for row in cursor.fetchall()}
+
+
+def backup_db():
+    """마이그레이션 전 DB 백업"""
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    backup_path = f"{DB_PATH}.pre-migration-{timestamp}"
+    shutil.copy2(DB_PATH, backup_path)
+    print(f"  DB 백업 완료: {backup_path}")
+    return backup_path
+
+
+def add_price_column(cursor, existing_cols, dry_run=False):
+    """컬럼 + 인덱스 추가"""
+    statements = []
+    if COLUMN not in existing_cols:
+        statements.append(f"ALTER TABLE swimming_pools ADD COLUMN {COLUMN} INTEGER")
+    statements.append(f"CREATE INDEX IF NOT EXISTS {INDEX} ON swimming_pools ({COLUMN})")
+
+    for sql in statements:
+        if dry_run:
+            print(f"  [DRY-RUN] {sql}")
+        else:
+            cursor.execute(sql)
+            print(f"  + {sql}")
+
+
+def backfill_prices(cursor, dry_run=False):
+    """pricing JSON → 가격 컬럼 백필"""
+    cursor.execute("SELECT id, pricing FROM swimming_pools")
+    rows = cursor.fetchall()
+
+    updates = [(extract_free_swim_price(pricing), pool_id) for pool_id, pricing in rows]
+    filled = sum(1 for price, _ in updates if price is not None)
+
+    if dry_run:
+        print(f"  [DRY-RUN] {len(updates)}건 중 {filled}건 가격 설정 예정")
+    else:
+        cursor.executemany(f"UPDATE swimming_pools SET {COLUMN} = ? WHERE id = ?", updates)
+        print(f"  {len(updates)}건 중 {filled}건 가격 설정")
+
+    return filled
+
+
+def run_migration(dry_run=False):
+    """마이그레이션 메인 실행"""
+    mode = " [DRY-RUN]" if dry_run else ""
+    print(f"\n{'='*60}")
+    print(f"  가격 컬럼 마이그레이션{mode}")
+    print(f"{'='*60}\n")
+
+    if not os.path.exists(DB_PATH):
+        print(f"  DB 파일 없음: {DB_PATH}")
+        sys.exit(1)
+
+    if not dry_run:
+        backup_db()
+
+    conn = sqlite3.connect(DB_PATH)
+    cursor = conn.cursor()
+
+    try:
+        existing_cols = get_existing_columns(cursor)
+
+        print(f"\n[1/2] 컬럼/인덱스 추가")
+        add_price_column(cursor, existing_cols, dry_run)
+
+        print(f"\n[2/2] 가격 백필")
+        backfill_prices(cursor, dry_run)
+
+        if not dry_run:
+            conn.commit()
+
+        print(f"\n{'='*60}")
+        print(f"  마이그레이션 완료!{mode}")
+        print(f"{'='*60}\n")
+
+    except Exception as e:
+        print(f"\n  마이그레이션 실패: {e}")
+        if not dry_run:
+            conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="자유수영 가격 컬럼 마이그레이션")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="DB 변경 없이 변경 사항만 출력")
+    args = parser.parse_args()
+
+    run_migration(dry_run=args.dry_run)
+
+
+if __name__ == "__main__":
+    main()
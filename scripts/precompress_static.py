@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+"""
+정적 파일 미리 압축 (.br / .gz)
+
+frontend/css, js, data의 텍스트 파일마다 최대 압축 수준으로 .br(brotli)과 .gz 파일을 만든다.
+앱의 PrecompressedStaticFiles가 Accept-Encoding에 맞춰 이 파일을 Content-Encoding과 함께 응답.
+원본보다 오래된 압축 파일은 무시되므로 원본을 고치면 다시 실행 (build.sh에서 자동 실행).
+
+사용법:
+  python scripts/precompress_static.py          # 압축 파일 생성
+  python scripts/precompress_static.py --clean  # 생성한 압축 파일 삭제
+"""
+import sys
+import os
+import io
+sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import gzip
+import argparse
+
+from app.api.compression import COMPRESS_MIN_SIZE, SUFFIXES, brotli
+
+
+FRONTEND_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "frontend")
+STATIC_DIRS = ("css", "js", "data")
+EXTENSIONS = (".css", ".js", ".json", ".html", ".svg", ".txt")
+
+
+def static_files(root=FRONTEND_DIR):
+    """압축 대상 원본 파일 경로"""
+    for name in STATIC_DIRS:
+        for dirpath, _, filenames in os.walk(os.path.join(root, name)):
+            for filename in sorted(filenames):
+                if filename.endswith(EXTENSIONS):
+                    yield os.path.join(dirpath, filename)
+
+
+def compress_file(path):
+    """한 파일의 .br/.gz 생성 → [(인코딩, 압축 크기)] (원본보다 작을 때만 저장)"""
+    with open(path, "rb") as f:
+        data = f.read()
+
+    encoders = {"gzip": lambda body: gzip.compress(body, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        encoders["br"] = lambda body: brotli.compress(body, quality=11)
+
+    written = []
+    for encoding, encode in encoders.items():
+        target = path + SUFFIXES[encoding]
+        body = encode(data)
+        if len(body) >= len(data):
+            if os.path.exists(target):
+                os.remove(target)
+            continue
+        with open(target, "wb") as f:
+            f.write(body)
+        written.append((encoding, len(body)))
+    return written
+
+
+def run(clean=False):
+    mode = " [CLEAN]" if clean else ""
+    print(f"\n{'='*60}")
+    print(f"  정적 파일 미리 압축{mode}")
+    print(f"{'='*60}\n")
+
+    if brotli is None and not clean:
+        print("  brotli 패키지 없음 → .gz만 생성")
+
+    for path in static_files():
+        rel = os.path.relpath(path, FRONTEND_DIR)
+        if clean:
+            for suffix in SUFFIXES.values():
+                if os.path.exists(path + suffix):
+                    os.remove(path + suffix)
+                    print(f"  - {rel}{suffix}")
+            continue
+
+        size = os.path.getsize(path)
+        if size < COMPRESS_MIN_SIZE:
+            print(f"  {rel}: {size:,}B (작아서 생략)")
+            continue
+        sizes = ", ".join(f"{enc} {length:,}B" for enc, length in compress_file(path))
+        print(f"  {rel}: {size:,}B → {sizes}")
+
+    print(f"\n{'='*60}")
+    print(f"  완료!{mode}")
+    print(f"{'='*60}\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="정적 파일 미리 압축")
+    parser.add_argument("--clean", action="store_true",
+                        help="생성한 .br/.gz 파일 삭제")
+    args = parser.parse_args()
+
+    run(clean=args.clean)
+
+
+if __name__ == "__main__":
+    main()
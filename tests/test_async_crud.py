@@ -0,0 +1,33 @@
+import asyncio
+
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.crud import swimming_pool as crud
+from app.crud import swimming_pool_async as crud_async
+from tests.test_spatial_index import _seed
+
+
+def test_async_crud_matches_sync(db):
+    _seed(db, count=50)
+    url = str(db.get_bind().url).replace("sqlite://", "sqlite+aiosqlite://", 1)
+    queries = [
+        ("get_swimming_pools", dict(limit=20, sort="name")),
+        ("search_nearby_pools", dict(lat=37.55, lng=126.98, radius_km=5.0)),
+    ]
+
+    async def run_async():
+        engine = create_async_engine(url)
+        try:
+            async with async_sessionmaker(engine)() as session:
+                results = [
+                    [p.id for p in await getattr(crud_async, name)(session, **kwargs)]
+                    for name, kwargs in queries
+                ]
+                pool = await crud_async.get_swimming_pool(session, 3)
+                return results, pool.name
+        finally:
+            await engine.dispose()
+
+    expected = [[p.id for p in getattr(crud, name)(db, **kwargs)] for name, kwargs in queries]
+    assert asyncio.run(run_async()) == (expected, crud.get_swimming_pool(db, 3).name)
+    assert all(expected)
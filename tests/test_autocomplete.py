@@ -0,0 +1,46 @@
+from app.crud import swimming_pool as crud
+from app.schemas.swimming_pool import SwimmingPoolCreate
+from app.services.autocomplete import TOP_K, AutocompleteIndex, districts_of, to_choseong
+
+
+def test_to_choseong_and_districts():
+    assert to_choseong("올림픽공원 수영장") == "ㅇㄹㅍㄱㅇ ㅅㅇㅈ"
+    assert districts_of("서울특별시 송파구 올림픽로 424") == ["송파구"]
+    assert districts_of("경기도 수원시 장안구 송정로") == ["수원시", "장안구"]
+
+
+def test_suggest_name_choseong_and_district(db):
+    for name, address in [
+        ("올림픽공원 수영장", "서울 송파구 올림픽로 424"),
+        ("올림픽수영장", "서울 송파구 방이동"),
+        ("잠실 제1수영장", "서울 송파구 올림픽로 25"),
+    ]:
+        crud.create_swimming_pool(db, SwimmingPoolCreate(name=name, address=address, source="test"))
+    index = AutocompleteIndex()
+    index.rebuild(db)
+
+    names = lambda q: [item["name"] for item in index.suggest(q)]
+    # 이름이 짧은 것 먼저
+    assert names("ㅇㄹㅍ") == ["올림픽수영장", "올림픽공원 수영장"]
+    assert names("올ㄹ픽ㄱ") == ["올림픽공원 수영장"]
+    assert names("송파") == ["송파구"]
+    assert index.suggest("ㅅㅍ")[0] == {"type": "district", "name": "송파구", "count": 3}
+    # 이름 속 단어의 시작도 일치 (단어 중간은 제외)
+    assert names("수영장") == ["올림픽공원 수영장"]
+    assert names("제1") == ["잠실 제1수영장"] and names("잠실제1") == ["잠실 제1수영장"]
+    assert names("1수영") == []
+
+
+def test_suggest_mixed_beyond_top_k(db):
+    # 초성 "ㅇㄹ"로 시작하는 더 짧은 이름이 TOP_K개보다 많아 초성 노드 후보에는 찾는 이름이 없음
+    for i in range(TOP_K + 10):
+        crud.create_swimming_pool(db, SwimmingPoolCreate(name=f"이로{i}", address="서울 강남구", source="test"))
+    crud.create_swimming_pool(db, SwimmingPoolCreate(name="올림픽기념 국민생활관 수영장", address="서울 송파구", source="test"))
+    index = AutocompleteIndex()
+    index.rebuild(db)
+
+    names = lambda q, limit=10: [item["name"] for item in index.suggest(q, limit)]
+    assert names("올ㄹ") == ["올림픽기념 국민생활관 수영장"]
+    assert names("ㅇ림ㅍㄱ념") == ["올림픽기념 국민생활관 수영장"]
+    assert names("이ㄹ", TOP_K) == [f"이로{i}" for i in range(10)] + [f"이로{i}" for i in range(10, 20)]
+    assert names("ㅇ로ㅇ") == []
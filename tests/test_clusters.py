@@ -0,0 +1,33 @@
+import pytest
+from fastapi import HTTPException
+
+from app.api.pools import _parse_bbox
+from app.services.clusters import CLUSTER_MAX_ZOOM, ClusterIndex
+
+
+@pytest.mark.parametrize("bbox", [
+    "nan,nan,nan,nan",
+    "1,2,inf,4",
+    "-inf,126,37,127",
+    "37,126,91,127",
+    "37,-181,38,127",
+    "38,126,37,127",
+    "37,126,38",
+    "a,b,c,d",
+])
+def test_parse_bbox_rejects_bad_values(bbox):
+    with pytest.raises(HTTPException) as exc:
+        _parse_bbox(bbox)
+    assert exc.value.status_code == 400
+
+
+def test_parse_bbox():
+    assert _parse_bbox("37.4,126.8,37.7,127.2") == (37.4, 126.8, 37.7, 127.2)
+
+
+def test_pools_in_limit():
+    pools = [(i, f"pool {i}", 37.5 + i * 1e-4, 127.0 + i * 1e-4, None) for i in range(1, 51)]
+    index = ClusterIndex(pools)
+    assert len(index.pools_in(37, 126, 38, 128, limit=50)) == 50
+    assert index.pools_in(37, 126, 38, 128, limit=49) is None
+    assert sum(c["count"] for c in index.clusters(37, 126, 38, 128, CLUSTER_MAX_ZOOM - 1)) == 50
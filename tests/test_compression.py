@@ -0,0 +1,46 @@
+import gzip
+
+from fastapi import FastAPI
+from fastapi.responses import Response
+from fastapi.testclient import TestClient
+
+from app.api.compression import CompressionMiddleware, PrecompressedStaticFiles, negotiate
+
+
+def test_negotiate():
+    assert negotiate("gzip, deflate, br") == "br"
+    assert negotiate("gzip;q=1.0, br;q=0.5") == "gzip"
+    assert negotiate("br;q=0, *") == "gzip"
+    assert negotiate("identity") is None
+    assert negotiate(None) is None
+
+
+def test_middleware_and_precompressed_static(tmp_path):
+    (tmp_path / "app.js").write_text("console.log('x');\n" * 200)
+    (tmp_path / "app.js.gz").write_bytes(gzip.compress((tmp_path / "app.js").read_bytes()))
+
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, minimum_size=100)
+    app.mount("/js", PrecompressedStaticFiles(directory=tmp_path), name="js")
+
+    @app.get("/big")
+    def big():
+        return Response(b"[" + b",".join([b'{"name":"pool"}'] * 100) + b"]", media_type="application/json")
+
+    @app.get("/small")
+    def small():
+        return {"ok": True}
+
+    client = TestClient(app)
+    response = client.get("/big", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert len(response.json()) == 100
+    assert "content-encoding" not in client.get("/small", headers={"Accept-Encoding": "gzip"}).headers
+
+    response = client.get("/js/app.js", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["content-type"].startswith("text/javascript")
+    assert int(response.headers["content-length"]) == (tmp_path / "app.js.gz").stat().st_size
+    assert response.text == (tmp_path / "app.js").read_text()
+    assert "content-encoding" not in client.get("/js/app.js", headers={"Accept-Encoding": "identity"}).headers
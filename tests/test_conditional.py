@@ -0,0 +1,51 @@
+import threading
+
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.conditional import index_conditional_get
+from app.crud import swimming_pool as crud
+from app.schemas.swimming_pool import SwimmingPoolCreate
+from app.services import data_version
+from app.services.autocomplete import AutocompleteIndex
+
+
+def test_index_etag_follows_rebuilt_version(db, monkeypatch):
+    data_version.install(db.get_bind())
+    crud.create_swimming_pool(db, SwimmingPoolCreate(name="올림픽 수영장", address="서울 송파구", source="test"))
+    index = AutocompleteIndex()
+    index.rebuild(db)
+
+    app = FastAPI()
+
+    @app.get("/suggest", dependencies=[Depends(index_conditional_get(index))])
+    def suggest(q: str):
+        return index.suggest(q)
+
+    client = TestClient(app)
+    first = client.get("/suggest?q=올림")
+    etag = first.headers["etag"]
+
+    # 데이터가 바뀌고 재구축이 막혀 있는 동안은 이전 결과 + 이전 ETag
+    crud.create_swimming_pool(db, SwimmingPoolCreate(name="올림푸스 스포츠", address="서울 마포구", source="test"))
+    started, release = threading.Event(), threading.Event()
+    insert = AutocompleteIndex._insert
+
+    def blocked_insert(root, key, entry):
+        started.set()
+        release.wait(5)
+        insert(root, key, entry)
+
+    monkeypatch.setattr(AutocompleteIndex, "_insert", staticmethod(blocked_insert))
+    rebuild = threading.Thread(target=index.rebuild, args=(db,))
+    rebuild.start()
+    assert started.wait(5)
+    assert data_version.read_version(db) != index.version
+    assert client.get("/suggest?q=올림", headers={"If-None-Match": etag}).status_code == 304
+
+    release.set()
+    rebuild.join(5)
+    second = client.get("/suggest?q=올림", headers={"If-None-Match": etag})
+    assert second.status_code == 200
+    assert second.headers["etag"] != etag
+    assert len(second.json()) == len(first.json()) + 1
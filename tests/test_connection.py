@@ -0,0 +1,91 @@
+import sqlite3
+
+import pytest
+from sqlalchemy import create_engine, exc, text
+
+from app.models.swimming_pool import Base
+from database.connection import THREADPOOL_SIZE, _engine_kwargs, configure_sqlite, init_db, sqlite_connect
+
+
+def test_writer_and_reader_pragmas(tmp_path):
+    url = f"sqlite:///{tmp_path / 'pragma.db'}"
+    writer = create_engine(url)
+    reader = create_engine(url)
+    configure_sqlite(writer)
+    configure_sqlite(reader, readonly=True)
+
+    with writer.begin() as conn:
+        assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+        assert conn.execute(text("PRAGMA foreign_keys")).scalar() == 1
+        assert conn.execute(text("PRAGMA busy_timeout")).scalar() > 0
+        conn.execute(text("CREATE TABLE t (x INTEGER)"))
+        conn.execute(text("INSERT INTO t VALUES (1)"))
+
+    with reader.connect() as conn:
+        assert conn.execute(text("SELECT x FROM t")).scalar() == 1
+        with pytest.raises(Exception, match="readonly"):
+            conn.execute(text("INSERT INTO t VALUES (2)"))
+
+    writer.dispose()
+    reader.dispose()
+
+
+def test_sqlite_connect_uses_wal(tmp_path):
+    conn = sqlite_connect(str(tmp_path / "raw.db"))
+    try:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+    finally:
+        conn.close()
+
+    conn = sqlite_connect(str(tmp_path / "raw.db"), readonly=True)
+    try:
+        with pytest.raises(sqlite3.OperationalError):
+            conn.execute("CREATE TABLE t (x INTEGER)")
+    finally:
+        conn.close()
+
+
+def test_read_pool_covers_threadpool(tmp_path):
+    # 스레드풀의 모든 스레드가 동시에 조회해도 pool_timeout까지 기다리지 않음
+    reader = create_engine(f"sqlite:///{tmp_path / 'pool.db'}", pool_timeout=0.1, **_engine_kwargs(
+        pool_size=2, max_overflow=THREADPOOL_SIZE - 2
+    ))
+    connections = [reader.connect() for _ in range(THREADPOOL_SIZE)]
+    with pytest.raises(exc.TimeoutError):
+        reader.connect()
+    for conn in connections:
+        conn.close()
+    assert reader.pool.checkedin() == 2
+    reader.dispose()
+
+
+def test_init_db_migrates_price_column(tmp_path):
+    # 가격 컬럼이 생기기 전 스키마의 DB
+    path = tmp_path / "old.db"
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(bind=engine)
+    engine.dispose()
+    conn = sqlite3.connect(path)
+    conn.execute("DROP INDEX ix_swimming_pools_free_swim_adult_weekday_price")
+    conn.execute("ALTER TABLE swimming_pools DROP COLUMN free_swim_adult_weekday_price")
+    conn.executemany(
+        "INSERT INTO swimming_pools (name, address, pricing) VALUES (?, ?, ?)",
+        [
+            ("평일 3400", "서울", '{"자유수영": {"성인": {"평일": 3400}}}'),
+            ("무료", "서울", '{"자유수영": {"성인": 0}}'),
+            ("가격 없음", "서울", "null"),
+        ],
+    )
+    conn.commit()
+    conn.close()
+
+    engine = create_engine(f"sqlite:///{path}")
+    init_db(engine)
+    init_db(engine)  # 두 번째는 그대로
+    with engine.connect() as conn:
+        prices = conn.execute(text("SELECT name, free_swim_adult_weekday_price FROM swimming_pools ORDER BY id")).all()
+        indexes = {row[1] for row in conn.execute(text("PRAGMA index_list(swimming_pools)"))}
+    engine.dispose()
+    assert prices == [("평일 3400", 3400), ("무료", 0), ("가격 없음", None)]
+    assert "ix_swimming_pools_free_swim_adult_weekday_price" in indexes
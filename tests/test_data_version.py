@@ -0,0 +1,33 @@
+import threading
+
+from app.services import data_version as data_version_module
+from app.services.data_version import DataVersion
+
+
+def test_listeners_run_off_the_caller_thread(db):
+    bind = db.get_bind()
+    data_version_module.install(bind)
+    version = DataVersion(ttl=60, bind=bind)
+    first = version.current()
+
+    started, release, done = threading.Event(), threading.Event(), threading.Event()
+    threads = []
+
+    def rebuild():
+        threads.append(threading.current_thread())
+        started.set()
+        release.wait(5)
+        done.set()
+
+    version.subscribe(rebuild)
+    data_version_module.bump(bind)
+    version.invalidate()
+
+    # 호출한 쪽은 재구축을 기다리지 않고 새 버전을 바로 받음
+    second = version.current()
+    assert second != first
+    assert started.wait(5) and not done.is_set()
+    assert threads == [version._notifier]
+
+    release.set()
+    assert done.wait(5)
@@ -0,0 +1,38 @@
+import random
+
+import pytest
+
+from app.crud.swimming_pool import calculate_distance
+from app.services import distance as distance_engine
+
+
+def test_haversine_many_matches_reference():
+    rng = random.Random(3)
+    lats = [33 + rng.random() * 5 for _ in range(1000)]
+    lngs = [125 + rng.random() * 5 for _ in range(1000)]
+
+    result = distance_engine.haversine_many(37.5665, 126.978, lats, lngs)
+
+    expected = [calculate_distance(37.5665, 126.978, la, ln) for la, ln in zip(lats, lngs)]
+    assert result.tolist() == pytest.approx(expected, rel=1e-12)
+
+
+def test_within_radius_masks_and_sorts_like_reference():
+    rng = random.Random(5)
+    lats = [37.4 + rng.random() * 0.3 for _ in range(500)] + [None, 0.0]
+    lngs = [126.8 + rng.random() * 0.4 for _ in range(500)] + [127.0, 127.0]
+
+    order, dists = distance_engine.within_radius(37.55, 127.0, lats, lngs, 7.5)
+
+    expected = sorted(
+        (calculate_distance(37.55, 127.0, la, ln), i)
+        for i, (la, ln) in enumerate(zip(lats, lngs))
+        if la and ln and calculate_distance(37.55, 127.0, la, ln) <= 7.5
+    )
+    assert order.tolist() == [i for _, i in expected]
+    assert dists.tolist() == pytest.approx([d for d, _ in expected], rel=1e-12)
+
+
+def test_within_radius_empty_input():
+    order, dists = distance_engine.within_radius(37.5, 127.0, [], [], 5.0)
+    assert order.size == 0 and dists.size == 0
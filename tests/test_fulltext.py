@@ -0,0 +1,58 @@
+from sqlalchemy import text
+
+from app.crud import swimming_pool as crud
+from app.models.swimming_pool import SwimmingPool
+from app.schemas.swimming_pool import SwimmingPoolCreate
+from app.services import fulltext
+
+
+def _create(db, name, address, notes=None):
+    return crud.create_swimming_pool(db, SwimmingPoolCreate(
+        name=name, address=address, notes=notes, source="test",
+    ))
+
+
+def test_search_ranks_and_follows_writes(db):
+    fulltext.install(db.get_bind())
+    olympic = _create(db, "올림픽공원 수영장", "서울 송파구 올림픽로 424")
+    gangnam = _create(db, "강남구민체육센터", "서울 강남구 선릉로 99", notes="올림픽 규격 50m")
+    other = _create(db, "잠실 제1수영장", "서울 송파구 올림픽로 25")
+
+    names = lambda q: [p.name for p in crud.search_pools_by_text(db, q)]
+    # 이름 일치가 주소/비고 일치보다 앞
+    assert names("올림픽")[0] == olympic.name
+    assert set(names("올림픽")) == {olympic.name, gangnam.name, other.name}
+    # 짧은 검색어(LIKE)와 여러 단어 AND
+    assert names("강남") == [gangnam.name]
+    assert names("송파구 잠실") == [other.name]
+
+    crud.update_swimming_pool(db, gangnam.id, {"name": "역삼 아쿠아센터"})
+    assert names("아쿠아센터") == ["역삼 아쿠아센터"]
+    assert names("체육센터") == []
+
+    db.delete(db.get(SwimmingPool, other.id))
+    db.commit()
+    assert names("제1수영장") == []
+
+
+def test_short_terms_use_bigram_index(db):
+    fulltext.install(db.get_bind())
+    mapo = _create(db, "마포구민체육센터", "서울 마포구 월드컵로 1", notes="Kids 풀 운영")
+    _create(db, "노원구민체육센터", "서울 노원구 동일로 2")
+
+    names = lambda q: [p.name for p in crud.search_pools_by_text(db, q)]
+    assert names("마포") == [mapo.name]
+    assert names("kI") == [mapo.name]
+    assert names("풀") == [mapo.name]
+    assert names("로 구민") == ["마포구민체육센터", "노원구민체육센터"]
+
+    crud.update_swimming_pool(db, mapo.id, {"address": "서울 용산구 한강대로 3", "notes": None})
+    assert names("마포") == [mapo.name]  # 이름에 남아 있음
+    assert names("용산") == [mapo.name]
+    assert names("풀") == []
+
+    # 짧은 검색어만 있을 때 swimming_pools 전체 스캔 없이 pools_bigram 기본키로 찾음
+    sql, params = fulltext.build_query(["마포", "센"], 20)
+    plans = [row[-1] for row in db.execute(text("EXPLAIN QUERY PLAN " + sql), params)]
+    assert not any(plan.startswith("SCAN") for plan in plans)
+    assert sum("pools_bigram USING PRIMARY KEY" in plan for plan in plans) == 2
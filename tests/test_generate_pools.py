@@ -0,0 +1,32 @@
+import sqlite3
+
+from app.crud.swimming_pool import extract_free_swim_price
+from scripts.generate_pools import bulk_load, generate_pools
+
+
+def test_generate_pools_is_deterministic():
+    first = list(generate_pools(300, seed=7))
+    assert first == list(generate_pools(300, seed=7))
+    assert first != list(generate_pools(300, seed=8))
+    assert [pool["id"] for pool in first] == list(range(1, 301))
+    assert any(isinstance(pool["free_swim_schedule"], dict) and "휴관" in pool["free_swim_schedule"] for pool in first)
+    assert all(33 < pool["lat"] < 39 and 124 < pool["lng"] < 131 for pool in first)
+
+
+def test_bulk_load(tmp_path):
+    path = str(tmp_path / "pools.db")
+    totals = bulk_load(path, 200, seed=3)
+    assert totals["pools"] == 200
+
+    conn = sqlite3.connect(path)
+    try:
+        assert conn.execute("SELECT COUNT(*) FROM swimming_pools").fetchone()[0] == 200
+        assert conn.execute("SELECT COUNT(*) FROM free_swim_sessions").fetchone()[0] == totals["free_swim_sessions"]
+        assert conn.execute("SELECT COUNT(*) FROM pools_fts WHERE pools_fts MATCH '체육센터'").fetchone()[0] > 0
+        assert conn.execute("SELECT version FROM data_version").fetchone() is not None
+        prices = dict(conn.execute("SELECT id, free_swim_adult_weekday_price FROM swimming_pools"))
+    finally:
+        conn.close()
+
+    for pool in generate_pools(200, seed=3):
+        assert prices[pool["id"]] == extract_free_swim_price(pool["pricing"])
@@ -0,0 +1,12 @@
+from app.services.markers import columnar_markers
+
+
+def test_weekend_price_falls_back_only_when_missing():
+    rows = [
+        (1, "무료 주말", 37.5, 127.0, {"자유수영": {"성인": {"평일": 3000, "주말": 0}}}),
+        (2, "평일만", 37.5, 127.0, {"자유수영": {"성인": {"평일": 3000}}}),
+        (3, "단일 가격", 37.5, 127.0, {"자유수영": {"성인": 2500}}),
+    ]
+    assert columnar_markers(rows, {1}, "토")["prices"] == [0, 3000, 2500]
+    assert columnar_markers(rows, {1}, "월")["prices"] == [3000, 3000, 2500]
+    assert columnar_markers(rows, {1}, "토")["free_swim"] == [1, 0, 0]
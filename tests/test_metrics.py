@@ -0,0 +1,36 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.metrics import Histogram, MetricsMiddleware, MetricsRegistry
+
+
+def test_histogram_buckets():
+    histogram = Histogram((0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 3.0):
+        histogram.observe(value)
+    assert histogram.counts == [2, 1, 1]
+    assert histogram.total == 3.65
+
+
+def test_middleware_labels_route_templates():
+    registry = MetricsRegistry()
+    app = FastAPI()
+    app.add_middleware(MetricsMiddleware, registry=registry)
+
+    @app.get("/pools/{pool_id}")
+    def pool(pool_id: int):
+        return {"id": pool_id}
+
+    client = TestClient(app)
+    for pool_id in (1, 2, 3):
+        client.get(f"/pools/{pool_id}")
+    client.get("/pools/abc")
+    client.get("/nope")
+
+    text = registry.render()
+    assert 'http_requests_total{method="GET",route="/pools/{pool_id}",status="200"} 3' in text
+    assert 'http_requests_total{method="GET",route="/pools/{pool_id}",status="422"} 1' in text
+    assert 'http_requests_total{method="GET",route="unmatched",status="404"} 1' in text
+    assert 'http_request_duration_seconds_bucket{method="GET",route="/pools/{pool_id}",le="+Inf"} 4' in text
+    assert 'http_response_size_bytes_count{method="GET",route="/pools/{pool_id}"} 4' in text
+    assert "/pools/1" not in text
@@ -0,0 +1,62 @@
+import pytest
+
+from app.crud import swimming_pool as crud
+from app.schemas.swimming_pool import SwimmingPoolCreate
+from app.services.snapshot import PoolSnapshot
+
+
+def _seed(db):
+    # 같은 이름/같은 가격(동순위)과 가격 있는 구간 → 없는 구간 경계가 페이지 중간에 걸리도록
+    rows = [
+        ("나", 3000), ("가", None), ("나", 0), ("다", 3000), ("가", 3000),
+        ("나", None), ("라", 2000), ("가", 0), ("다", None), ("나", 3000),
+    ]
+    for i, (name, price) in enumerate(rows):
+        crud.create_swimming_pool(db, SwimmingPoolCreate(
+            name=name, address="서울특별시", lat=37.5 + i * 0.001, lng=127.0, source="test",
+            pricing={"자유수영": {"성인": {"평일": price}}} if price is not None else None,
+        ))
+
+
+def _walk(fetch, sort, page_size):
+    """커서로 끝까지 넘기며 모은 ID (페이지가 가득 찼을 때만 다음 커서, API와 같은 규칙)"""
+    ids, after = [], None
+    while True:
+        page = fetch(limit=page_size, sort=sort, after=after)
+        ids += [pool.id for pool in page]
+        if len(page) < page_size:
+            return ids
+        after = crud.decode_cursor(crud.encode_cursor(page[-1], sort), sort)
+
+
+@pytest.mark.parametrize("sort", [None, "name", "price"])
+def test_keyset_pages_cover_every_row_once(db, sort):
+    _seed(db)
+    expected = [pool.id for pool in crud.get_swimming_pools(db, limit=-1, sort=sort)]
+    assert len(expected) == 10
+
+    snapshot = PoolSnapshot(db, "v1")
+    for page_size in (1, 2, 3, 4, 10):
+        assert _walk(lambda **kw: crud.get_swimming_pools(db, **kw), sort, page_size) == expected
+        assert _walk(snapshot.list_pools, sort, page_size) == expected
+
+    # limit < 0은 제한 없음 (스냅샷과 같은 의미)
+    assert [pool.id for pool in snapshot.list_pools(limit=-1, sort=sort)] == expected
+
+
+def test_keyset_sort_orders(db):
+    _seed(db)
+    by_price = crud.get_swimming_pools(db, limit=-1, sort="price")
+    assert [p.free_swim_adult_weekday_price for p in by_price] == [0, 0, 2000, 3000, 3000, 3000, 3000, None, None, None]
+    by_name = crud.get_swimming_pools(db, limit=-1, sort="name")
+    assert [(p.name, p.id) for p in by_name] == sorted((p.name, p.id) for p in by_name)
+
+
+def test_in_bounds_pages_cover_every_row_once(db):
+    _seed(db)
+    box = dict(south=37.4, west=126.9, north=37.6, east=127.1)
+    expected = sorted(pool.id for pool in crud.get_pools_in_bounds(db, limit=-1, **box))
+    assert len(expected) == 10
+    for page_size in (1, 3, 4):
+        fetch = lambda limit, sort, after: crud.get_pools_in_bounds(db, limit=limit, after=after, **box)
+        assert _walk(fetch, None, page_size) == expected
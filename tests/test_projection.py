@@ -0,0 +1,42 @@
+import json
+
+from sqlalchemy import event, inspect
+
+from app.api.projection import column_fields, encode_pool
+from app.crud import swimming_pool as crud
+from app.schemas.swimming_pool import SwimmingPoolCreate, SwimmingPoolResponse
+
+
+def test_encode_pool_matches_response_model_and_follows_updates(db):
+    pool = crud.create_swimming_pool(db, SwimmingPoolCreate(
+        name="강남 수영장", address="서울 강남구", lat=37.4981, lng=127.0277, source="test",
+        pricing={"자유수영": {"성인": {"평일": 3400}}}, free_swim_schedule={"토": ["09:00-10:50"]},
+    ))
+    expected = json.loads(SwimmingPoolResponse.model_validate(pool).model_dump_json())
+    assert json.loads(encode_pool(pool)) == expected
+    assert json.loads(encode_pool(pool, extra={"distance": 1.5})) == {**expected, "distance": 1.5}
+
+    pool = crud.update_swimming_pool(db, pool.id, {"notes": "수모 필수"})
+    assert json.loads(encode_pool(pool))["notes"] == "수모 필수"
+
+
+def test_nearest_station_loaded_only_when_requested(db):
+    crud.create_swimming_pool(db, SwimmingPoolCreate(
+        name="강남 수영장", address="서울 강남구", lat=37.4981, lng=127.0277, source="test",
+    ))
+    db.expire_all()
+    statements = []
+    event.listen(db.get_bind(), "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+    def load(fields):
+        statements.clear()
+        pool = crud.get_swimming_pools(db, columns=column_fields(fields))[0]
+        db.expunge(pool)
+        return pool, len(statements)
+
+    pool, queries = load(["id", "name"])
+    assert queries == 1 and "nearest_station_row" in inspect(pool).unloaded
+    pool, queries = load(["id", "name", "nearest_station"])
+    assert queries == 2 and "nearest_station_row" not in inspect(pool).unloaded
+    pool, queries = load(None)
+    assert queries == 2 and "nearest_station_row" not in inspect(pool).unloaded
@@ -0,0 +1,34 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import StaticPool
+
+from app.api.query_stats import QueryTimingMiddleware, instrument, normalize_sql
+
+
+def test_normalize_sql():
+    assert normalize_sql(
+        "SELECT p.id AS p_id\n  FROM pools p WHERE p.name = 'x''y' AND p.id IN (?, ?, ?) LIMIT 10"
+    ) == "SELECT p.id FROM pools p WHERE p.name = ? AND p.id IN (...) LIMIT ?"
+
+
+def test_server_timing_counts_request_queries():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    instrument(engine)
+
+    app = FastAPI()
+    app.add_middleware(QueryTimingMiddleware, server_timing=True)
+
+    @app.get("/rows/{n}")
+    def rows(n: int):
+        with engine.connect() as conn:
+            for i in range(n):
+                conn.execute(text("SELECT :i"), {"i": i})
+        return {"n": n}
+
+    client = TestClient(app)
+    timing = client.get("/rows/3").headers["server-timing"]
+    assert timing.startswith("db;dur=")
+    assert 'desc="3 queries"' in timing
+    assert "db-slowest;dur=" in timing
+    assert "server-timing" not in client.get("/rows/0").headers
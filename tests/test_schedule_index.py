@@ -0,0 +1,44 @@
+from app.crud import swimming_pool as crud
+from app.schemas.swimming_pool import SwimmingPoolCreate
+
+
+SCHEDULES = [
+    {"토": ["09:00-10:50", "13:00-14:50"], "휴관": "매월 첫째 일요일"},
+    {"월": ["06:00-07:00"], "토": ["10:30-12:00"]},
+    {"토": ["06:00-07:50"], "일": ["bad", "08:00-09:00-10:00"]},
+    {"휴관": "토요일, 일요일"},
+    None,
+]
+
+
+def test_compile_free_swim_sessions():
+    assert crud.compile_free_swim_sessions(SCHEDULES[0]) == [("토", 540, 650), ("토", 780, 890)]
+    assert crud.compile_free_swim_sessions(SCHEDULES[2]) == [("토", 360, 470)]
+    assert crud.compile_free_swim_sessions(SCHEDULES[3]) == []
+    assert crud.compile_free_swim_sessions(None) == []
+
+
+def test_time_filter_matches_is_time_in_schedule(db):
+    for i, schedule in enumerate(SCHEDULES):
+        crud.create_swimming_pool(db, SwimmingPoolCreate(
+            name=f"수영장 {i}", address="서울", lat=37.5, lng=127.0,
+            source="test", free_swim_schedule=schedule,
+        ))
+
+    for day, time in [("토", "10:30"), ("토", "06:00"), ("토", "12:00"), ("월", "06:30"), ("일", "08:30")]:
+        expected = [
+            pool.id for pool in crud.get_swimming_pools(db, limit=100)
+            if crud.is_time_in_schedule(pool.free_swim_schedule, day, time)
+        ]
+        assert [p.id for p in crud.get_swimming_pools(db, day=day, time=time)] == expected
+        assert [p.id for p in crud.search_nearby_pools(db, 37.5, 127.0, day=day, time=time)] == expected
+
+
+def test_sessions_follow_schedule_updates(db):
+    pool = crud.create_swimming_pool(db, SwimmingPoolCreate(
+        name="수영장", address="서울", source="test", free_swim_schedule=SCHEDULES[0],
+    ))
+    crud.update_swimming_pool(db, pool.id, {"free_swim_schedule": {"월": ["06:00-07:00"]}})
+
+    assert crud.get_swimming_pools(db, day="토") == []
+    assert [p.id for p in crud.get_swimming_pools(db, day="월", time="06:30")] == [pool.id]
@@ -0,0 +1,148 @@
+import random
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+from app.api import pools as pools_api
+from app.api.conditional import conditional_get
+from app.crud import swimming_pool as crud
+from app.schemas.swimming_pool import SwimmingPoolCreate
+from app.services import fulltext
+from app.services.snapshot import PoolSnapshot
+from app.services.spatial_index import spatial_index
+
+
+def _seed(db, count=120):
+    rng = random.Random(3)
+    for i in range(count):
+        price = rng.choice([None, 0, 3000, 3500, 4000, 5000])
+        crud.create_swimming_pool(db, SwimmingPoolCreate(
+            name=rng.choice(["한강", "강남", "마포"]) + f" 수영장 {i}",
+            address="서울특별시",
+            lat=37.45 + rng.random() * 0.25,
+            lng=126.85 + rng.random() * 0.3,
+            pricing={"자유수영": {"성인": {"평일": price}}} if price is not None else None,
+            free_swim_schedule={"토": ["09:00-10:50"]} if i % 3 else {"월": ["12:00-12:50"]},
+            source="test",
+        ))
+
+
+def test_snapshot_matches_crud(db):
+    fulltext.install(db.get_bind())
+    _seed(db)
+    snapshot = PoolSnapshot(db, "v1")
+    filter_sets = [{}, {"min_price": 3500}, {"max_price": 4000, "day": "토"}, {"day": "월", "time": "12:30"}]
+
+    spatial_index.rebuild(db)
+    try:
+        for filters in filter_sets:
+            for sort in (None, "price", "name"):
+                expected = crud.get_swimming_pools(db, limit=25, sort=sort, **filters)
+                assert [p.id for p in snapshot.list_pools(limit=25, sort=sort, **filters)] == [p.id for p in expected]
+
+                after = crud.decode_cursor(crud.encode_cursor(expected[-1], sort), sort)
+                assert [p.id for p in snapshot.list_pools(limit=25, sort=sort, after=after, **filters)] == [
+                    p.id for p in crud.get_swimming_pools(db, limit=25, sort=sort, after=after, **filters)
+                ]
+
+            assert [(p.id, d) for p, d in snapshot.nearby(37.55, 126.98, 6.0, sort="price", **filters)] == [
+                (p.id, p.distance) for p in crud.search_nearby_pools(db, 37.55, 126.98, 6.0, sort="price", **filters)
+            ]
+            assert [(p.id, d) for p, d in snapshot.nearest(37.6, 127.1, 7, **filters)] == [
+                (p.id, p.distance) for p in crud.find_nearest_pools(db, 37.6, 127.1, 7, **filters)
+            ]
+    finally:
+        spatial_index.ready = False
+
+    for q in ("강남 수영장", "마포"):
+        assert [p.id for p in snapshot.search_text(q, 10)] == [p.id for p in crud.search_pools_by_text(db, q, 10)]
+    assert snapshot.get(5).name == crud.get_swimming_pool(db, 5).name
+
+
+def test_in_bounds_matches_crud_and_applies_filters(db):
+    _seed(db)
+    no_schedule = crud.create_swimming_pool(db, SwimmingPoolCreate(
+        name="시간표 없음", address="서울특별시", lat=37.55, lng=127.0, source="test",
+    ))
+    # has_free_swim은 SQL NULL 기준 (ORM은 None을 JSON 'null'로 저장)
+    db.execute(text("UPDATE swimming_pools SET free_swim_schedule = NULL WHERE id = :id"), {"id": no_schedule.id})
+    db.commit()
+    scheduled = set(db.scalars(text("SELECT id FROM swimming_pools WHERE free_swim_schedule IS NOT NULL")))
+    closed = crud.create_swimming_pool(db, SwimmingPoolCreate(
+        name="폐업", address="서울특별시", lat=37.55, lng=127.0, source="test",
+    ))
+    crud.update_swimming_pool(db, closed.id, {"is_active": False})
+    snapshot = PoolSnapshot(db, "v1")
+
+    box = dict(south=37.5, west=126.9, north=37.65, east=127.05)
+    filter_sets = [
+        {}, {"min_price": 3500}, {"max_price": 4000, "day": "토"}, {"day": "월", "time": "12:30"},
+        {"has_free_swim": True}, {"has_free_swim": False},
+    ]
+    for filters in filter_sets:
+        pools = crud.get_pools_in_bounds(db, limit=-1, **box, **filters)
+        assert [p.id for p in snapshot.in_bounds(limit=-1, **box, **filters)] == [p.id for p in pools]
+        assert [p.id for p in pools] == sorted(p.id for p in pools)
+
+        for pool in pools:
+            assert pool.is_active
+            assert box["south"] <= pool.lat <= box["north"] and box["west"] <= pool.lng <= box["east"]
+            price = pool.free_swim_adult_weekday_price
+            if "min_price" in filters:
+                assert price is not None and price >= filters["min_price"]
+            if "max_price" in filters:
+                assert price is not None and price <= filters["max_price"]
+            if "time" in filters:
+                assert crud.is_time_in_schedule(pool.free_swim_schedule, filters["day"], filters["time"])
+            elif "day" in filters:
+                assert filters["day"] in pool.free_swim_schedule
+            if "has_free_swim" in filters:
+                assert (pool.id in scheduled) == filters["has_free_swim"]
+
+        # 상자 안의 활성 수영장 중 필터에 맞는 것은 빠짐없이
+        inside = {
+            p.id for p in crud.get_swimming_pools(db, limit=-1, **filters)
+            if p.is_active and p.lat is not None and box["south"] <= p.lat <= box["north"] and box["west"] <= p.lng <= box["east"]
+        }
+        assert {p.id for p in pools} == inside
+
+        # ID 커서로 이어 받아도 같은 결과
+        after = crud.decode_cursor(crud.encode_cursor(pools[2], None), None) if len(pools) > 3 else None
+        if after is not None:
+            assert [p.id for p in snapshot.in_bounds(limit=5, after=after, **box, **filters)] == [
+                p.id for p in crud.get_pools_in_bounds(db, limit=5, after=after, **box, **filters)
+            ] == [p.id for p in pools[3:8]]
+
+    assert [p.id for p in crud.get_pools_in_bounds(db, limit=-1, has_free_swim=False, **box)] == [no_schedule.id]
+    assert closed.id not in {p.id for p in crud.get_pools_in_bounds(db, limit=-1, **box)}
+    assert crud.get_pools_in_bounds(db, **dict(box, south=38.0, north=38.1)) == []
+
+
+def test_in_bounds_route_pages_with_cursor(db):
+    _seed(db)
+    app = FastAPI()
+    app.include_router(pools_api.router, prefix="/api")
+    app.dependency_overrides[pools_api.get_readonly_db] = lambda: db
+    app.dependency_overrides[conditional_get] = lambda: None
+    client = TestClient(app)
+
+    params = {"south": 37.5, "west": 126.9, "north": 37.65, "east": 127.05, "max_price": 4000,
+              "limit": 7, "fields": "id,lat,lng"}
+    expected = crud.get_pools_in_bounds(db, limit=-1, south=37.5, west=126.9, north=37.65, east=127.05, max_price=4000)
+    assert len(expected) > params["limit"]
+
+    ids, cursor = [], None
+    while True:
+        response = client.get("/api/pools/in-bounds", params={**params, **({"cursor": cursor} if cursor else {})})
+        assert response.status_code == 200
+        page = response.json()
+        assert all(set(item) == {"id", "lat", "lng"} for item in page)
+        ids += [item["id"] for item in page]
+        cursor = response.headers.get("x-next-cursor")
+        if cursor is None:
+            break
+    assert ids == [p.id for p in expected]
+
+    assert client.get("/api/pools/in-bounds", params={**params, "south": 37.7}).status_code == 400
+    assert client.get("/api/pools/in-bounds", params={**params, "cursor": "xx"}).status_code == 400
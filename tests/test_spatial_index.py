@@ -0,0 +1,114 @@
+import random
+
+from app.crud import swimming_pool as crud
+from app.schemas.swimming_pool import SwimmingPoolCreate
+from app.services.spatial_index import SpatialIndex, spatial_index
+
+
+def _seed(db, count=300):
+    rng = random.Random(42)
+    for i in range(count):
+        crud.create_swimming_pool(db, SwimmingPoolCreate(
+            name=f"수영장 {i}",
+            address="서울특별시",
+            lat=37.45 + rng.random() * 0.25,
+            lng=126.85 + rng.random() * 0.3,
+            source="test",
+        ))
+
+
+def test_query_bbox_matches_brute_force():
+    rng = random.Random(7)
+    index = SpatialIndex(cell_deg=0.01)
+    points = {}
+    for pool_id in range(1, 500):
+        points[pool_id] = (37 + rng.random(), 126.5 + rng.random())
+        index._points[pool_id] = points[pool_id]
+        index._cells.setdefault(index._cell_of(*points[pool_id]), {})[pool_id] = points[pool_id]
+
+    bbox = (37.2, 37.55, 126.7, 127.1)
+    expected = {
+        pool_id for pool_id, (lat, lng) in points.items()
+        if bbox[0] <= lat <= bbox[1] and bbox[2] <= lng <= bbox[3]
+    }
+    assert {pool_id for pool_id, _, _ in index.query_bbox(*bbox)} == expected
+
+
+def test_search_nearby_identical_with_and_without_index(db):
+    _seed(db)
+    origins = [(37.5665, 126.978, 5.0), (37.5, 127.05, 1.5), (37.6, 126.9, 20.0)]
+
+    spatial_index.ready = False
+    without_index = [
+        [(p.id, p.distance) for p in crud.search_nearby_pools(db, lat, lng, radius)]
+        for lat, lng, radius in origins
+    ]
+
+    spatial_index.rebuild(db)
+    try:
+        with_index = [
+            [(p.id, p.distance) for p in crud.search_nearby_pools(db, lat, lng, radius)]
+            for lat, lng, radius in origins
+        ]
+    finally:
+        spatial_index.ready = False
+
+    assert with_index == without_index
+    assert any(with_index)
+
+
+def test_find_nearest_matches_brute_force(db):
+    _seed(db)
+    origins = [(37.5665, 126.978), (37.3, 126.5), (35.1, 129.0)]
+
+    spatial_index.ready = False
+    brute = [[(p.id, p.distance) for p in crud.find_nearest_pools(db, lat, lng, k=15)] for lat, lng in origins]
+
+    spatial_index.rebuild(db)
+    try:
+        rings = [[(p.id, p.distance) for p in crud.find_nearest_pools(db, lat, lng, k=15)] for lat, lng in origins]
+    finally:
+        spatial_index.ready = False
+
+    assert rings == brute
+    assert all(len(result) == 15 for result in rings)
+    for result in rings:
+        assert [d for _, d in result] == sorted(d for _, d in result)
+
+
+def test_search_nearby_batch_matches_single_searches(db):
+    from app.schemas.swimming_pool import NearbyBatchOrigin
+
+    _seed(db)
+    origins = [
+        NearbyBatchOrigin(lat=37.5665, lng=126.978, radius_km=5.0),
+        NearbyBatchOrigin(lat=37.5, lng=127.05, radius_km=1.5),
+        NearbyBatchOrigin(lat=37.6, lng=126.9, radius_km=20.0, max_price=0),
+    ]
+
+    spatial_index.rebuild(db)
+    try:
+        batch = crud.search_nearby_batch(db, origins)
+        single = [
+            crud.search_nearby_pools(db, o.lat, o.lng, o.radius_km, max_price=o.max_price)
+            for o in origins
+        ]
+    finally:
+        spatial_index.ready = False
+
+    assert [[(p.id, d) for p, d in result] for result in batch] == [
+        [(p.id, p.distance) for p in result] for result in single
+    ]
+    assert batch[0] and not batch[2]
+
+
+def test_nearby_price_sort_keeps_free_pools_first(db):
+    for name, price in [("무료", 0), ("비싼", 3000), ("미정1", None), ("저렴", 2000), ("미정2", None)]:
+        crud.create_swimming_pool(db, SwimmingPoolCreate(
+            name=name, address="서울특별시", lat=37.5, lng=127.0, source="test",
+            pricing={"자유수영": {"성인": {"평일": price}}} if price is not None else None,
+        ))
+
+    expected = ["무료", "저렴", "비싼", "미정1", "미정2"]
+    assert [p.name for p in crud.search_nearby_pools(db, 37.5, 127.0, 1.0, sort="price")] == expected
+    assert [p.name for p in crud.get_swimming_pools(db, sort="price")] == expected
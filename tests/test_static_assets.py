@@ -0,0 +1,23 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.static_assets import IMMUTABLE, REVALIDATE, StaticAssets, cache_control_for
+
+
+def test_cache_control_by_file_name(tmp_path):
+    assert cache_control_for("css/styles.1a2b3c4d.css") == IMMUTABLE
+    assert cache_control_for("css/styles.css") == REVALIDATE
+    assert cache_control_for("data/subway_lines.json") == REVALIDATE
+
+    (tmp_path / "app.js").write_text("1")
+    (tmp_path / "app.0123abcd.js").write_text("1")
+    app = FastAPI()
+    app.mount("/js", StaticAssets(directory=tmp_path), name="js")
+    client = TestClient(app)
+
+    hashed = client.get("/js/app.0123abcd.js")
+    assert hashed.headers["cache-control"] == IMMUTABLE
+    assert client.get("/js/app.js").headers["cache-control"] == REVALIDATE
+    not_modified = client.get("/js/app.0123abcd.js", headers={"If-None-Match": hashed.headers["etag"]})
+    assert not_modified.status_code == 304
+    assert not_modified.headers["cache-control"] == IMMUTABLE
@@ -0,0 +1,39 @@
+import random
+
+from app.crud import swimming_pool as crud
+from app.schemas.swimming_pool import SwimmingPoolCreate
+from app.services.distance import haversine_many
+from app.services.stations import STATION_RADIUS_M, StationJoin, load_stations
+
+
+def test_rows_for_matches_brute_force():
+    stations = load_stations()
+    join = StationJoin(stations)
+    rng = random.Random(3)
+
+    for _ in range(200):
+        lat, lng = 37.3 + rng.random() * 0.5, 126.7 + rng.random() * 0.5
+        dists = haversine_many(lat, lng, [s.lat for s in stations], [s.lng for s in stations]) * 1000
+        ranked = sorted((d, s.line, s.name) for d, s in zip(dists.tolist(), stations))
+        expected = [(name, line) for d, line, name in ranked if d <= STATION_RADIUS_M] or [ranked[0][2:0:-1]]
+
+        assert [(row["station"], row["line"]) for row in join.rows_for(lat, lng)] == expected
+
+
+def test_station_filters_and_nearest_station(db):
+    # 강남역 바로 옆, 역에서 먼 곳 (강화도)
+    near = crud.create_swimming_pool(db, SwimmingPoolCreate(
+        name="강남 수영장", address="서울특별시", lat=37.4981, lng=127.0277, source="test",
+    ))
+    far = crud.create_swimming_pool(db, SwimmingPoolCreate(
+        name="강화 수영장", address="인천광역시", lat=37.7467, lng=126.4880, source="test",
+    ))
+
+    assert near.nearest_station["line"] == "2" and near.nearest_station["distance_m"] < 100
+    assert far.nearest_station["distance_m"] > STATION_RADIUS_M
+
+    ids = lambda **kw: [p.id for p in crud.get_swimming_pools(db, **kw)]
+    assert ids(near_line="2", max_station_m=500) == [near.id]
+    assert ids(near_line="2호선") == [near.id]
+    assert ids(near_line="1", max_station_m=500) == []
+    assert ids(max_station_m=STATION_RADIUS_M) == [near.id]